@@ -0,0 +1,126 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from fastapi import HTTPException, status
+
+from app.auth.auth import pwd_context
+
+# 해싱 워커 설정
+# bcrypt가 모든 코어를 점유하지 않도록 기본값은 CPU 수의 절반
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", max(1, (os.cpu_count() or 2) // 2)))
+# 워커를 기다릴 수 있는 최대 요청 수 (초과 시 503)
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", PASSWORD_HASH_WORKERS * 16))
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasherPool:
+    """
+    bcrypt 해싱/검증을 별도 프로세스 풀에서 실행하는 awaitable 인터페이스
+
+    - 동시에 실행되는 해싱 작업은 워커 수로 제한된다.
+    - 워커를 기다리는 요청은 queue_size까지만 허용하고 초과 시 503을 반환한다.
+    - 대기 시간(큐에서 워커를 기다린 시간)을 집계한다.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, queue_size: int = PASSWORD_HASH_QUEUE_SIZE):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+
+        # 메트릭
+        self.started = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 이벤트 루프/DB 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        return self._slots
+
+    async def _run(self, fn, *args):
+        if self._pending >= self.workers + self.queue_size:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry",
+            )
+
+        self._pending += 1
+        enqueued_at = time.perf_counter()
+        try:
+            async with self._get_slots():
+                wait = time.perf_counter() - enqueued_at
+                self.started += 1
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_executor(), fn, *args)
+                self.completed += 1
+                return result
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """
+        비밀번호를 해시화
+        """
+        return await self._run(_hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        평문 비밀번호와 해시된 비밀번호를 비교
+        """
+        return await self._run(_verify_password, plain_password, hashed_password)
+
+    def metrics(self) -> dict:
+        """
+        풀 상태 및 큐 대기 시간 메트릭
+        """
+        in_flight = min(self._pending, self.workers)
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": in_flight,
+            "queued": self._pending - in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": (self.total_wait_seconds / self.started * 1000) if self.started else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+    def shutdown(self):
+        """
+        워커 프로세스 종료
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._slots = None
+
+
+# 전역 해싱 풀 인스턴스
+password_hasher = PasswordHasherPool()
@@ -0,0 +1,191 @@
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from app.models.models import User
+from app.dto.dto import ROLE
+
+# 캐시 설정
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+
+class UserSnapshot:
+    """
+    요청 컨텍스트에서 current_user로 사용하는 가벼운 사용자 정보
+
+    세션에 묶이지 않으므로 요청 간에 공유해도 안전하다.
+    GraphQL User 타입이 요구하는 필드를 모두 가진다.
+    """
+
+    __slots__ = ("id", "email", "name", "avatar", "role", "created_at", "updated_at")
+
+    def __init__(self, id: str, email: str, name: str, avatar: Optional[str], role,
+                 created_at: datetime, updated_at: datetime):
+        self.id = id
+        self.email = email
+        self.name = name
+        self.avatar = avatar
+        self.role = role
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            avatar=user.avatar,
+            role=ROLE[user.role],
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class _Entry:
+    __slots__ = ("token", "snapshot", "expires_at")
+
+    def __init__(self, token: str, snapshot: UserSnapshot, expires_at: float):
+        self.token = token
+        self.snapshot = snapshot
+        self.expires_at = expires_at
+
+
+class TokenUserCache:
+    """
+    토큰 서명 → 사용자 스냅샷 LRU/TTL 캐시
+
+    - 항목은 TTL과 토큰 만료 시각 중 이른 시점에 만료된다.
+    - 크기가 max_size를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+    - 사용자 정보가 바뀌면 invalidate_user로 해당 사용자의 모든 토큰 항목을 제거한다.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE, ttl_seconds: float = TOKEN_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        # JWT의 서명 부분을 키로 사용
+        return token.rsplit(".", 1)[-1]
+
+    def get(self, token: str) -> Optional[UserSnapshot]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None or entry.token != token:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.time():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.snapshot
+
+    def set(self, token: str, snapshot: UserSnapshot, token_expires_at: Optional[float] = None):
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        key = self._key(token)
+        self._remove(key)
+        self._entries[key] = _Entry(token, snapshot, expires_at)
+        self._keys_by_user.setdefault(snapshot.id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def invalidate_user(self, user_id: str):
+        """
+        사용자의 모든 캐시 항목 제거 (프로필 변경 시)
+        """
+        for key in list(self._keys_by_user.get(user_id, ())):
+            self._remove(key)
+
+    def metrics(self) -> dict:
+        """
+        캐시 크기 및 적중률
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_user.get(entry.snapshot.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry.snapshot.id]
+
+
+# 전역 토큰 캐시 인스턴스
+token_user_cache = TokenUserCache()
+
+
+async def resolve_current_user(db, authorization: Optional[str]) -> Optional[UserSnapshot]:
+    """
+    Authorization 값("Bearer <token>")에서 현재 사용자 스냅샷 반환
+
+    캐시 적중 시 JWT 검증과 사용자 조회를 생략한다.
+    """
+    if not authorization:
+        return None
+
+    try:
+        from app.auth.auth import AuthService
+
+        # Bearer 토큰 추출
+        scheme, token = authorization.split()
+        if scheme.lower() != "bearer":
+            return None
+
+        current_user = token_user_cache.get(token)
+        if current_user is not None:
+            return current_user
+
+        # 토큰 검증
+        payload = AuthService.verify_token(token)
+        if not payload:
+            return None
+
+        user_id = payload.get("sub")
+        if not user_id:
+            return None
+
+        user = await db.get(User, user_id)
+        if not user:
+            return None
+
+        current_user = UserSnapshot.from_user(user)
+        token_user_cache.set(token, current_user, payload.get("exp"))
+        return current_user
+    except Exception as e:
+        print(f"토큰 검증 실패: {e}")
+        return None
\ No newline at end of file
@@ -0,0 +1,233 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from graphql import ExecutionResult as GraphQLExecutionResult, OperationType, get_operation_ast
+from strawberry.extensions import SchemaExtension
+
+# 캐시 설정
+# memory: 프로세스 내 LRU / redis: 프로세스 내 LRU + Redis 공유 계층
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+RESPONSE_CACHE_REDIS_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_REDIS_TTL_SECONDS", "300"))
+# 프로세스 내 LRU 항목 유효 시간 (memory 백엔드에서 다른 워커의 버전 증가를 놓쳐도 이 시간까지만 오래된 응답을 제공)
+RESPONSE_CACHE_LOCAL_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_LOCAL_TTL_SECONDS", "10"))
+# 워커 프로세스 수 (uvicorn/gunicorn 이 설정하는 WEB_CONCURRENCY)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_KEY_PREFIX = "taskflow:"
+
+# 캐시 가능한 루트 필드 (모두 프로젝트 버전으로 무효화되는 읽기 쿼리)
+CACHEABLE_ROOT_FIELDS = {"projects", "project", "task", "tasks", "__typename"}
+
+
+class ResponseLRU:
+    """
+    응답 크기(바이트) 합계로 제한되는 LRU (항목마다 ttl_seconds 후 만료)
+    """
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+                 ttl_seconds: float = RESPONSE_CACHE_LOCAL_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.total_bytes = 0
+        # 키 → (응답, 크기, 만료 시각)
+        self._items: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[str]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if self.ttl_seconds > 0 and item[2] <= time.monotonic():
+            del self._items[key]
+            self.total_bytes -= item[1]
+            self.expirations += 1
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def set(self, key: str, payload: str):
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+
+        self._items[key] = (payload, size, time.monotonic() + self.ttl_seconds)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._items.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._items)
+
+
+class ResponseCache:
+    """
+    (쿼리, 변수, 권한 집합, 프로젝트 버전) 키 응답 캐시
+
+    - 프로젝트 버전은 해당 프로젝트를 변경하는 뮤테이션이 커밋된 뒤 올린다.
+      버전이 바뀌면 키가 달라지므로 이전 응답은 더 이상 조회되지 않고 LRU에서 밀려난다.
+    - redis 백엔드에서는 버전과 응답을 Redis에도 저장하여 워커 간에 공유한다.
+    - memory 백엔드의 버전은 프로세스마다 따로이므로, 다른 워커에서 올린 버전은 보이지 않는다.
+      프로세스 내 항목은 RESPONSE_CACHE_LOCAL_TTL_SECONDS 후 만료되어 오래된 응답의 제공 시간을 제한하며,
+      워커가 여러 개면 시작 시 경고한다 (다중 워커 배포에는 redis 백엔드 사용).
+    """
+
+    def __init__(self, backend: str = RESPONSE_CACHE_BACKEND):
+        self.local = ResponseLRU()
+        self._versions: Dict[str, int] = {}
+        self._redis = None
+        if backend == "redis":
+            import redis.asyncio as redis
+            self._redis = redis.from_url(REDIS_URL)
+        elif WEB_CONCURRENCY > 1:
+            print(f"⚠️  응답 캐시 memory 백엔드를 워커 {WEB_CONCURRENCY}개에서 사용 중: "
+                  f"다른 워커의 변경이 최대 {RESPONSE_CACHE_LOCAL_TTL_SECONDS:g}초 늦게 반영됩니다. "
+                  f"RESPONSE_CACHE_BACKEND=redis 를 사용하세요.")
+
+        # 메트릭
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.bypassed = 0
+
+    async def get_versions(self, project_ids: List[str]) -> List[int]:
+        if self._redis is not None and project_ids:
+            values = await self._redis.mget([f"{REDIS_KEY_PREFIX}pv:{pid}" for pid in project_ids])
+            return [int(value or 0) for value in values]
+        return [self._versions.get(pid, 0) for pid in project_ids]
+
+    async def bump(self, project_ids: Iterable[str]):
+        """
+        프로젝트 버전 증가 (해당 프로젝트가 포함된 캐시 응답 무효화)
+        """
+        for project_id in set(project_ids):
+            if self._redis is not None:
+                await self._redis.incr(f"{REDIS_KEY_PREFIX}pv:{project_id}")
+            else:
+                self._versions[project_id] = self._versions.get(project_id, 0) + 1
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        payload = self.local.get(key)
+        if payload is None and self._redis is not None:
+            payload = await self._redis.get(f"{REDIS_KEY_PREFIX}resp:{key}")
+            if payload is not None:
+                payload = payload.decode() if isinstance(payload, bytes) else payload
+                self.local.set(key, payload)
+                self.redis_hits += 1
+
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(payload)
+
+    async def set(self, key: str, data: Dict[str, Any]):
+        payload = json.dumps(data, separators=(",", ":"))
+        self.local.set(key, payload)
+        if self._redis is not None:
+            await self._redis.set(f"{REDIS_KEY_PREFIX}resp:{key}", payload, ex=RESPONSE_CACHE_REDIS_TTL_SECONDS)
+        self.stores += 1
+
+    def metrics(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis" if self._redis is not None else "memory",
+            "entries": len(self.local),
+            "bytes": self.local.total_bytes,
+            "max_bytes": self.local.max_bytes,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.local.evictions,
+            "expirations": self.local.expirations,
+            "ttl_seconds": self.local.ttl_seconds,
+            "bypassed": self.bypassed,
+        }
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = ResponseCache()
+
+
+def _is_cacheable(execution_context) -> bool:
+    """
+    루트 필드가 모두 캐시 가능한 읽기 쿼리인지 확인
+    """
+    document = execution_context.graphql_document
+    if document is None:
+        return False
+
+    operation = get_operation_ast(document, execution_context.operation_name)
+    if operation is None or operation.operation != OperationType.QUERY:
+        return False
+
+    for selection in operation.selection_set.selections:
+        name = getattr(selection, "name", None)
+        if name is None or name.value not in CACHEABLE_ROOT_FIELDS:
+            return False
+    return True
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """
+    읽기 쿼리 응답 캐시
+
+    키: (쿼리 문자열, 작업 이름, 변수, 사용자의 프로젝트 멤버십/역할, 각 프로젝트 버전)
+    같은 권한 집합을 가진 사용자끼리는 응답을 공유한다.
+    오류가 없는 응답만 저장한다.
+    """
+
+    async def on_execute(self):
+        execution_context = self.execution_context
+        context = execution_context.context
+        current_user = context.get("current_user") if isinstance(context, dict) else None
+
+        key = None
+        # 앞선 확장(비용 분석 등)이 이미 결과를 정한 작업은 캐시하지 않음
+        if current_user is not None and execution_context.result is None and _is_cacheable(execution_context):
+            memberships = await context["project_service"].get_user_memberships(current_user.id)
+            project_ids = sorted(memberships)
+            versions = await response_cache.get_versions(project_ids)
+            raw_key = json.dumps(
+                [
+                    execution_context.query,
+                    execution_context.operation_name,
+                    execution_context.variables,
+                    [[pid, memberships[pid], version] for pid, version in zip(project_ids, versions)],
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            key = hashlib.sha256(raw_key.encode()).hexdigest()
+
+            data = await response_cache.get(key)
+            if data is not None:
+                execution_context.result = GraphQLExecutionResult(data=data, errors=None)
+        else:
+            response_cache.bypassed += 1
+
+        yield
+
+        result = execution_context.result
+        if key is not None and result is not None and not result.errors and result.data is not None:
+            if data is None:
+                await response_cache.set(key, result.data)
\ No newline at end of file
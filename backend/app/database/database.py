@@ -1,20 +1,225 @@
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import create_engine, event, exc
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
+import asyncio
 import os
+import time
 
 # 데이터베이스 URL
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./taskflow.db")
 
+
+def to_async_url(url: str) -> str:
+    """
+    동기 DB URL을 비동기 드라이버 URL로 변환 (sqlite → aiosqlite, postgresql → asyncpg)
+    """
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:"):
+        return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    if url.startswith("postgres:"):
+        return url.replace("postgres:", "postgresql+asyncpg:", 1)
+    return url
+
+
+# 비동기 DB URL (명시하지 않으면 DATABASE_URL에서 변환)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+# 비동기 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# 이 시간 이상 걸린 SQL은 느린 쿼리로 로그에 남김 (0이면 로그 끔)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
 # SQLAlchemy 엔진 생성
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
 )
 
-# 세션 팩토리 생성
+# 세션 팩토리 생성 (스크립트/테이블 생성용)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+
+class SerializedAsyncSession(AsyncSession):
+    """
+    한 요청 안에서 동시에 실행되는 리졸버/DataLoader가 세션을 공유할 수 있도록
+    세션 작업을 순서대로 실행하는 AsyncSession
+
+    AsyncSession은 동시 작업을 허용하지 않으므로 루트 필드나 로더가
+    병렬로 await 되어도 하나씩 실행되도록 잠금으로 보호한다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = asyncio.Lock()
+
+    async def execute(self, *args, **kwargs):
+        async with self._lock:
+            return await super().execute(*args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        async with self._lock:
+            return await super().scalar(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        async with self._lock:
+            return await super().get(*args, **kwargs)
+
+    async def merge(self, *args, **kwargs):
+        async with self._lock:
+            return await super().merge(*args, **kwargs)
+
+    async def refresh(self, *args, **kwargs):
+        async with self._lock:
+            return await super().refresh(*args, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        async with self._lock:
+            return await super().delete(*args, **kwargs)
+
+    async def flush(self, *args, **kwargs):
+        async with self._lock:
+            return await super().flush(*args, **kwargs)
+
+    async def commit(self):
+        async with self._lock:
+            return await super().commit()
+
+    async def rollback(self):
+        async with self._lock:
+            return await super().rollback()
+
+    async def close(self):
+        async with self._lock:
+            return await super().close()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션 획득 대기 시간과 타임아웃 횟수를 집계하는 커넥션 풀
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - started
+            self.checkouts += 1
+            self.total_wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+
+def _async_engine_options(url: str) -> dict:
+    """
+    비동기 엔진 풀 옵션 (인메모리 SQLite는 단일 커넥션을 공유해야 하므로 기본 풀 사용)
+    """
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":")):
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+# 비동기 엔진 생성 (GraphQL API용)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_engine_options(ASYNC_DATABASE_URL))
+
+class QueryStats:
+    """
+    GraphQL 작업 하나가 실행한 SQL 집계 (실행 수, DB 시간, 가장 느린 문장)
+    """
+
+    __slots__ = ("operation", "count", "seconds", "slowest_seconds", "slowest_statement")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+
+# 현재 작업의 SQL 집계 (작업 밖에서 실행된 SQL은 전체 합계에만 반영)
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+# 프로세스 전체 SQL 합계
+sql_totals = {"queries": 0, "seconds": 0.0, "slow_queries": 0}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    sql_totals["queries"] += 1
+    sql_totals["seconds"] += elapsed
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        if elapsed > stats.slowest_seconds:
+            stats.slowest_seconds = elapsed
+            stats.slowest_statement = statement
+
+    if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS:
+        sql_totals["slow_queries"] += 1
+        operation = stats.operation if stats is not None else "-"
+        print(f"🐢 느린 쿼리 {elapsed * 1000:.1f}ms [{operation}]: {' '.join(statement.split())[:500]}")
+
+
+def _handle_error(exception_context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(sync_engine):
+    """
+    엔진에 SQL 실행 시간/횟수 집계 이벤트 등록
+    """
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+instrument_engine(async_engine.sync_engine)
+
+# 비동기 세션 팩토리 생성
+# 커밋 후 속성 접근이 암묵적 I/O를 일으키지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=SerializedAsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base 클래스
 Base = declarative_base()
 
@@ -30,12 +235,62 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션을 생성하고 반환하는 의존성 함수
+
+    예외가 발생하면 롤백하고, 요청이 끝나면 세션을 닫아 커넥션을 풀에 반환한다.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+
+def get_pool_status() -> dict:
+    """
+    비동기 커넥션 풀 상태 (체크아웃된 커넥션, 오버플로, 획득 대기 시간)
+    """
+    pool = async_engine.pool
+    if not isinstance(pool, TimedQueuePool):
+        return {"pool": type(pool).__name__}
+
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "timeout_seconds": pool.timeout(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": pool.checkouts,
+        "timeouts": pool.timeouts,
+        "avg_wait_ms": (pool.total_wait_seconds / pool.checkouts * 1000) if pool.checkouts else 0.0,
+        "max_wait_ms": pool.max_wait_seconds * 1000,
+    }
+
+
 def create_tables():
     """
     모든 테이블을 생성하는 함수
     """
     from app.models.models import Base
     Base.metadata.create_all(bind=engine)
+    
+    # 기존 테이블에 새로 선언된 인덱스 추가 (create_all은 기존 테이블을 건너뜀)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
+    # 태스크 전문 검색 인덱스 (SQLite FTS5)
+    from app.services.search_service import create_search_index
+    create_search_index(engine)
+    
+    # 델타 동기화 변경 로그 (기존 데이터가 있는 DB에 처음 생긴 경우 채움)
+    from app.services.sync_service import ensure_change_log
+    ensure_change_log(engine)
 
 
 def drop_tables():
@@ -43,4 +298,6 @@ def drop_tables():
     모든 테이블을 삭제하는 함수 (개발용)
     """
     from app.models.models import Base
+    from app.services.search_service import drop_search_index
+    drop_search_index(engine)
     Base.metadata.drop_all(bind=engine)
\ No newline at end of file
@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy import Column
+
+from app.models import models
+from app.schemas import types
+
+
+def _enum_mapping(model_enum, graphql_enum) -> Dict[Any, Any]:
+    """
+    모델 Enum / 문자열 값 / GraphQL Enum → GraphQL Enum 매핑
+    """
+    mapping = {}
+    for member in model_enum:
+        graphql_member = graphql_enum(member.value)
+        mapping[member] = graphql_member
+        mapping[member.value] = graphql_member
+        mapping[graphql_member] = graphql_member
+    return mapping
+
+
+# 읽기 경로 전체에서 공유하는 Enum 매핑 (행마다 Enum 생성자 호출 없이 dict 조회)
+TASK_STATUS = _enum_mapping(models.TaskStatus, types.TaskStatus)
+PRIORITY = _enum_mapping(models.Priority, types.Priority)
+ROLE = _enum_mapping(models.Role, types.Role)
+
+
+class RowDTO:
+    """
+    Core 조회 행을 담는 읽기 전용 객체 (ORM 세션/identity map과 무관)
+
+    __slots__ 순서가 곧 조회 컬럼 순서이며, ENUM_FIELDS 의 값은 공용 매핑으로 변환한다.
+    strawberry 타입은 속성 이름으로 값을 읽으므로 ORM 객체 대신 그대로 반환할 수 있다.
+
+    fields로 일부 컬럼만 조회한 DTO는 조회하지 않은 속성이 비어 있으므로
+    선택 집합에서 계산한 컬럼(projection.selected_columns)으로만 사용한다.
+    """
+
+    __slots__ = ()
+    MODEL = None
+    ENUM_FIELDS: Dict[str, Dict[Any, Any]] = {}
+    # 부분 조회에서도 항상 포함하는 컬럼 (키, 커서)
+    REQUIRED_COLUMNS: Sequence[str] = ("id",)
+    # GraphQL 관계 필드 → 로더 키 컬럼
+    RELATION_COLUMNS: Dict[str, str] = {}
+
+    @classmethod
+    def columns(cls, fields: Optional[Sequence[str]] = None) -> List[Column]:
+        table = cls.MODEL.__table__
+        return [table.c[name] for name in (fields or cls.__slots__)]
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any], fields: Optional[Sequence[str]] = None) -> "RowDTO":
+        obj = object.__new__(cls)
+        for name, value in zip(fields or cls.__slots__, row):
+            mapping = cls.ENUM_FIELDS.get(name)
+            if mapping is not None and value is not None:
+                value = mapping[value]
+            object.__setattr__(obj, name, value)
+        return obj
+
+    @classmethod
+    def from_rows(cls, rows, fields: Optional[Sequence[str]] = None) -> List["RowDTO"]:
+        return [cls.from_row(row, fields) for row in rows]
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "RowDTO":
+        """
+        ORM 객체의 현재 값으로 생성 (원본 객체는 변경하지 않음)
+        """
+        return cls.from_row([getattr(obj, name) for name in cls.__slots__])
+
+
+class TaskDTO(RowDTO):
+    __slots__ = ("id", "title", "description", "status", "priority", "assignee_id", "project_id",
+                 "due_date", "completed_at", "created_at", "updated_at")
+    MODEL = models.Task
+    ENUM_FIELDS = {"status": TASK_STATUS, "priority": PRIORITY}
+    REQUIRED_COLUMNS = ("id", "project_id", "created_at")
+    RELATION_COLUMNS = {"assignee": "assignee_id", "project": "project_id"}
+
+
+class UserDTO(RowDTO):
+    __slots__ = ("id", "email", "name", "avatar", "role", "created_at", "updated_at")
+    MODEL = models.User
+    ENUM_FIELDS = {"role": ROLE}
+
+
+class ProjectDTO(RowDTO):
+    __slots__ = ("id", "name", "description", "created_at", "updated_at")
+    MODEL = models.Project
+
+
+class CommentDTO(RowDTO):
+    __slots__ = ("id", "content", "author_id", "task_id", "created_at", "updated_at")
+    MODEL = models.Comment
+    REQUIRED_COLUMNS = ("id", "created_at")
+    RELATION_COLUMNS = {"author": "author_id", "task": "task_id"}
+
+
+class ActivityDTO(RowDTO):
+    __slots__ = ("id", "action", "description", "user_id", "task_id", "project_id", "created_at")
+    MODEL = models.Activity
+    REQUIRED_COLUMNS = ("id", "created_at")
+    RELATION_COLUMNS = {"user": "user_id", "task": "task_id", "project": "project_id"}
+
+
+class NotificationDTO(RowDTO):
+    __slots__ = ("id", "title", "message", "user_id", "is_read", "created_at")
+    MODEL = models.Notification
+    REQUIRED_COLUMNS = ("id", "created_at")
+    RELATION_COLUMNS = {"user": "user_id"}
+
+
+# 모델 → DTO 클래스
+DTO_BY_MODEL: Dict[Any, Type[RowDTO]] = {
+    dto.MODEL: dto for dto in (TaskDTO, UserDTO, ProjectDTO, CommentDTO, ActivityDTO, NotificationDTO)
+}
+
+
+def to_dto(obj: Optional[Any]) -> Optional[Any]:
+    """
+    ORM 객체를 대응하는 DTO로 변환 (DTO가 없는 모델은 그대로 반환)
+    """
+    if obj is None:
+        return None
+    dto = DTO_BY_MODEL.get(type(obj))
+    return dto.from_model(obj) if dto is not None else obj
\ No newline at end of file
@@ -0,0 +1,61 @@
+import re
+from typing import Iterable, List, Optional, Sequence, Set, Type
+
+from strawberry.types.nodes import SelectedField
+
+from app.dto.dto import RowDTO
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _to_snake(name: str) -> str:
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
+
+
+def _field_names(selections: Iterable, path: Sequence[str]) -> Optional[Set[str]]:
+    """
+    path를 따라 내려간 위치에서 선택된 필드 이름들 (프래그먼트 포함)
+
+    path 중간의 필드가 선택되지 않았으면 None
+    """
+    names: Optional[Set[str]] = None
+    for selection in selections:
+        if not isinstance(selection, SelectedField):
+            # FragmentSpread / InlineFragment 는 같은 위치의 선택으로 합침
+            nested = _field_names(selection.selections, path)
+        elif path:
+            if selection.name != path[0]:
+                continue
+            nested = _field_names(selection.selections, path[1:])
+        else:
+            nested = {selection.name}
+        if nested is not None:
+            names = (names or set()) | nested
+    return names
+
+
+def selected_columns(info, dto: Type[RowDTO], path: Sequence[str] = ()) -> List[str]:
+    """
+    GraphQL 선택 집합에서 DTO가 조회해야 할 컬럼 목록 계산
+
+    - 스칼라 필드는 같은 이름(snake_case)의 컬럼으로 매핑
+    - 관계 필드(assignee, project 등)는 로더 키 컬럼(RELATION_COLUMNS)만 조회
+    - REQUIRED_COLUMNS(id, 커서용 created_at 등)는 항상 포함
+      (pageInfo만 선택한 커넥션처럼 path 아래 선택이 없으면 이 컬럼만 조회)
+    """
+    # 현재 필드(별칭으로 여러 번 선택될 수 있음)의 하위 선택부터 시작
+    selections = [selection for field in info.selected_fields for selection in field.selections]
+    names = _field_names(selections, path) or set()
+
+    columns = set(dto.REQUIRED_COLUMNS)
+    for name in names:
+        relation_column = dto.RELATION_COLUMNS.get(name)
+        if relation_column is not None:
+            columns.add(relation_column)
+            continue
+        column = _to_snake(name)
+        if column in dto.__slots__:
+            columns.add(column)
+
+    # 조회 컬럼 순서는 DTO 정의 순서를 따른다
+    return [name for name in dto.__slots__ if name in columns]
\ No newline at end of file
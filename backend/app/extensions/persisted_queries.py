@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
+from strawberry.fastapi.handlers import GraphQLTransportWSHandler, GraphQLWSHandler
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+
+# 캐시 설정
+PERSISTED_QUERY_CACHE_SIZE = int(os.getenv("PERSISTED_QUERY_CACHE_SIZE", "1000"))
+DOCUMENT_CACHE_SIZE = int(os.getenv("DOCUMENT_CACHE_SIZE", "512"))
+
+
+class LRUCache:
+    """
+    크기가 제한된 LRU 캐시 (적중/미스 집계 포함)
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[Any, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[Any]:
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        if self.max_size <= 0:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def peek(self, key) -> Optional[Any]:
+        """
+        적중/미스 집계와 LRU 순서 갱신 없이 조회
+        """
+        return self._items.get(key)
+
+    def clear(self):
+        self._items.clear()
+
+    def metrics(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+# sha256 해시 → 쿼리 문자열
+persisted_queries = LRUCache(PERSISTED_QUERY_CACHE_SIZE)
+# 쿼리 문자열 → (파싱된 문서, 검증 통과 여부)
+parsed_documents = LRUCache(DOCUMENT_CACHE_SIZE)
+
+
+class PersistedQueryNotFound(Exception):
+    pass
+
+
+class SubscriptionContextMixin:
+    """
+    구독마다 연결 컨텍스트의 얕은 복사본을 사용
+
+    웹소켓 연결의 컨텍스트는 연결당 하나이므로, 구독이 이벤트마다 바꾸는 값(loaders 등)이
+    같은 연결의 다른 구독에 보이지 않도록 구독 시작 시 복사한다.
+    """
+
+    async def get_context(self):
+        context = await super().get_context()
+        return dict(context) if isinstance(context, dict) else context
+
+
+class SubscriptionTransportWSHandler(SubscriptionContextMixin, GraphQLTransportWSHandler):
+    pass
+
+
+class SubscriptionWSHandler(SubscriptionContextMixin, GraphQLWSHandler):
+    pass
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """
+    자동 persisted query(APQ)를 지원하는 GraphQL 라우터
+
+    - 클라이언트는 extensions.persistedQuery.sha256Hash 만 보낼 수 있다.
+    - 서버에 없는 해시면 PersistedQueryNotFound 오류를 반환하고,
+      클라이언트가 쿼리 전문과 해시를 함께 다시 보내면 등록한다.
+    - 웹소켓 구독은 구독별 컨텍스트 복사본으로 실행한다.
+    """
+
+    graphql_transport_ws_handler_class = SubscriptionTransportWSHandler
+    graphql_ws_handler_class = SubscriptionWSHandler
+
+    def should_render_graphql_ide(self, request) -> bool:
+        # 해시만 보낸 GET 요청은 GraphiQL이 아니라 쿼리 실행으로 처리
+        return super().should_render_graphql_ide(request) and request.query_params.get("extensions") is None
+
+    async def parse_http_body(self, request) -> GraphQLRequestData:
+        content_type = request.content_type or ""
+        if "application/json" in content_type:
+            data = self.parse_json(await request.get_body())
+        elif request.method == "GET":
+            data = self.parse_query_params(request.query_params)
+        else:
+            return await super().parse_http_body(request)
+
+        query = data.get("query")
+        extensions = data.get("extensions")
+        if isinstance(extensions, (str, bytes)):
+            extensions = json.loads(extensions)
+
+        persisted_query = (extensions or {}).get("persistedQuery") or {}
+        sha256_hash = persisted_query.get("sha256Hash")
+        if sha256_hash:
+            if query is None:
+                query = persisted_queries.get(sha256_hash)
+                if query is None:
+                    raise PersistedQueryNotFound()
+            elif hashlib.sha256(query.encode()).hexdigest() == sha256_hash:
+                # 전문과 해시가 일치할 때만 등록
+                persisted_queries.set(sha256_hash, query)
+            else:
+                raise ValueError("provided sha does not match query")
+
+        return GraphQLRequestData(
+            query=query,
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+
+    async def execute_operation(self, request, context, root_value) -> ExecutionResult:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryNotFound:
+            return ExecutionResult(
+                data=None,
+                errors=[GraphQLError("PersistedQueryNotFound", extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})],
+            )
+        except ValueError as e:
+            return ExecutionResult(
+                data=None,
+                errors=[GraphQLError(str(e), extensions={"code": "BAD_PERSISTED_QUERY"})],
+            )
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """
+    파싱/검증 결과 캐시
+
+    같은 쿼리 문자열은 한 번만 파싱하고, 검증을 통과한 문서는 다시 검증하지 않는다.
+    """
+
+    def on_parse(self):
+        execution_context = self.execution_context
+        cached = parsed_documents.get(execution_context.query)
+        if cached is not None:
+            execution_context.graphql_document = cached[0]
+        yield
+
+        if cached is None and execution_context.graphql_document is not None:
+            parsed_documents.set(execution_context.query, (execution_context.graphql_document, False))
+
+    def on_validate(self):
+        execution_context = self.execution_context
+        cached = parsed_documents.peek(execution_context.query)
+        if cached is not None and cached[1]:
+            # 이미 검증을 통과한 문서
+            execution_context.errors = []
+        yield
+
+        if cached is not None and not cached[1] and not execution_context.errors:
+            parsed_documents.set(execution_context.query, (cached[0], True))
+
+
+def cache_metrics() -> dict:
+    return {
+        "persisted_queries": persisted_queries.metrics(),
+        "parsed_documents": parsed_documents.metrics(),
+    }
\ No newline at end of file
@@ -0,0 +1,335 @@
+import asyncio
+import contextvars
+import math
+import os
+import time
+from typing import Any, Dict, Optional
+
+from graphql import (
+    ExecutionResult as GraphQLExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    ListValueNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_list_type,
+    is_leaf_type,
+    value_from_ast_untyped,
+)
+from sqlalchemy import func, select
+from strawberry.extensions import SchemaExtension
+
+from app.database.database import AsyncSessionLocal
+from app.models.models import User, Project, ProjectMember, ProjectCounter, Task, Comment, Activity, Notification
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+# 비용 설정
+# 작업 하나의 최대 비용 (0이면 제한 없음)
+QUERY_COST_LIMIT = int(os.getenv("QUERY_COST_LIMIT", "10000"))
+# 사용자별 분당 비용 한도 (0이면 스로틀링 없음)
+QUERY_COST_RATE_PER_MINUTE = int(os.getenv("QUERY_COST_RATE_PER_MINUTE", "0"))
+# 행 통계 갱신 주기
+QUERY_COST_STATS_TTL_SECONDS = int(os.getenv("QUERY_COST_STATS_TTL_SECONDS", "60"))
+# 통계로 크기를 알 수 없는 목록 필드의 기본 크기
+DEFAULT_LIST_SIZE = 10
+
+# 목록/커넥션 필드 → 한 번 조회할 때 예상되는 행 수 통계
+FIELD_ROW_ESTIMATES = {
+    ("Query", "projects"): "projects_per_user",
+    ("Query", "tasks"): "tasks_per_project",
+    ("Query", "notifications"): "notifications_per_user",
+    ("Query", "tasksConnection"): "tasks_per_project",
+    ("Query", "searchTasks"): "tasks_per_project",
+    ("Query", "taskComments"): "comments_per_task",
+    ("Query", "taskActivities"): "activities_per_task",
+    ("Query", "notificationsConnection"): "notifications_per_user",
+}
+
+# 요청 단위 DataLoader 로 불러오는 관계 필드 (목록 안에서도 같은 틱의 로드가 IN 쿼리 하나로 합쳐짐)
+BATCHED_RELATIONS = {
+    ("Task", "assignee"), ("Task", "project"),
+    ("Comment", "author"), ("Comment", "task"),
+    ("Activity", "user"), ("Activity", "task"), ("Activity", "project"),
+    ("ProjectMember", "user"), ("ProjectMember", "project"),
+    ("Notification", "user"),
+}
+
+
+class TableStatistics:
+    """
+    비용 추정에 쓰는 테이블별 행 수 통계 (주기적으로 DB에서 다시 계산)
+
+    전체 테이블 COUNT 는 큰 DB에서 느리므로 요청 안에서 기다리지 않는다.
+    오래된 통계는 백그라운드 작업 하나(single-flight)로만 다시 계산하고,
+    그동안 요청은 이전 통계를 사용한다. 통계가 한 번도 없을 때만 첫 계산을 기다린다.
+    """
+
+    def __init__(self):
+        self.estimates: Dict[str, int] = {}
+        self.refreshed_at = 0.0
+        self._refreshing: Optional[asyncio.Task] = None
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self.refreshed_at > QUERY_COST_STATS_TTL_SECONDS
+
+    async def ensure_fresh(self):
+        """
+        통계가 오래되었으면 갱신 작업 시작 (이미 진행 중이면 새로 시작하지 않음)
+        """
+        if self.is_stale() and (self._refreshing is None or self._refreshing.done()):
+            # 요청의 SQL 집계(current_query_stats)에 포함되지 않도록 빈 컨텍스트에서 실행
+            self._refreshing = asyncio.create_task(self._refresh_in_background(), context=contextvars.Context())
+        if not self.estimates and self._refreshing is not None:
+            # 요청이 취소되어도 갱신 작업은 계속 진행
+            await asyncio.shield(self._refreshing)
+
+    async def _refresh_in_background(self):
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.refresh(db)
+        except Exception as e:
+            # 실패하면 이전 통계를 유지하고 다음 주기에 다시 시도
+            self.refreshed_at = time.monotonic()
+            print(f"❌ 쿼리 비용 통계 갱신 실패: {e}")
+
+    async def refresh(self, db):
+        def count(model):
+            return select(func.count()).select_from(model).scalar_subquery()
+
+        # 가장 큰 프로젝트의 태스크 수 (목록이 한 프로젝트 전체를 반환하므로 평균 대신 최댓값 사용)
+        max_project_tasks = select(func.max(
+            ProjectCounter.todo_tasks + ProjectCounter.in_progress_tasks
+            + ProjectCounter.review_tasks + ProjectCounter.done_tasks
+        )).scalar_subquery()
+
+        row = (await db.execute(select(
+            count(User), count(Project), count(ProjectMember), count(Task),
+            count(Comment), count(Activity), count(Notification), max_project_tasks,
+        ))).one()
+        users, projects, members, tasks, comments, activities, notifications, max_tasks = row
+
+        def per(total, parents):
+            return max(math.ceil(total / parents), 1) if parents else 1
+
+        self.estimates = {
+            "projects_per_user": per(members, users),
+            "tasks_per_project": max(max_tasks or 0, per(tasks, projects)),
+            "notifications_per_user": per(notifications, users),
+            "comments_per_task": per(comments, tasks),
+            "activities_per_task": per(activities, tasks),
+        }
+        self.refreshed_at = time.monotonic()
+
+    def estimate(self, name: str) -> int:
+        return self.estimates.get(name, DEFAULT_LIST_SIZE)
+
+
+class CostBucket:
+    """
+    사용자별 비용 토큰 버킷 (분당 QUERY_COST_RATE_PER_MINUTE 만큼 충전)
+    """
+
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, capacity: float):
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def take(self, cost: int, rate_per_minute: int) -> Optional[float]:
+        """
+        비용 차감 (부족하면 차감하지 않고 다시 시도할 수 있을 때까지의 초를 반환)
+        """
+        now = time.monotonic()
+        self.tokens = min(rate_per_minute, self.tokens + (now - self.updated_at) * rate_per_minute / 60)
+        self.updated_at = now
+        if cost > self.tokens:
+            return (cost - self.tokens) * 60 / rate_per_minute
+        self.tokens -= cost
+        return None
+
+
+table_statistics = TableStatistics()
+_buckets: Dict[str, CostBucket] = {}
+_metrics = {"operations": 0, "rejected": 0, "throttled": 0, "max_cost": 0}
+
+
+class QueryCostCalculator:
+    """
+    스키마 형태와 행 통계로 작업 비용 계산
+
+    - 객체 필드(리졸버 호출)는 부모 행마다 1, 스칼라 필드는 0
+    - 목록 필드는 예상 행 수(부모 행 수 × 통계)만큼 세고, 하위 선택도 그 행 수만큼 곱한다.
+    - 로더 관계 필드(BATCHED_RELATIONS)는 부모 행 수와 무관하게 배치 쿼리 1번으로 센다.
+    - 커넥션은 first(최대 MAX_PAGE_SIZE)와 예상 행 수 중 작은 값을 edges 크기로 쓴다.
+    """
+
+    def __init__(self, schema, document, variables: Optional[Dict[str, Any]]):
+        self.schema = schema
+        self.variables = variables or {}
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def operation_cost(self, operation) -> int:
+        root_type = self.schema.get_root_type(operation.operation)
+        return self._selection_cost(root_type, operation.selection_set, 1, None)
+
+    def _arguments(self, node: FieldNode) -> Dict[str, Any]:
+        return {
+            argument.name.value: argument.value
+            for argument in node.arguments or ()
+        }
+
+    def _list_size(self, parent_name: str, node: FieldNode) -> int:
+        arguments = self._arguments(node)
+
+        # 일괄 뮤테이션처럼 목록 인자 크기가 결과 크기인 경우
+        for value in arguments.values():
+            if isinstance(value, ListValueNode):
+                return max(len(value.values), 1)
+            resolved = value_from_ast_untyped(value, self.variables)
+            if isinstance(resolved, list):
+                return max(len(resolved), 1)
+
+        estimate = FIELD_ROW_ESTIMATES.get((parent_name, node.name.value))
+        if estimate is None:
+            return DEFAULT_LIST_SIZE
+        return table_statistics.estimate(estimate)
+
+    def _page_size(self, parent_name: str, node: FieldNode) -> int:
+        first = self._arguments(node).get("first")
+        first = value_from_ast_untyped(first, self.variables) if first is not None else None
+        limit = min(max(first or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+        return min(limit, self._list_size(parent_name, node))
+
+    def _selection_cost(self, parent_type, selection_set, rows: int, edges_size: Optional[int]) -> int:
+        """
+        부모 객체 rows 개에 대해 selection_set 을 실행하는 비용
+        """
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                cost += self._selection_cost(fragment_type, fragment.selection_set, rows, edges_size)
+                continue
+            if isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                cost += self._selection_cost(fragment_type, selection.selection_set, rows, edges_size)
+                continue
+
+            name = selection.name.value
+            if name.startswith("__"):
+                # 인트로스펙션/__typename 은 DB를 조회하지 않음
+                continue
+
+            field = parent_type.fields[name]
+            field_type = get_named_type(field.type)
+            if is_leaf_type(field_type):
+                continue
+
+            if (parent_type.name, name) in BATCHED_RELATIONS:
+                # 부모 행마다 로드하지만 실제 조회는 배치 한 번 (대상 행 수는 부모 행 수 이하)
+                cost += 1 + self._selection_cost(field_type, selection.selection_set, rows, None)
+                continue
+
+            child_rows = rows
+            child_edges_size = None
+            if "edges" in field_type.fields and "pageInfo" in field_type.fields:
+                child_edges_size = self._page_size(parent_type.name, selection)
+            elif is_list_type(get_nullable_type(field.type)):
+                if name == "edges" and edges_size is not None:
+                    child_rows = rows * edges_size
+                else:
+                    child_rows = rows * self._list_size(parent_type.name, selection)
+
+            # 목록은 반환할 것으로 예상되는 행 수만큼, 단일 객체는 부모 행마다 1
+            cost += child_rows + self._selection_cost(field_type, selection.selection_set, child_rows, child_edges_size)
+        return cost
+
+
+def _cost_error(message: str, code: str, cost: int, **extensions) -> GraphQLExecutionResult:
+    return GraphQLExecutionResult(
+        data=None,
+        errors=[GraphQLError(message, extensions={"code": code, "cost": cost, **extensions})],
+    )
+
+
+class QueryCostExtension(SchemaExtension):
+    """
+    작업 비용 분석 (검증이 끝난 문서를 실행 직전에 평가)
+
+    - 비용이 QUERY_COST_LIMIT 를 넘으면 실행하지 않고 QUERY_TOO_EXPENSIVE 오류를 반환한다.
+    - QUERY_COST_RATE_PER_MINUTE 가 설정되면 사용자별 누적 비용을 제한한다 (THROTTLED).
+    - 계산한 비용은 응답 extensions.cost 에 담는다.
+    """
+
+    def __init__(self, *, execution_context):
+        super().__init__(execution_context=execution_context)
+        self.cost: Optional[int] = None
+        self.remaining: Optional[float] = None
+
+    async def on_execute(self):
+        execution_context = self.execution_context
+        operation = get_operation_ast(execution_context.graphql_document, execution_context.operation_name)
+        context = execution_context.context
+
+        if operation is not None and isinstance(context, dict):
+            await table_statistics.ensure_fresh()
+
+            calculator = QueryCostCalculator(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                execution_context.variables,
+            )
+            self.cost = calculator.operation_cost(operation)
+            _metrics["operations"] += 1
+            _metrics["max_cost"] = max(_metrics["max_cost"], self.cost)
+
+            current_user = context.get("current_user")
+            if QUERY_COST_LIMIT and self.cost > QUERY_COST_LIMIT:
+                _metrics["rejected"] += 1
+                execution_context.result = _cost_error(
+                    f"Query cost {self.cost} exceeds the limit of {QUERY_COST_LIMIT}",
+                    "QUERY_TOO_EXPENSIVE", self.cost, limit=QUERY_COST_LIMIT,
+                )
+            elif QUERY_COST_RATE_PER_MINUTE and current_user is not None:
+                bucket = _buckets.get(current_user.id)
+                if bucket is None:
+                    bucket = _buckets[current_user.id] = CostBucket(QUERY_COST_RATE_PER_MINUTE)
+                retry_after = bucket.take(self.cost, QUERY_COST_RATE_PER_MINUTE)
+                self.remaining = bucket.tokens
+                if retry_after is not None:
+                    _metrics["throttled"] += 1
+                    execution_context.result = _cost_error(
+                        "Query cost budget exhausted, retry later",
+                        "THROTTLED", self.cost, retryAfter=math.ceil(retry_after),
+                    )
+
+        yield
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.cost is None:
+            return {}
+        cost = {"requested": self.cost, "limit": QUERY_COST_LIMIT}
+        if self.remaining is not None:
+            cost["remaining"] = int(self.remaining)
+        return {"cost": cost}
+
+
+def cost_metrics() -> dict:
+    return {
+        **_metrics,
+        "limit": QUERY_COST_LIMIT,
+        "rate_per_minute": QUERY_COST_RATE_PER_MINUTE,
+        "tracked_users": len(_buckets),
+        "row_estimates": table_statistics.estimates,
+    }
\ No newline at end of file
@@ -0,0 +1,124 @@
+import cProfile
+import os
+import random
+import re
+import time
+from collections import deque
+from datetime import datetime
+from inspect import isawaitable
+from typing import Any, Dict, Optional
+
+from strawberry.extensions import SchemaExtension
+
+from app.extensions.sql_instrumentation import operation_name
+from app.metrics.metrics import metrics_registry
+
+# 필드 resolve 시간을 기록할 작업 비율 (기본 0: 기록하지 않음, 예: 0.01 이면 작업 100개 중 1개)
+FIELD_TIMING_SAMPLE_RATE = float(os.getenv("FIELD_TIMING_SAMPLE_RATE", "0"))
+# cProfile 을 켜고 실행할 작업 비율 (기본 0: 프로파일링 끔)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# 프로파일한 작업 중 이 시간 이상 걸린 작업만 파일로 저장
+PROFILE_THRESHOLD_MS = float(os.getenv("PROFILE_THRESHOLD_MS", "500"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+# 보관하는 프로파일 파일 수 (초과 시 오래된 파일부터 삭제)
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "100"))
+
+# (부모 타입, 필드) → 지표 이름 (기본 리졸버로 속성만 읽는 필드는 None)
+_field_keys: Dict[tuple, Optional[str]] = {}
+# 저장한 프로파일 파일 (오래된 순)
+_profile_files: deque = deque()
+# cProfile 은 스레드에 하나만 켤 수 있으므로 동시에 하나의 작업만 프로파일
+_profiling = False
+
+
+def _field_key(info) -> Optional[str]:
+    key = (info.parent_type.name, info.field_name)
+    if key not in _field_keys:
+        # __typename 등 메타 필드는 parent_type.fields 에 없음 (Apollo 클라이언트가 모든 선택에 추가)
+        field = info.parent_type.fields.get(info.field_name)
+        definition = field.extensions.get("strawberry-definition") if field is not None and field.extensions else None
+        has_resolver = definition is not None and definition.base_resolver is not None
+        _field_keys[key] = f"{key[0]}.{key[1]}" if has_resolver else None
+    return _field_keys[key]
+
+
+async def _timed(awaitable, field: str, started: float):
+    try:
+        return await awaitable
+    finally:
+        metrics_registry.observe_field(field, time.perf_counter() - started)
+
+
+def _write_profile(profile: cProfile.Profile, operation: str, elapsed_ms: float):
+    """
+    프로파일을 PROFILE_DIR 에 저장 (snakeviz/flameprof 등으로 오프라인 분석)
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", operation)[:80]
+    path = os.path.join(PROFILE_DIR, f"{datetime.utcnow():%Y%m%dT%H%M%S.%f}-{name}-{elapsed_ms:.0f}ms.prof")
+    profile.dump_stats(path)
+    _profile_files.append(path)
+    while len(_profile_files) > PROFILE_MAX_FILES:
+        try:
+            os.remove(_profile_files.popleft())
+        except OSError:
+            pass
+    print(f"🔬 느린 작업 프로파일 저장 ({elapsed_ms:.0f}ms): {path}")
+
+
+class ResolverProfilingExtension(SchemaExtension):
+    """
+    필드별 resolve 시간 히스토그램과 느린 작업 샘플 프로파일링
+
+    - FIELD_TIMING_SAMPLE_RATE 비율의 작업에서 리졸버가 있는 필드(루트 필드, 관계 필드 등)만 시간을 잰다.
+      속성만 읽는 스칼라 필드는 건너뛰므로 큰 목록에서도 추가 비용이 작다.
+      비동기 리졸버는 DataLoader 배치를 기다린 시간까지 포함한다.
+    - PROFILE_SAMPLE_RATE 비율의 작업은 cProfile 을 켜고 실행하고,
+      PROFILE_THRESHOLD_MS 이상 걸린 경우에만 .prof 파일로 저장한다.
+      이벤트 루프 스레드 전체를 프로파일하므로 같은 시간에 실행된 다른 요청의 작업도 포함된다.
+    - 두 비율이 0이면 작업마다 난수 하나만 뽑고 필드는 그대로 통과시킨다.
+    """
+
+    def __init__(self, *, execution_context):
+        super().__init__(execution_context=execution_context)
+        self.timing = False
+
+    def on_operation(self):
+        global _profiling
+        self.timing = FIELD_TIMING_SAMPLE_RATE > 0 and random.random() < FIELD_TIMING_SAMPLE_RATE
+
+        profile = None
+        if PROFILE_SAMPLE_RATE > 0 and not _profiling and random.random() < PROFILE_SAMPLE_RATE:
+            profile = cProfile.Profile()
+            _profiling = True
+
+        started = time.perf_counter()
+        if profile is None:
+            yield
+            return
+
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            _profiling = False
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms >= PROFILE_THRESHOLD_MS:
+            _write_profile(profile, operation_name(self.execution_context), elapsed_ms)
+
+    def resolve(self, _next, root, info, *args: Any, **kwargs: Any):
+        if not self.timing:
+            return _next(root, info, *args, **kwargs)
+
+        field = _field_key(info)
+        if field is None:
+            return _next(root, info, *args, **kwargs)
+
+        started = time.perf_counter()
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            return _timed(result, field, started)
+        metrics_registry.observe_field(field, time.perf_counter() - started)
+        return result
\ No newline at end of file
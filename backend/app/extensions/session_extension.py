@@ -0,0 +1,24 @@
+from strawberry.extensions import SchemaExtension
+
+
+class DatabaseSessionExtension(SchemaExtension):
+    """
+    GraphQL 작업 단위 세션 정리
+
+    작업이 끝나면 오류가 있었을 경우 진행 중인 트랜잭션을 롤백하고,
+    응답 직렬화/전송을 기다리지 않고 바로 커넥션을 풀에 반환한다.
+    세션 객체는 이후 접근 시 새 커넥션을 다시 얻으므로 닫아도 안전하다.
+    """
+
+    async def on_operation(self):
+        yield
+
+        context = self.execution_context.context
+        db = context.get("db") if isinstance(context, dict) else None
+        if db is None:
+            return
+
+        result = self.execution_context.result
+        if result is not None and result.errors and db.in_transaction():
+            await db.rollback()
+        await db.close()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import time
+from typing import Optional
+
+from graphql import get_operation_ast
+from strawberry.extensions import SchemaExtension
+
+from app.database.database import QueryStats, current_query_stats
+from app.metrics.metrics import metrics_registry
+
+
+def operation_name(execution_context) -> str:
+    """
+    지표 라벨로 쓸 작업 이름 (이름 없는 작업은 첫 루트 필드로 구분)
+    """
+    if execution_context.operation_name:
+        return execution_context.operation_name
+
+    document = execution_context.graphql_document
+    operation = get_operation_ast(document) if document is not None else None
+    if operation is None:
+        return "anonymous"
+    for selection in operation.selection_set.selections:
+        name = getattr(selection, "name", None)
+        if name is not None:
+            return f"{operation.operation.value}:{name.value}"
+    return operation.operation.value
+
+
+class SQLInstrumentationExtension(SchemaExtension):
+    """
+    작업별 SQL 실행 수, DB 시간, 가장 느린 문장 집계
+
+    - 작업 동안 current_query_stats 에 집계 객체를 두고 엔진 이벤트가 값을 채운다.
+    - 결과는 지표 저장소(/metrics, /admin/sql)에 쌓고 Server-Timing 헤더로도 내보낸다.
+    """
+
+    def __init__(self, *, execution_context):
+        super().__init__(execution_context=execution_context)
+        self.stats: Optional[QueryStats] = None
+
+    def on_operation(self):
+        execution_context = self.execution_context
+        # 작업 이름은 파싱 후에 알 수 있으므로 실행 전(on_execute)에 다시 정함
+        self.stats = QueryStats(execution_context.operation_name or "anonymous")
+        token = current_query_stats.set(self.stats)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            current_query_stats.reset(token)
+
+        elapsed = time.perf_counter() - started
+        if self.stats.operation == "anonymous":
+            self.stats.operation = operation_name(execution_context)
+        result = execution_context.result
+        metrics_registry.record_operation(self.stats, elapsed, bool(result is not None and result.errors))
+
+        context = execution_context.context
+        response = context.get("response") if isinstance(context, dict) else None
+        if response is not None:
+            response.headers["Server-Timing"] = (
+                f'db;dur={self.stats.seconds * 1000:.2f};desc="{self.stats.count} queries", '
+                f"graphql;dur={elapsed * 1000:.2f}"
+            )
+
+    def on_execute(self):
+        if self.stats is not None:
+            self.stats.operation = operation_name(self.execution_context)
+        yield
\ No newline at end of file
@@ -0,0 +1,38 @@
+from typing import Any, Dict, List, Optional, Type
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+
+from app.dto.dto import RowDTO, UserDTO, ProjectDTO, TaskDTO
+
+
+def _batch_load_by_id(db: AsyncSession, dto: Type[RowDTO]):
+    """
+    같은 틱에 요청된 키들을 하나의 IN (...) 쿼리로 조회하는 배치 함수 생성
+
+    Core 행을 DTO로 바로 변환하므로 세션의 identity map을 거치지 않는다.
+    """
+    model = dto.MODEL
+
+    async def load(keys: List[str]) -> List[Optional[Any]]:
+        result = await db.execute(select(*dto.columns()).where(model.id.in_(set(keys))))
+        by_id = {row.id: row for row in dto.from_rows(result.all())}
+        return [by_id.get(key) for key in keys]
+
+    return load
+
+
+def create_loaders(db: AsyncSession) -> Dict[str, DataLoader]:
+    """
+    요청 단위 DataLoader 생성
+
+    다대일 관계는 대상 테이블별 로더를 공유하여 같은 행을 한 번만 조회한다.
+    - user: Task.assignee, Comment.author, Activity.user, ProjectMember.user
+    - project: Task.project, Activity.project, ProjectMember.project
+    - task: Comment.task, Activity.task
+    """
+    return {
+        "user": DataLoader(load_fn=_batch_load_by_id(db, UserDTO)),
+        "project": DataLoader(load_fn=_batch_load_by_id(db, ProjectDTO)),
+        "task": DataLoader(load_fn=_batch_load_by_id(db, TaskDTO)),
+    }
\ No newline at end of file
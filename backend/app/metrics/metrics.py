@@ -0,0 +1,192 @@
+import bisect
+import os
+from typing import Dict, List, Optional
+
+from app.database.database import QueryStats, sql_totals
+
+# 작업 이름 라벨 수 상한 (클라이언트가 보내는 이름이라 초과분은 "other"로 묶음)
+METRICS_MAX_OPERATIONS = int(os.getenv("METRICS_MAX_OPERATIONS", "200"))
+# 느린 문장 예시로 보관하는 SQL 길이
+SLOWEST_STATEMENT_CHARS = 500
+# 필드 resolve 시간 히스토그램 버킷 (초)
+FIELD_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class OperationStats:
+    """
+    작업 이름별 누적 통계
+    """
+
+    __slots__ = ("count", "errors", "seconds", "db_queries", "db_seconds",
+                 "max_db_queries", "slowest_seconds", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.max_db_queries = 0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (버킷별 개수는 누적하지 않고 저장, 출력 시 누적)
+    """
+
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(FIELD_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(FIELD_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        버킷 상한으로 근사한 분위수 (마지막 버킷은 최댓값)
+        """
+        rank = q * self.count
+        seen = 0
+        for upper, count in zip(FIELD_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(upper, self.max)
+        return self.max
+
+
+class MetricsRegistry:
+    """
+    GraphQL 작업/SQL 지표 저장소 (/metrics 에서 Prometheus 텍스트 형식으로 출력)
+    """
+
+    def __init__(self, max_operations: int = METRICS_MAX_OPERATIONS):
+        self.max_operations = max_operations
+        self.operations: Dict[str, OperationStats] = {}
+        # "타입.필드" → resolve 시간 (필드 수는 스키마로 제한됨)
+        self.fields: Dict[str, Histogram] = {}
+
+    def _operation(self, name: str) -> OperationStats:
+        stats = self.operations.get(name)
+        if stats is None:
+            if len(self.operations) >= self.max_operations:
+                name = "other"
+                stats = self.operations.get(name)
+            if stats is None:
+                stats = self.operations[name] = OperationStats()
+        return stats
+
+    def record_operation(self, query_stats: QueryStats, seconds: float, error: bool):
+        stats = self._operation(query_stats.operation)
+        stats.count += 1
+        stats.errors += int(error)
+        stats.seconds += seconds
+        stats.db_queries += query_stats.count
+        stats.db_seconds += query_stats.seconds
+        stats.max_db_queries = max(stats.max_db_queries, query_stats.count)
+        if query_stats.slowest_seconds > stats.slowest_seconds:
+            stats.slowest_seconds = query_stats.slowest_seconds
+            stats.slowest_statement = " ".join(query_stats.slowest_statement.split())[:SLOWEST_STATEMENT_CHARS]
+
+    def observe_field(self, field: str, seconds: float):
+        histogram = self.fields.get(field)
+        if histogram is None:
+            histogram = self.fields[field] = Histogram()
+        histogram.observe(seconds)
+
+    def fields_summary(self) -> Dict[str, dict]:
+        """
+        필드별 resolve 횟수와 시간 분포 (/admin/resolvers), 총 시간이 큰 순
+        """
+        return {
+            name: {
+                "count": histogram.count,
+                "total_ms": round(histogram.sum * 1000, 2),
+                "avg_ms": round(histogram.sum / histogram.count * 1000, 3),
+                "p50_ms": round(histogram.quantile(0.5) * 1000, 3),
+                "p95_ms": round(histogram.quantile(0.95) * 1000, 3),
+                "p99_ms": round(histogram.quantile(0.99) * 1000, 3),
+                "max_ms": round(histogram.max * 1000, 3),
+            }
+            for name, histogram in sorted(self.fields.items(), key=lambda item: -item[1].sum)
+        }
+
+    def operations_summary(self) -> Dict[str, dict]:
+        """
+        작업별 평균 SQL 수/DB 시간 및 가장 느린 문장 (/admin/sql)
+        """
+        return {
+            name: {
+                "count": stats.count,
+                "errors": stats.errors,
+                "avg_ms": round(stats.seconds / stats.count * 1000, 2),
+                "avg_db_queries": round(stats.db_queries / stats.count, 2),
+                "max_db_queries": stats.max_db_queries,
+                "avg_db_ms": round(stats.db_seconds / stats.count * 1000, 2),
+                "slowest_query_ms": round(stats.slowest_seconds * 1000, 2),
+                "slowest_statement": stats.slowest_statement,
+            }
+            for name, stats in sorted(self.operations.items())
+        }
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 노출 형식
+        """
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{labels} {value}")
+
+        def by_operation(attribute: str):
+            return [
+                (f'{{operation="{_escape(name)}"}}', getattr(stats, attribute))
+                for name, stats in sorted(self.operations.items())
+            ]
+
+        metric("taskflow_graphql_operations_total", "counter", "GraphQL 작업 수", by_operation("count"))
+        metric("taskflow_graphql_operation_errors_total", "counter", "오류가 난 GraphQL 작업 수", by_operation("errors"))
+        metric("taskflow_graphql_operation_seconds_total", "counter", "GraphQL 작업 처리 시간 합계",
+               by_operation("seconds"))
+        metric("taskflow_graphql_db_queries_total", "counter", "GraphQL 작업이 실행한 SQL 수", by_operation("db_queries"))
+        metric("taskflow_graphql_db_seconds_total", "counter", "GraphQL 작업의 SQL 실행 시간 합계",
+               by_operation("db_seconds"))
+        metric("taskflow_graphql_slowest_query_seconds", "gauge", "작업별 가장 느린 SQL 실행 시간",
+               by_operation("slowest_seconds"))
+        field_samples = []
+        for name, histogram in sorted(self.fields.items()):
+            label = _escape(name)
+            cumulative = 0
+            for upper, count in zip(FIELD_BUCKETS, histogram.counts):
+                cumulative += count
+                field_samples.append((f'_bucket{{field="{label}",le="{upper}"}}', cumulative))
+            field_samples.append((f'_bucket{{field="{label}",le="+Inf"}}', histogram.count))
+            field_samples.append((f'_sum{{field="{label}"}}', histogram.sum))
+            field_samples.append((f'_count{{field="{label}"}}', histogram.count))
+        metric("taskflow_graphql_field_resolve_seconds", "histogram", "GraphQL 필드 resolve 시간 (리졸버가 있는 필드)",
+               field_samples)
+        metric("taskflow_db_queries_total", "counter", "전체 SQL 실행 수", [("", sql_totals["queries"])])
+        metric("taskflow_db_seconds_total", "counter", "전체 SQL 실행 시간 합계", [("", sql_totals["seconds"])])
+        metric("taskflow_db_slow_queries_total", "counter", "느린 쿼리 수 (SLOW_QUERY_MS 이상)",
+               [("", sql_totals["slow_queries"])])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# 전역 지표 저장소
+metrics_registry = MetricsRegistry()
\ No newline at end of file
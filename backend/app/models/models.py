@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, ForeignKey, Text, Index, Enum as SQLEnum, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -69,8 +69,28 @@ class Project(Base):
     activities = relationship("Activity", back_populates="project")
 
 
+class ProjectCounter(Base):
+    """
+    프로젝트별 상태별 태스크 수 (태스크 생성/수정/삭제 시 같은 트랜잭션에서 갱신)
+    """
+    __tablename__ = "project_counters"
+    
+    project_id = Column(String, ForeignKey("projects.id"), primary_key=True)
+    todo_tasks = Column(Integer, nullable=False, default=0)
+    in_progress_tasks = Column(Integer, nullable=False, default=0)
+    review_tasks = Column(Integer, nullable=False, default=0)
+    done_tasks = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class ProjectMember(Base):
     __tablename__ = "project_members"
+    __table_args__ = (
+        # 멤버십/권한 확인 및 사용자별 프로젝트 목록 조회
+        Index("uq_project_members_user_project", "user_id", "project_id", unique=True),
+        # 프로젝트별 멤버 목록 조회 및 프로젝트 삭제
+        Index("ix_project_members_project_id", "project_id"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -85,6 +105,18 @@ class ProjectMember(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 프로젝트별 태스크 목록 (created_at, id 키셋 정렬)
+        Index("ix_tasks_project_created", "project_id", "created_at", "id"),
+        # 담당자별 태스크 조회
+        Index("ix_tasks_assignee_id", "assignee_id"),
+        # 프로젝트별 기한 초과 태스크 집계 (미완료 태스크만 포함하는 부분 인덱스)
+        Index(
+            "ix_tasks_project_open_due", "project_id", "due_date",
+            sqlite_where=text("status != 'DONE'"),
+            postgresql_where=text("status != 'DONE'"),
+        ),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     title = Column(String, nullable=False)
@@ -108,6 +140,10 @@ class Task(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 태스크별 댓글 목록 (created_at, id 키셋 정렬)
+        Index("ix_comments_task_created", "task_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     content = Column(Text, nullable=False)
@@ -139,6 +175,11 @@ class Attachment(Base):
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        # 프로젝트/태스크별 활동 로그 (최신순)
+        Index("ix_activities_project_created", "project_id", "created_at", "id"),
+        Index("ix_activities_task_created", "task_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     action = Column(String, nullable=False)
@@ -156,6 +197,10 @@ class Activity(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # 사용자별 알림 목록 (최신순)
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=generate_uuid)
     title = Column(String, nullable=False)
@@ -165,4 +210,28 @@ class Notification(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
-    user = relationship("User", back_populates="notifications")
\ No newline at end of file
+    user = relationship("User", back_populates="notifications")
+
+class Change(Base):
+    """
+    델타 동기화용 변경 로그 (엔티티마다 최신 변경 한 행)
+
+    - seq는 AUTOINCREMENT로 증가만 하는 변경 순번이며 클라이언트 커서로 쓴다.
+    - 엔티티가 다시 바뀌면 기존 행을 지우고 새 seq로 다시 넣는다.
+    - deleted=True 행은 삭제된 엔티티의 tombstone이다 (프로젝트 삭제 후에도 남도록 FK 없음).
+    """
+    __tablename__ = "changes"
+    __table_args__ = (
+        # 프로젝트별 커서 이후 변경 조회
+        Index("ix_changes_project_seq", "project_id", "seq"),
+        # 엔티티의 이전 변경 행 교체
+        Index("uq_changes_entity", "entity_type", "entity_id", unique=True),
+        {"sqlite_autoincrement": True},
+    )
+    
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(String, nullable=False)
+    entity_type = Column(String, nullable=False)
+    entity_id = Column(String, nullable=False)
+    deleted = Column(Boolean, nullable=False, default=False)
+    changed_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
@@ -0,0 +1,209 @@
+import asyncio
+import contextvars
+import os
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import insert, select
+
+from app.database.database import AsyncSessionLocal
+from app.models.models import Notification, ProjectMember, generate_uuid
+from app.notifications.unread import unread_counter
+
+# 팬아웃 설정
+# 처리 대기 중인 이벤트 수 상한 (초과분은 버리고 집계)
+NOTIFICATION_QUEUE_SIZE = int(os.getenv("NOTIFICATION_QUEUE_SIZE", "10000"))
+# 한 트랜잭션에서 처리하는 최대 이벤트 수
+NOTIFICATION_BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "200"))
+# 첫 이벤트 이후 같은 배치로 모을 이벤트를 기다리는 시간
+NOTIFICATION_FLUSH_INTERVAL_MS = int(os.getenv("NOTIFICATION_FLUSH_INTERVAL_MS", "50"))
+# 다중 행 INSERT 한 번에 넣는 행 수 (SQLite 바인드 변수 한도 999 이내)
+NOTIFICATION_INSERT_ROWS = 150
+
+# 워커 종료 표시 (큐에서 이 값을 꺼내면 앞선 이벤트를 모두 저장한 뒤 종료)
+_STOP = object()
+
+
+class NotificationEvent:
+    """
+    알림으로 바꿀 태스크/댓글 이벤트
+
+    user_ids(담당자 등)와 notify_members(프로젝트 멤버 전체)로 수신자를 정하며,
+    이벤트를 만든 사용자(actor_id)는 수신자에서 제외한다.
+    """
+
+    __slots__ = ("actor_id", "project_id", "title", "message", "user_ids", "notify_members")
+
+    def __init__(self, actor_id: str, project_id: str, title: str, message: str,
+                 user_ids: Iterable[str] = (), notify_members: bool = False):
+        self.actor_id = actor_id
+        self.project_id = project_id
+        self.title = title
+        self.message = message
+        self.user_ids = tuple(user_id for user_id in user_ids if user_id)
+        self.notify_members = notify_members
+
+
+class NotificationFanout:
+    """
+    이벤트 → 알림 행 변환을 요청 밖에서 처리하는 비동기 팬아웃 단계
+
+    - 뮤테이션은 커밋 후 submit으로 이벤트를 큐에 넣기만 한다 (DB 작업 없음).
+    - 워커가 이벤트를 배치로 모아 프로젝트 멤버를 한 번에 조회하고,
+      알림 행을 다중 행 INSERT로 넣은 뒤 배치당 한 번 커밋한다.
+    - 종료 시 워커를 취소하지 않고 종료 표시를 넣어 큐를 끝까지 처리하게 한다
+      (커밋 직후 취소되어 같은 배치를 다시 저장하는 일이 없도록).
+    """
+
+    def __init__(self, queue_size: int = NOTIFICATION_QUEUE_SIZE, batch_size: int = NOTIFICATION_BATCH_SIZE,
+                 flush_interval_ms: int = NOTIFICATION_FLUSH_INTERVAL_MS):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # 메트릭
+        self.submitted = 0
+        self.dropped = 0
+        self.batches = 0
+        self.inserted = 0
+        self.failed = 0
+        self.last_batch_seconds = 0.0
+
+    def _get_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        return self._queue
+
+    def submit(self, events: Iterable[NotificationEvent]):
+        """
+        이벤트를 팬아웃 큐에 추가 (대기하지 않음, 큐가 가득 차면 버림)
+        """
+        queue = self._get_queue()
+        for event in events:
+            try:
+                queue.put_nowait(event)
+                self.submitted += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+        if self._worker is None or self._worker.done():
+            # 처음 제출한 요청의 컨텍스트(current_query_stats 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._worker = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    def _drain(self, batch: List[NotificationEvent]) -> List[NotificationEvent]:
+        queue = self._get_queue()
+        while len(batch) < self.batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+        return batch
+
+    async def _run(self):
+        queue = self._get_queue()
+        while True:
+            first = await queue.get()
+            if first is _STOP:
+                return
+            if self.flush_interval:
+                # 한 요청/연속된 요청의 이벤트를 같은 배치로 모음
+                await asyncio.sleep(self.flush_interval)
+            batch = self._drain([first])
+            stopping = any(event is _STOP for event in batch)
+            await self._process([event for event in batch if event is not _STOP])
+            if stopping:
+                return
+
+    async def _process(self, events: List[NotificationEvent]):
+        started = time.perf_counter()
+        try:
+            self.inserted += await self._write(events)
+            self.batches += 1
+        except Exception as e:
+            self.failed += len(events)
+            print(f"❌ 알림 팬아웃 실패 ({len(events)}건): {e}")
+        self.last_batch_seconds = time.perf_counter() - started
+
+    async def _write(self, events: List[NotificationEvent]) -> int:
+        """
+        이벤트 배치를 알림 행으로 저장하고 저장한 행 수를 반환
+        """
+        async with AsyncSessionLocal() as db:
+            # 멤버 전체에 알리는 이벤트의 프로젝트 멤버를 한 번에 조회
+            members: Dict[str, Set[str]] = {}
+            member_project_ids = {event.project_id for event in events if event.notify_members}
+            if member_project_ids:
+                result = await db.execute(
+                    select(ProjectMember.project_id, ProjectMember.user_id)
+                    .where(ProjectMember.project_id.in_(member_project_ids))
+                )
+                for project_id, user_id in result.all():
+                    members.setdefault(project_id, set()).add(user_id)
+
+            now = datetime.utcnow()
+            rows = []
+            for event in events:
+                recipients = set(event.user_ids)
+                if event.notify_members:
+                    recipients |= members.get(event.project_id, set())
+                recipients.discard(event.actor_id)
+                rows.extend(
+                    {
+                        "id": generate_uuid(),
+                        "title": event.title,
+                        "message": event.message,
+                        "user_id": user_id,
+                        "is_read": False,
+                        "created_at": now,
+                    }
+                    for user_id in sorted(recipients)
+                )
+
+            for start in range(0, len(rows), NOTIFICATION_INSERT_ROWS):
+                await db.execute(insert(Notification).values(rows[start:start + NOTIFICATION_INSERT_ROWS]))
+            await db.commit()
+
+        # 커밋된 알림만큼 읽지 않은 알림 카운터 증가
+        added: Dict[str, int] = {}
+        for row in rows:
+            added[row["user_id"]] = added.get(row["user_id"], 0) + 1
+        for user_id, count in added.items():
+            unread_counter.adjust(user_id, count)
+        return len(rows)
+
+    async def flush(self):
+        """
+        큐에 남은 이벤트를 바로 처리 (워커가 없을 때 종료 시 사용)
+        """
+        queue = self._get_queue()
+        while not queue.empty():
+            batch = [event for event in self._drain([]) if event is not _STOP]
+            if batch:
+                await self._process(batch)
+
+    def metrics(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "last_batch_ms": round(self.last_batch_seconds * 1000, 2),
+            "unread_counter": unread_counter.metrics(),
+        }
+
+    async def close(self):
+        """
+        남은 이벤트를 모두 저장하고 워커 종료
+        """
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            await self._get_queue().put(_STOP)
+            await worker
+        # 워커가 이미 끝나 있었으면 (실패 등) 남은 이벤트를 직접 처리
+        await self.flush()
+
+
+# 전역 팬아웃 인스턴스
+notification_fanout = NotificationFanout()
\ No newline at end of file
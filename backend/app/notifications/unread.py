@@ -0,0 +1,94 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Notification
+
+# 카운터 설정
+UNREAD_COUNTER_SIZE = int(os.getenv("UNREAD_COUNTER_SIZE", "10000"))
+# DB COUNT로 다시 맞추는 주기 (다른 워커 프로세스의 변경도 이 주기 안에 반영)
+UNREAD_COUNTER_TTL_SECONDS = float(os.getenv("UNREAD_COUNTER_TTL_SECONDS", "60"))
+
+
+class _Entry:
+    __slots__ = ("count", "expires_at")
+
+    def __init__(self, count: int, expires_at: float):
+        self.count = count
+        self.expires_at = expires_at
+
+
+class UnreadCounter:
+    """
+    사용자별 읽지 않은 알림 수 (메모리 카운터 + 주기적 DB 재계산)
+
+    - 처음 조회하거나 TTL이 지나면 COUNT 한 번으로 값을 맞춘다.
+    - 그 사이에는 알림 저장/읽음 처리가 커밋된 뒤 adjust로 증감한다.
+    - COUNT 도중 같은 사용자의 변경이 있었으면 결과를 저장하지 않는다
+      (COUNT가 변경 전/후 어느 쪽을 봤는지 알 수 없으므로 다음 조회에서 다시 계산).
+    """
+
+    def __init__(self, max_size: int = UNREAD_COUNTER_SIZE, ttl_seconds: float = UNREAD_COUNTER_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # COUNT 진행 중인 사용자 → 그 사이 변경 여부
+        self._loading: Dict[str, bool] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, db: AsyncSession, user_id: str) -> int:
+        entry = self._entries.get(user_id)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry.count
+
+        self.misses += 1
+        self._loading[user_id] = False
+        try:
+            count = await db.scalar(
+                select(func.count()).select_from(Notification).where(
+                    Notification.user_id == user_id,
+                    Notification.is_read.is_not(True),
+                )
+            )
+        finally:
+            # 같은 사용자의 COUNT가 겹쳤으면 먼저 끝난 쪽이 항목을 지우므로 나중 쪽은 저장하지 않음
+            changed = self._loading.pop(user_id, True)
+
+        if not changed:
+            self._entries[user_id] = _Entry(count, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return count
+
+    def adjust(self, user_id: str, delta: int):
+        """
+        커밋된 변경만큼 카운터 증감 (카운터가 없는 사용자는 다음 조회에서 계산)
+        """
+        if user_id in self._loading:
+            self._loading[user_id] = True
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            entry.count = max(entry.count + delta, 0)
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 전역 카운터 인스턴스
+unread_counter = UnreadCounter()
\ No newline at end of file
@@ -0,0 +1,213 @@
+import asyncio
+import enum
+import json
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from sqlalchemy import DateTime
+from fastapi import HTTPException
+
+# 브로커 설정
+# memory: 단일 프로세스 / redis: 여러 워커 간 이벤트 공유
+PUBSUB_BACKEND = os.getenv("PUBSUB_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_CHANNEL_PREFIX = os.getenv("PUBSUB_CHANNEL_PREFIX", "taskflow:")
+# 구독자별 대기 메시지 수 상한 (초과 시 느린 구독자로 보고 구독 종료)
+PUBSUB_QUEUE_SIZE = int(os.getenv("PUBSUB_QUEUE_SIZE", "100"))
+
+
+def project_tasks_topic(project_id: str) -> str:
+    return f"project:{project_id}:tasks"
+
+
+def project_activity_topic(project_id: str) -> str:
+    return f"project:{project_id}:activity"
+
+
+def task_comments_topic(task_id: str) -> str:
+    return f"task:{task_id}:comments"
+
+
+def serialize_row(obj: Any) -> Dict[str, Any]:
+    """
+    ORM 객체의 컬럼 값을 JSON 호환 dict로 변환 (Enum → 값, datetime → ISO 문자열)
+    """
+    data = {}
+    for column in obj.__table__.columns:
+        value = getattr(obj, column.key)
+        if isinstance(value, enum.Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[column.key] = value
+    return data
+
+
+def deserialize_row(model, data: Dict[str, Any]) -> Any:
+    """
+    serialize_row 결과로 세션에 속하지 않는 ORM 객체 생성
+    """
+    values = {}
+    for column in model.__table__.columns:
+        value = data.get(column.key)
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        values[column.key] = value
+    return model(**values)
+
+
+class _Subscriber:
+    __slots__ = ("queue", "evicted")
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.evicted = False
+
+
+# 느린 구독자 제거를 알리는 표식
+_EVICTED = object()
+
+
+class InMemoryBroker:
+    """
+    토픽 기반 asyncio pub/sub 브로커
+
+    - 구독자마다 크기가 제한된 큐를 가진다.
+    - 큐가 가득 찬 구독자는 느린 소비자로 보고 즉시 구독을 끊어
+      한 클라이언트가 메모리를 계속 점유하지 못하게 한다.
+    """
+
+    def __init__(self, queue_size: int = PUBSUB_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._topics: Dict[str, Set[_Subscriber]] = {}
+
+        # 메트릭
+        self.published = 0
+        self.delivered = 0
+        self.evicted = 0
+
+    async def publish(self, topic: str, message: Dict[str, Any]):
+        """
+        토픽에 메시지 발행
+        """
+        self.published += 1
+        self._deliver(topic, message)
+
+    def _deliver(self, topic: str, message: Dict[str, Any]):
+        for subscriber in list(self._topics.get(topic, ())):
+            try:
+                subscriber.queue.put_nowait(message)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                self._evict(topic, subscriber)
+
+    def _evict(self, topic: str, subscriber: _Subscriber):
+        subscriber.evicted = True
+        self._unregister(topic, subscriber)
+        self.evicted += 1
+
+        # 밀린 메시지를 버리고 종료 표식만 남김
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(_EVICTED)
+        print(f"⚠️ Slow subscriber evicted from {topic}")
+
+    def _register(self, topic: str, subscriber: _Subscriber):
+        self._topics.setdefault(topic, set()).add(subscriber)
+
+    def _unregister(self, topic: str, subscriber: _Subscriber):
+        subscribers = self._topics.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self._topics[topic]
+
+    async def subscribe(self, topic: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        토픽 구독 (구독이 끝나면 자동으로 등록 해제)
+        """
+        subscriber = _Subscriber(self.queue_size)
+        self._register(topic, subscriber)
+        try:
+            while True:
+                message = await subscriber.queue.get()
+                if message is _EVICTED:
+                    raise HTTPException(status_code=429, detail="Subscription dropped: client is not keeping up")
+                yield message
+        finally:
+            self._unregister(topic, subscriber)
+
+    def metrics(self) -> dict:
+        return {
+            "backend": PUBSUB_BACKEND,
+            "topics": len(self._topics),
+            "subscribers": sum(len(subscribers) for subscribers in self._topics.values()),
+            "queue_size": self.queue_size,
+            "published": self.published,
+            "delivered": self.delivered,
+            "evicted": self.evicted,
+        }
+
+    async def close(self):
+        pass
+
+
+class RedisBroker(InMemoryBroker):
+    """
+    Redis pub/sub 기반 브로커 (멀티 워커 배포용)
+
+    발행은 Redis 채널로 보내고, 프로세스마다 하나의 Redis 구독 연결이
+    메시지를 받아 로컬 구독자 큐로 분배한다.
+    """
+
+    def __init__(self, url: str = REDIS_URL, queue_size: int = PUBSUB_QUEUE_SIZE):
+        super().__init__(queue_size)
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, topic: str, message: Dict[str, Any]):
+        self.published += 1
+        await self._redis.publish(REDIS_CHANNEL_PREFIX + topic, json.dumps(message))
+
+    async def _listen(self):
+        pubsub = self._redis.pubsub()
+        await pubsub.psubscribe(REDIS_CHANNEL_PREFIX + "*")
+        try:
+            async for raw in pubsub.listen():
+                if raw["type"] != "pmessage":
+                    continue
+                channel = raw["channel"].decode() if isinstance(raw["channel"], bytes) else raw["channel"]
+                topic = channel[len(REDIS_CHANNEL_PREFIX):]
+                if topic in self._topics:
+                    self._deliver(topic, json.loads(raw["data"]))
+        finally:
+            await pubsub.close()
+
+    async def subscribe(self, topic: str) -> AsyncIterator[Dict[str, Any]]:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        async for message in super().subscribe(topic):
+            yield message
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._redis.close()
+
+
+def create_broker() -> InMemoryBroker:
+    """
+    PUBSUB_BACKEND 설정에 맞는 브로커 생성
+    """
+    if PUBSUB_BACKEND == "redis":
+        return RedisBroker()
+    return InMemoryBroker()
+
+
+# 전역 브로커 인스턴스
+broker = create_broker()
\ No newline at end of file
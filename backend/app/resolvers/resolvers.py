@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict, Any
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from app.models.models import User, Project, Task, Comment, ProjectMember, Notification, Activity
 # GraphQL 입력 및 출력 타입들은 별도 파일에 정의
@@ -10,9 +11,21 @@ from app.auth.middleware import auth_middleware
 from app.services.project_service import ProjectService
 from app.services.task_service import TaskService
 from app.services.auth_service import AuthServiceDB
+from app.loaders.loaders import create_loaders
+from app.dto.dto import TaskDTO, UserDTO, CommentDTO, ActivityDTO, NotificationDTO, to_dto
+from app.dto.projection import selected_columns
+from app.services.pagination import encode_cursor, paginate
+from app.database.database import AsyncSessionLocal
+from app.cache.response_cache import response_cache
+from app.notifications.notifications import notification_fanout
+from app.notifications.unread import unread_counter
+from app.pubsub.pubsub import (
+    broker, serialize_row, deserialize_row,
+    project_tasks_topic, project_activity_topic, task_comments_topic,
+)
 
 
-def get_context(request, db: Session):
+def get_context(request, db: AsyncSession):
     """
     GraphQL 컨텍스트 제공
     """
@@ -27,27 +40,104 @@ def get_context(request, db: Session):
         "project_service": ProjectService(db),
         "task_service": TaskService(db),
         "auth_middleware": auth_middleware,
+        "loaders": create_loaders(db),
     }
 
 
+def build_connection(rows: List[Any], has_next_page: bool, after: Optional[str] = None,
+                     cursors: Optional[List[str]] = None):
+    """
+    조회된 페이지를 Relay Connection 형태로 변환
+    """
+    from app.schemas.types import Connection, Edge, PageInfo
+
+    if cursors is None:
+        cursors = [encode_cursor(row) for row in rows]
+    edges = [Edge(cursor=cursor, node=row) for cursor, row in zip(cursors, rows)]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            has_previous_page=after is not None,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
+
+
+async def publish_events(context, task: Optional[Task] = None, comment: Optional[Comment] = None):
+    """
+    변경된 태스크/댓글과 이번 요청에서 생성된 활동 로그를 구독 토픽에 발행하고
+    알림 이벤트를 팬아웃 단계로 넘김
+    """
+    if task is not None:
+        await broker.publish(project_tasks_topic(task.project_id), serialize_row(task))
+    if comment is not None:
+        await broker.publish(task_comments_topic(comment.task_id), serialize_row(comment))
+
+    activities = context["task_service"].new_activities
+    for activity in activities:
+        await broker.publish(project_activity_topic(activity.project_id), serialize_row(activity))
+    activities.clear()
+
+    events = context["task_service"].notification_events
+    notification_fanout.submit(events)
+    events.clear()
+
+
+# 일괄 뮤테이션 한 번에 처리할 수 있는 최대 태스크 수
+MAX_BULK_TASKS = 500
+
+
+async def check_projects_access(context, project_ids) -> None:
+    """
+    여러 프로젝트에 대한 접근 권한을 멤버십 조회 한 번으로 확인
+    """
+    memberships = await context["project_service"].get_user_memberships(context["current_user"].id)
+    if any(project_id not in memberships for project_id in project_ids):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+
+async def load_tasks_for_bulk(context, task_ids: List[str]) -> List[Task]:
+    """
+    일괄 뮤테이션 대상 태스크 조회 및 권한 확인
+    """
+    if len(task_ids) > MAX_BULK_TASKS:
+        raise HTTPException(status_code=400, detail=f"Too many tasks (max {MAX_BULK_TASKS})")
+    if len(set(task_ids)) != len(task_ids):
+        raise HTTPException(status_code=400, detail="Duplicate task ids")
+    
+    tasks = await context["task_service"].get_tasks_by_ids(task_ids)
+    if len(tasks) != len(task_ids):
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    # 프로젝트 접근 권한 확인 (프로젝트마다 한 번)
+    await check_projects_access(context, {task.project_id for task in tasks})
+    return tasks
+
+
+async def publish_bulk_changes(context, tasks: List[Task]):
+    """
+    일괄 뮤테이션 결과의 캐시 무효화 및 구독 이벤트 발행
+    """
+    await response_cache.bump({task.project_id for task in tasks})
+    for task in tasks:
+        await broker.publish(project_tasks_topic(task.project_id), serialize_row(task))
+    await publish_events(context)
+
+
 class QueryResolver:
     @staticmethod
-    def me(info) -> Optional[User]:
+    async def me(info) -> Optional[User]:
         """
         현재 인증된 사용자 반환
         """
         context = info.context
-        current_user = context["current_user"]
-        
-        if current_user:
-            # Role enum을 GraphQL 호환 형식으로 변환
-            from app.schemas.types import Role as GraphQLRole
-            current_user.role = GraphQLRole(current_user.role.value) if hasattr(current_user.role, 'value') else GraphQLRole(current_user.role)
-        
-        return current_user
+        # current_user는 GraphQL 호환 Role을 가진 UserSnapshot
+        return context["current_user"]
 
     @staticmethod
-    def projects(info) -> List[Project]:
+    async def projects(info) -> List[Project]:
         """
         사용자가 속한 프로젝트들 반환
         """
@@ -67,7 +157,7 @@ class QueryResolver:
             project_service = ProjectService(db)
             
             # 사용자가 속한 프로젝트들 반환
-            projects = project_service.get_user_projects(current_user.id)
+            projects = await project_service.get_user_projects(current_user.id)
             print(f"✅ Found {len(projects)} projects for user {current_user.id}")
             return projects
             
@@ -79,7 +169,7 @@ class QueryResolver:
             raise e
 
     @staticmethod
-    def project(info, id: str) -> Optional[Project]:
+    async def project(info, id: str) -> Optional[Project]:
         """
         특정 프로젝트 반환
         """
@@ -88,18 +178,38 @@ class QueryResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        project = context["project_service"].get_project(id)
+        project = await context["project_service"].get_project(id)
         if not project:
             return None
         
         # 권한 확인
-        if not context["project_service"].has_project_access(current_user.id, id):
+        if not await context["project_service"].has_project_access(current_user.id, id):
             raise HTTPException(status_code=403, detail="Access denied")
         
         return project
 
     @staticmethod
-    def tasks(info, projectId: str, filter = None) -> List[Task]:
+    async def project_stats(info, projectId: str):
+        """
+        프로젝트 태스크 통계 (카운터 테이블 기반)
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, projectId):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        from app.schemas.types import ProjectStats
+        from app.services.stats_service import ProjectStatsService
+        
+        stats = await ProjectStatsService(context["db"]).get_project_stats(projectId)
+        return ProjectStats(**stats)
+
+    @staticmethod
+    async def tasks(info, projectId: str, filter = None) -> List[Task]:
         """
         프로젝트의 태스크들 반환
         """
@@ -111,27 +221,20 @@ class QueryResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Authentication required")
         
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, projectId):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
         # 태스크 서비스 생성
         from app.services.task_service import TaskService
         task_service = TaskService(db)
         
-        # 태스크 조회
-        tasks = task_service.get_tasks(projectId, filter)
-        
-        # Enum 값들을 GraphQL 호환 형태로 변환
-        from app.schemas.types import TaskStatus as GraphQLTaskStatus, Priority as GraphQLPriority, Role as GraphQLRole
-        for task in tasks:
-            task.status = GraphQLTaskStatus(task.status.value) if hasattr(task.status, 'value') else GraphQLTaskStatus(task.status)
-            task.priority = GraphQLPriority(task.priority.value) if hasattr(task.priority, 'value') else GraphQLPriority(task.priority)
-            
-            # assignee의 Role enum 변환
-            if task.assignee:
-                task.assignee.role = GraphQLRole(task.assignee.role.value) if hasattr(task.assignee.role, 'value') else GraphQLRole(task.assignee.role)
-        
-        return tasks
+        # 태스크 조회 (GraphQL Enum이 적용된 DTO 목록)
+        # 선택된 필드에 필요한 컬럼만 조회
+        return await task_service.get_tasks(projectId, filter, selected_columns(info, TaskDTO))
 
     @staticmethod
-    def task(info, id: str) -> Optional[Task]:
+    async def task(info, id: str) -> Optional[Task]:
         """
         특정 태스크 반환
         """
@@ -140,43 +243,198 @@ class QueryResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        task = context["task_service"].get_task(id)
+        task = await context["task_service"].get_task(id)
         if not task:
             return None
         
         # 프로젝트 접근 권한 확인
-        if not context["project_service"].has_project_access(current_user.id, task.project_id):
+        if not await context["project_service"].has_project_access(current_user.id, task.project_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        # Enum 값들을 GraphQL 호환 형태로 변환
-        from app.schemas.types import TaskStatus as GraphQLTaskStatus, Priority as GraphQLPriority, Role as GraphQLRole
-        task.status = GraphQLTaskStatus(task.status.value) if hasattr(task.status, 'value') else GraphQLTaskStatus(task.status)
-        task.priority = GraphQLPriority(task.priority.value) if hasattr(task.priority, 'value') else GraphQLPriority(task.priority)
+        # ORM 객체는 그대로 두고 GraphQL Enum이 적용된 DTO로 반환
+        return TaskDTO.from_model(task)
+
+    @staticmethod
+    async def notifications(info) -> List[Notification]:
+        """
+        사용자의 알림들 반환
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        # 관계 필드(user)는 로더로 불러오므로 ORM 객체 대신 DTO로 반환
+        fields = selected_columns(info, NotificationDTO)
+        result = await context["db"].execute(
+            select(*NotificationDTO.columns(fields)).where(
+                Notification.user_id == current_user.id
+            ).order_by(Notification.created_at.desc())
+        )
+        return NotificationDTO.from_rows(result.all(), fields)
+
+    @staticmethod
+    async def tasks_connection(info, projectId: str, filter=None, first: Optional[int] = None, after: Optional[str] = None):
+        """
+        프로젝트의 태스크들을 커서 기반 페이지로 반환
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Authentication required")
         
-        # assignee의 Role enum 변환
-        if task.assignee:
-            task.assignee.role = GraphQLRole(task.assignee.role.value) if hasattr(task.assignee.role, 'value') else GraphQLRole(task.assignee.role)
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, projectId):
+            raise HTTPException(status_code=403, detail="Access denied")
         
-        return task
+        tasks, has_next_page = await context["task_service"].get_tasks_page(
+            projectId, filter, first, after, selected_columns(info, TaskDTO, ("edges", "node"))
+        )
+        return build_connection(tasks, has_next_page, after)
 
     @staticmethod
-    def notifications(info) -> List[Notification]:
+    async def search_tasks(info, projectId: str, query: str, first: Optional[int] = None, after: Optional[str] = None):
         """
-        사용자의 알림들 반환
+        프로젝트 내 태스크 전문 검색 (순위, 하이라이트 포함)
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Authentication required")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, projectId):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        from app.services.search_service import SearchService
+        results, has_next_page = await SearchService(context["db"]).search_tasks(
+            projectId, query, first, after, selected_columns(info, TaskDTO, ("edges", "node", "task"))
+        )
+        
+        from app.schemas.types import TaskSearchResult
+        nodes = []
+        for result in results:
+            nodes.append(TaskSearchResult(
+                task=result["task"],
+                rank=result["rank"],
+                title_highlight=result["title_highlight"],
+                snippet=result["snippet"],
+            ))
+        
+        return build_connection(nodes, has_next_page, after, [result["cursor"] for result in results])
+
+    @staticmethod
+    async def task_comments(info, taskId: str, first: Optional[int] = None, after: Optional[str] = None):
+        """
+        태스크의 댓글들을 커서 기반 페이지로 반환
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        project_id = await context["task_service"].get_task_project_id(taskId)
+        if not project_id:
+            raise HTTPException(status_code=404, detail="Task not found")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, project_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        comments, has_next_page = await context["task_service"].get_task_comments_page(
+            taskId, first, after, selected_columns(info, CommentDTO, ("edges", "node"))
+        )
+        return build_connection(comments, has_next_page, after)
+
+    @staticmethod
+    async def task_activities(info, taskId: str, first: Optional[int] = None, after: Optional[str] = None):
+        """
+        태스크의 활동 로그를 커서 기반 페이지로 반환
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        project_id = await context["task_service"].get_task_project_id(taskId)
+        if not project_id:
+            raise HTTPException(status_code=404, detail="Task not found")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, project_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        activities, has_next_page = await context["task_service"].get_task_activities_page(
+            taskId, first, after, selected_columns(info, ActivityDTO, ("edges", "node"))
+        )
+        return build_connection(activities, has_next_page, after)
+
+    @staticmethod
+    async def unread_notification_count(info) -> int:
+        """
+        읽지 않은 알림 수 (메모리 카운터, 주기적으로 DB와 재계산)
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        return await unread_counter.get(context["db"], current_user.id)
+
+    @staticmethod
+    async def changes_since(info, projectId: str, cursor: Optional[str] = None, first: Optional[int] = None):
+        """
+        커서 이후 프로젝트에서 바뀐 엔티티와 삭제 표시(tombstone) 반환 (오프라인 재개용)
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        from app.schemas.types import ChangeSet, Tombstone
+        from app.services.sync_service import SyncService, encode_sync_cursor
+        
+        sync_service = SyncService(context["db"])
+        if not await context["project_service"].has_project_access(current_user.id, projectId):
+            # 삭제된 프로젝트는 멤버십이 사라졌으므로 이전 멤버에게만 tombstone을 알려줌
+            # (그 외 사용자에게는 존재했던 프로젝트 ID인지 드러내지 않도록 같은 403)
+            tombstone = await sync_service.get_project_tombstone(projectId)
+            if tombstone is None or not await sync_service.was_project_member(projectId, current_user.id):
+                raise HTTPException(status_code=403, detail="Access denied")
+            return ChangeSet(
+                project=None, tasks=[], comments=[], activities=[],
+                tombstones=[Tombstone(entity_type="project", id=projectId, deleted_at=tombstone.changed_at)],
+                cursor=encode_sync_cursor(tombstone.seq),
+                has_more=False,
+            )
+        
+        changes = await sync_service.changes_since(projectId, cursor, first)
+        changes["tombstones"] = [Tombstone(**tombstone) for tombstone in changes["tombstones"]]
+        return ChangeSet(**changes)
+
+    @staticmethod
+    async def notifications_connection(info, first: Optional[int] = None, after: Optional[str] = None):
+        """
+        사용자의 알림들을 커서 기반 페이지로 반환
         """
         context = info.context
         current_user = context["current_user"]
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        return context["db"].query(Notification).filter(
+        fields = selected_columns(info, NotificationDTO, ("edges", "node"))
+        stmt = select(*NotificationDTO.columns(fields)).where(
             Notification.user_id == current_user.id
-        ).order_by(Notification.created_at.desc()).all()
+        )
+        notifications, has_next_page = await paginate(
+            context["db"], stmt, Notification, first, after, descending=True, dto=NotificationDTO, fields=fields
+        )
+        return build_connection(notifications, has_next_page, after)
 
 
 class MutationResolver:
     @staticmethod
-    def login(info, input):
+    async def login(info, input):
         """
         로그인 처리 (자동 회원가입 포함)
         """
@@ -188,7 +446,7 @@ class MutationResolver:
         auth_service = AuthServiceDB(db)
         
         # 기존 사용자 인증 시도
-        user = auth_service.authenticate_user(input.email, input.password)
+        user = await auth_service.authenticate_user(input.email, input.password)
         
         if not user:
             # 사용자가 없으면 자동으로 새 계정 생성
@@ -202,7 +460,7 @@ class MutationResolver:
                     "name": name
                 }
                 
-                user = auth_service.create_user_if_not_exists(auto_register_input)
+                user = await auth_service.create_user_if_not_exists(auto_register_input)
                 print(f"✅ 자동 회원가입 완료: {user.email}")
                 
             except Exception as e:
@@ -215,15 +473,13 @@ class MutationResolver:
         access_token = AuthService.create_access_token(data={"sub": user.id})
         
         # AuthPayload 객체 생성 (types.py에서 import 필요)
-        from app.schemas.types import AuthPayload, Role as GraphQLRole
+        from app.schemas.types import AuthPayload
         
-        # Role enum을 GraphQL 호환 형식으로 변환
-        user.role = GraphQLRole(user.role.value) if hasattr(user.role, 'value') else GraphQLRole(user.role)
-        
-        return AuthPayload(token=access_token, user=user)
+        # ORM 객체 대신 GraphQL Role이 적용된 DTO로 반환
+        return AuthPayload(token=access_token, user=UserDTO.from_model(user))
 
     @staticmethod
-    def register(info, input):
+    async def register(info, input):
         """
         회원가입 처리
         """
@@ -235,7 +491,7 @@ class MutationResolver:
         auth_service = AuthServiceDB(db)
         
         # 이메일 중복 확인
-        existing_user = db.query(User).filter(User.email == input.email).first()
+        existing_user = await auth_service.get_user_by_email(input.email)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -248,19 +504,17 @@ class MutationResolver:
             "password": input.password,
             "name": input.name
         }
-        user = auth_service.create_user(user_input)
+        user = await auth_service.create_user(user_input)
         access_token = AuthService.create_access_token(data={"sub": user.id})
         
         # AuthPayload 객체 생성 (types.py에서 import 필요)
-        from app.schemas.types import AuthPayload, Role as GraphQLRole
-        
-        # Role enum을 GraphQL 호환 형식으로 변환
-        user.role = GraphQLRole(user.role.value) if hasattr(user.role, 'value') else GraphQLRole(user.role)
+        from app.schemas.types import AuthPayload
         
-        return AuthPayload(token=access_token, user=user)
+        # ORM 객체 대신 GraphQL Role이 적용된 DTO로 반환
+        return AuthPayload(token=access_token, user=UserDTO.from_model(user))
 
     @staticmethod
-    def create_project(info, input) -> Project:
+    async def create_project(info, input) -> Project:
         """
         프로젝트 생성
         """
@@ -269,10 +523,12 @@ class MutationResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        return context["project_service"].create_project(current_user.id, input)
+        project = await context["project_service"].create_project(current_user.id, input)
+        await response_cache.bump([project.id])
+        return project
 
     @staticmethod
-    def update_project(info, id: str, input) -> Project:
+    async def update_project(info, id: str, input) -> Project:
         """
         프로젝트 수정
         """
@@ -282,13 +538,15 @@ class MutationResolver:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
         # 권한 확인 (매니저 이상)
-        if not context["project_service"].has_project_manage_access(current_user.id, id):
+        if not await context["project_service"].has_project_manage_access(current_user.id, id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        return context["project_service"].update_project(id, input)
+        project = await context["project_service"].update_project(id, input)
+        await response_cache.bump([id])
+        return project
 
     @staticmethod
-    def delete_project(info, id: str) -> bool:
+    async def delete_project(info, id: str) -> bool:
         """
         프로젝트 삭제
         """
@@ -298,13 +556,15 @@ class MutationResolver:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
         # 권한 확인 (매니저 이상)
-        if not context["project_service"].has_project_manage_access(current_user.id, id):
+        if not await context["project_service"].has_project_manage_access(current_user.id, id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        return context["project_service"].delete_project(id)
+        deleted = await context["project_service"].delete_project(id)
+        await response_cache.bump([id])
+        return deleted
 
     @staticmethod
-    def create_task(info, input) -> Task:
+    async def create_task(info, input) -> Task:
         """
         태스크 생성
         """
@@ -314,24 +574,17 @@ class MutationResolver:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
         # 프로젝트 접근 권한 확인
-        if not context["project_service"].has_project_access(current_user.id, input.projectId):
+        if not await context["project_service"].has_project_access(current_user.id, input.projectId):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        task = context["task_service"].create_task(current_user.id, input)
+        task = await context["task_service"].create_task(current_user.id, input)
+        await response_cache.bump([task.project_id])
+        await publish_events(context, task=task)
         
-        # Enum 값들을 GraphQL 호환 형태로 변환
-        from app.schemas.types import TaskStatus as GraphQLTaskStatus, Priority as GraphQLPriority, Role as GraphQLRole
-        task.status = GraphQLTaskStatus(task.status.value) if hasattr(task.status, 'value') else GraphQLTaskStatus(task.status)
-        task.priority = GraphQLPriority(task.priority.value) if hasattr(task.priority, 'value') else GraphQLPriority(task.priority)
-        
-        # assignee의 Role enum 변환
-        if task.assignee:
-            task.assignee.role = GraphQLRole(task.assignee.role.value) if hasattr(task.assignee.role, 'value') else GraphQLRole(task.assignee.role)
-        
-        return task
+        return TaskDTO.from_model(task)
 
     @staticmethod
-    def update_task(info, id: str, input) -> Task:
+    async def update_task(info, id: str, input) -> Task:
         """
         태스크 수정
         """
@@ -340,29 +593,22 @@ class MutationResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        task = context["task_service"].get_task(id)
+        task = await context["task_service"].get_task(id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
         # 프로젝트 접근 권한 확인
-        if not context["project_service"].has_project_access(current_user.id, task.project_id):
+        if not await context["project_service"].has_project_access(current_user.id, task.project_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        updated_task = context["task_service"].update_task(id, input)
-        
-        # Enum 값들을 GraphQL 호환 형태로 변환
-        from app.schemas.types import TaskStatus as GraphQLTaskStatus, Priority as GraphQLPriority, Role as GraphQLRole
-        updated_task.status = GraphQLTaskStatus(updated_task.status.value) if hasattr(updated_task.status, 'value') else GraphQLTaskStatus(updated_task.status)
-        updated_task.priority = GraphQLPriority(updated_task.priority.value) if hasattr(updated_task.priority, 'value') else GraphQLPriority(updated_task.priority)
+        updated_task = await context["task_service"].update_task(current_user.id, id, input)
+        await response_cache.bump([updated_task.project_id])
+        await publish_events(context, task=updated_task)
         
-        # assignee의 Role enum 변환
-        if updated_task.assignee:
-            updated_task.assignee.role = GraphQLRole(updated_task.assignee.role.value) if hasattr(updated_task.assignee.role, 'value') else GraphQLRole(updated_task.assignee.role)
-        
-        return updated_task
+        return TaskDTO.from_model(updated_task)
 
     @staticmethod
-    def delete_task(info, id: str) -> bool:
+    async def delete_task(info, id: str) -> bool:
         """
         태스크 삭제
         """
@@ -371,18 +617,75 @@ class MutationResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        task = context["task_service"].get_task(id)
+        task = await context["task_service"].get_task(id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
         # 프로젝트 접근 권한 확인
-        if not context["project_service"].has_project_access(current_user.id, task.project_id):
+        if not await context["project_service"].has_project_access(current_user.id, task.project_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        return context["task_service"].delete_task(id)
+        deleted = await context["task_service"].delete_task(current_user.id, id)
+        await response_cache.bump([task.project_id])
+        await publish_events(context)
+        return deleted
+
+    @staticmethod
+    async def bulk_create_tasks(info, inputs) -> List[Task]:
+        """
+        태스크 일괄 생성
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        if len(inputs) > MAX_BULK_TASKS:
+            raise HTTPException(status_code=400, detail=f"Too many tasks (max {MAX_BULK_TASKS})")
+        
+        # 프로젝트 접근 권한 확인 (프로젝트마다 한 번)
+        await check_projects_access(context, {input.projectId for input in inputs})
+        
+        tasks = await context["task_service"].bulk_create_tasks(current_user.id, inputs)
+        await publish_bulk_changes(context, tasks)
+        return [TaskDTO.from_model(task) for task in tasks]
 
     @staticmethod
-    def add_comment(info, task_id: str, content: str) -> Comment:
+    async def bulk_update_tasks(info, updates) -> List[Task]:
+        """
+        태스크 일괄 수정
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        tasks = await load_tasks_for_bulk(context, [update.id for update in updates])
+        
+        updated_tasks = await context["task_service"].bulk_update_tasks(
+            current_user.id, [(task, update.input) for task, update in zip(tasks, updates)]
+        )
+        await publish_bulk_changes(context, updated_tasks)
+        return [TaskDTO.from_model(task) for task in updated_tasks]
+
+    @staticmethod
+    async def move_tasks(info, task_ids: List[str], status) -> List[Task]:
+        """
+        여러 태스크를 같은 상태로 이동
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        tasks = await load_tasks_for_bulk(context, task_ids)
+        
+        moved_tasks = await context["task_service"].move_tasks(current_user.id, tasks, status)
+        await publish_bulk_changes(context, moved_tasks)
+        return [TaskDTO.from_model(task) for task in moved_tasks]
+
+    @staticmethod
+    async def add_comment(info, task_id: str, content: str) -> Comment:
         """
         댓글 추가
         """
@@ -391,18 +694,21 @@ class MutationResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        task = context["task_service"].get_task(task_id)
+        task = await context["task_service"].get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
         # 프로젝트 접근 권한 확인
-        if not context["project_service"].has_project_access(current_user.id, task.project_id):
+        if not await context["project_service"].has_project_access(current_user.id, task.project_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        return context["task_service"].add_comment(current_user.id, task_id, content)
+        comment = await context["task_service"].add_comment(current_user.id, task_id, content)
+        await response_cache.bump([task.project_id])
+        await publish_events(context, comment=comment)
+        return comment
 
     @staticmethod
-    def mark_notification_read(info, id: str) -> bool:
+    async def mark_notification_read(info, id: str) -> bool:
         """
         알림 읽음 처리
         """
@@ -411,20 +717,46 @@ class MutationResolver:
         if not current_user:
             raise HTTPException(status_code=401, detail="Not authenticated")
         
-        notification = context["db"].query(Notification).filter(
-            Notification.id == id,
-            Notification.user_id == current_user.id
-        ).first()
+        result = await context["db"].execute(
+            select(Notification).where(
+                Notification.id == id,
+                Notification.user_id == current_user.id
+            )
+        )
+        notification = result.scalars().first()
         
         if not notification:
             raise HTTPException(status_code=404, detail="Notification not found")
         
+        was_unread = not notification.is_read
         notification.is_read = True
-        context["db"].commit()
+        await context["db"].commit()
+        if was_unread:
+            unread_counter.adjust(current_user.id, -1)
         return True
 
     @staticmethod
-    def refresh_token(info):
+    async def mark_all_notifications_read(info) -> int:
+        """
+        읽지 않은 알림 전체 읽음 처리 (UPDATE 한 번), 처리한 알림 수 반환
+        """
+        context = info.context
+        current_user = context["current_user"]
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        result = await context["db"].execute(
+            update(Notification)
+            .where(Notification.user_id == current_user.id, Notification.is_read.is_not(True))
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        )
+        await context["db"].commit()
+        unread_counter.adjust(current_user.id, -result.rowcount)
+        return result.rowcount
+
+    @staticmethod
+    async def refresh_token(info):
         """
         토큰 재발급
         """
@@ -439,15 +771,12 @@ class MutationResolver:
         access_token = AuthService.create_access_token(data={"sub": current_user.id})
         
         # AuthPayload 객체 생성
-        from app.schemas.types import AuthPayload, Role as GraphQLRole
-        
-        # Role enum을 GraphQL 호환 형식으로 변환
-        current_user.role = GraphQLRole(current_user.role.value) if hasattr(current_user.role, 'value') else GraphQLRole(current_user.role)
+        from app.schemas.types import AuthPayload
         
         return AuthPayload(token=access_token, user=current_user)
 
     @staticmethod
-    def update_profile(info, input):
+    async def update_profile(info, input):
         """
         프로필 업데이트 처리
         """
@@ -462,7 +791,8 @@ class MutationResolver:
         try:
             # 현재 사용자의 데이터베이스 객체 가져오기
             from app.models.models import User
-            user = db.query(User).filter(User.id == current_user.id).first()
+            result = await db.execute(select(User).where(User.id == current_user.id))
+            user = result.scalars().first()
             
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
@@ -483,10 +813,13 @@ class MutationResolver:
                     raise HTTPException(status_code=400, detail="Invalid email format")
                 
                 # 이메일 중복 확인 (현재 사용자 제외)
-                existing_user = db.query(User).filter(
-                    User.email == input.email,
-                    User.id != current_user.id
-                ).first()
+                result = await db.execute(
+                    select(User).where(
+                        User.email == input.email,
+                        User.id != current_user.id
+                    )
+                )
+                existing_user = result.scalars().first()
                 if existing_user:
                     raise HTTPException(status_code=400, detail="Email already exists")
                 
@@ -501,47 +834,111 @@ class MutationResolver:
             if updated_fields:
                 from datetime import datetime
                 user.updated_at = datetime.utcnow()
-                db.commit()
-                db.refresh(user)
+                await db.commit()
+                await db.refresh(user)
+                # 캐시된 사용자 스냅샷 무효화 (다음 요청에서 새로 조회)
+                from app.auth.token_cache import token_user_cache
+                token_user_cache.invalidate_user(user.id)
+                # 사용자 정보가 포함될 수 있는 프로젝트 응답 캐시 무효화
+                memberships = await context["project_service"].get_user_memberships(user.id)
+                await response_cache.bump(memberships)
                 print(f"✅ Profile updated for user {user.id}: {', '.join(updated_fields)}")
             else:
                 print("ℹ️ No changes to update")
             
-            # Role enum을 GraphQL 호환 형식으로 변환
-            from app.schemas.types import Role as GraphQLRole
-            user.role = GraphQLRole(user.role.value) if hasattr(user.role, 'value') else GraphQLRole(user.role)
-            
-            return user
+            return UserDTO.from_model(user)
             
         except HTTPException:
             raise
         except Exception as e:
             print(f"❌ Error updating profile: {e}")
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _subscription_user(context):
+    """
+    구독 요청의 현재 사용자 (헤더 또는 connection_init 페이로드의 토큰)
+    """
+    if context["current_user"]:
+        return context["current_user"]
+
+    from app.auth.token_cache import resolve_current_user
+    params = context.get("connection_params") or {}
+    authorization = params.get("Authorization") or params.get("authorization")
+    return await resolve_current_user(context["db"], authorization)
+
+
+async def _stream(info, topic: str, model):
+    """
+    토픽 메시지를 GraphQL 객체로 변환하여 전달
+
+    구독이 유지되는 동안 커넥션을 점유하지 않도록 요청 세션을 닫고,
+    이벤트마다 새 세션과 로더로 관계 필드를 조회한다.
+    info.context 는 이 구독 전용 복사본(SubscriptionContextMixin)이므로
+    로더 교체는 같은 연결의 다른 구독에 영향을 주지 않는다.
+    """
+    context = info.context
+    await context["db"].close()
+
+    async for message in broker.subscribe(topic):
+        async with AsyncSessionLocal() as db:
+            context["loaders"] = create_loaders(db)
+            yield to_dto(deserialize_row(model, message))
+
+
 class SubscriptionResolver:
     @staticmethod
     async def task_updated(info, project_id: str):
         """
         태스크 업데이트 실시간 알림
         """
-        # 실제 구현에서는 Redis나 WebSocket을 사용
-        pass
+        context = info.context
+        current_user = await _subscription_user(context)
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, project_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        async for task in _stream(info, project_tasks_topic(project_id), Task):
+            yield task
 
     @staticmethod
     async def new_comment(info, task_id: str):
         """
         새 댓글 실시간 알림
         """
-        # 실제 구현에서는 Redis나 WebSocket을 사용
-        pass
+        context = info.context
+        current_user = await _subscription_user(context)
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        task = await context["task_service"].get_task(task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, task.project_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        async for comment in _stream(info, task_comments_topic(task_id), Comment):
+            yield comment
 
     @staticmethod
     async def project_activity(info, project_id: str):
         """
         프로젝트 활동 실시간 알림
         """
-        # 실제 구현에서는 Redis나 WebSocket을 사용
-        pass
\ No newline at end of file
+        context = info.context
+        current_user = await _subscription_user(context)
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        
+        # 프로젝트 접근 권한 확인
+        if not await context["project_service"].has_project_access(current_user.id, project_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        async for activity in _stream(info, project_activity_topic(project_id), Activity):
+            yield activity
\ No newline at end of file
@@ -1,108 +1,175 @@
 import strawberry
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 from app.schemas.types import *
 from app.resolvers.resolvers import QueryResolver, MutationResolver, SubscriptionResolver
+from app.extensions.session_extension import DatabaseSessionExtension
+from app.extensions.persisted_queries import DocumentCacheExtension
+from app.extensions.query_cost import QueryCostExtension
+from app.extensions.sql_instrumentation import SQLInstrumentationExtension
+from app.extensions.resolver_profiling import ResolverProfilingExtension
+from app.cache.response_cache import ResponseCacheExtension
 
 
 # Query Type
 @strawberry.type
 class Query:
     @strawberry.field
-    def me(self, info) -> Optional[User]:
-        return QueryResolver.me(info)
+    async def me(self, info) -> Optional[User]:
+        return await QueryResolver.me(info)
 
     @strawberry.field
-    def projects(self, info) -> List[Project]:
-        return QueryResolver.projects(info)
+    async def projects(self, info) -> List[Project]:
+        return await QueryResolver.projects(info)
 
     @strawberry.field
-    def project(self, info, id: str) -> Optional[Project]:
-        return QueryResolver.project(info, id)
+    async def project(self, info, id: str) -> Optional[Project]:
+        return await QueryResolver.project(info, id)
 
     @strawberry.field
-    def tasks(self, info, projectId: str, filter: Optional[TaskFilter] = None) -> List[Task]:
-        return QueryResolver.tasks(info, projectId, filter)
+    async def tasks(self, info, projectId: str, filter: Optional[TaskFilter] = None) -> List[Task]:
+        return await QueryResolver.tasks(info, projectId, filter)
 
     @strawberry.field
-    def task(self, info, id: str) -> Optional[Task]:
-        return QueryResolver.task(info, id)
+    async def task(self, info, id: str) -> Optional[Task]:
+        return await QueryResolver.task(info, id)
 
     @strawberry.field
-    def notifications(self, info) -> List[Notification]:
-        return QueryResolver.notifications(info)
+    async def notifications(self, info) -> List[Notification]:
+        return await QueryResolver.notifications(info)
+
+    @strawberry.field
+    async def tasksConnection(self, info, projectId: str, filter: Optional[TaskFilter] = None,
+                        first: Optional[int] = None, after: Optional[str] = None) -> Connection[Task]:
+        return await QueryResolver.tasks_connection(info, projectId, filter, first, after)
+
+    @strawberry.field
+    async def searchTasks(self, info, projectId: str, query: str, first: Optional[int] = None,
+                    after: Optional[str] = None) -> Connection[TaskSearchResult]:
+        return await QueryResolver.search_tasks(info, projectId, query, first, after)
+
+    @strawberry.field
+    async def taskComments(self, info, taskId: str, first: Optional[int] = None,
+                     after: Optional[str] = None) -> Connection[Comment]:
+        return await QueryResolver.task_comments(info, taskId, first, after)
+
+    @strawberry.field
+    async def taskActivities(self, info, taskId: str, first: Optional[int] = None,
+                       after: Optional[str] = None) -> Connection[Activity]:
+        return await QueryResolver.task_activities(info, taskId, first, after)
+
+    @strawberry.field
+    async def projectStats(self, info, projectId: str) -> ProjectStats:
+        return await QueryResolver.project_stats(info, projectId)
+
+    @strawberry.field
+    async def notificationsConnection(self, info, first: Optional[int] = None,
+                                after: Optional[str] = None) -> Connection[Notification]:
+        return await QueryResolver.notifications_connection(info, first, after)
+
+    @strawberry.field
+    async def unreadNotificationCount(self, info) -> int:
+        return await QueryResolver.unread_notification_count(info)
+
+    @strawberry.field
+    async def changesSince(self, info, projectId: str, cursor: Optional[str] = None,
+                           first: Optional[int] = None) -> ChangeSet:
+        return await QueryResolver.changes_since(info, projectId, cursor, first)
 
 
 # Mutation Type
 @strawberry.type
 class Mutation:
     @strawberry.field
-    def login(self, info, input: LoginInput) -> AuthPayload:
-        return MutationResolver.login(info, input)
+    async def login(self, info, input: LoginInput) -> AuthPayload:
+        return await MutationResolver.login(info, input)
+
+    @strawberry.field
+    async def register(self, info, input: RegisterInput) -> AuthPayload:
+        return await MutationResolver.register(info, input)
 
     @strawberry.field
-    def register(self, info, input: RegisterInput) -> AuthPayload:
-        return MutationResolver.register(info, input)
+    async def createProject(self, info, input: CreateProjectInput) -> Project:
+        return await MutationResolver.create_project(info, input)
 
     @strawberry.field
-    def createProject(self, info, input: CreateProjectInput) -> Project:
-        return MutationResolver.create_project(info, input)
+    async def updateProject(self, info, id: str, input: UpdateProjectInput) -> Project:
+        return await MutationResolver.update_project(info, id, input)
 
     @strawberry.field
-    def updateProject(self, info, id: str, input: UpdateProjectInput) -> Project:
-        return MutationResolver.update_project(info, id, input)
+    async def deleteProject(self, info, id: str) -> bool:
+        return await MutationResolver.delete_project(info, id)
 
     @strawberry.field
-    def deleteProject(self, info, id: str) -> bool:
-        return MutationResolver.delete_project(info, id)
+    async def createTask(self, info, input: CreateTaskInput) -> Task:
+        return await MutationResolver.create_task(info, input)
 
     @strawberry.field
-    def createTask(self, info, input: CreateTaskInput) -> Task:
-        return MutationResolver.create_task(info, input)
+    async def updateTask(self, info, id: str, input: UpdateTaskInput) -> Task:
+        return await MutationResolver.update_task(info, id, input)
 
     @strawberry.field
-    def updateTask(self, info, id: str, input: UpdateTaskInput) -> Task:
-        return MutationResolver.update_task(info, id, input)
+    async def deleteTask(self, info, id: str) -> bool:
+        return await MutationResolver.delete_task(info, id)
 
     @strawberry.field
-    def deleteTask(self, info, id: str) -> bool:
-        return MutationResolver.delete_task(info, id)
+    async def bulkCreateTasks(self, info, inputs: List[CreateTaskInput]) -> List[Task]:
+        return await MutationResolver.bulk_create_tasks(info, inputs)
 
     @strawberry.field
-    def addComment(self, info, taskId: str, content: str) -> Comment:
-        return MutationResolver.add_comment(info, taskId, content)
+    async def bulkUpdateTasks(self, info, updates: List[BulkUpdateTaskInput]) -> List[Task]:
+        return await MutationResolver.bulk_update_tasks(info, updates)
 
     @strawberry.field
-    def markNotificationRead(self, info, id: str) -> bool:
-        return MutationResolver.mark_notification_read(info, id)
+    async def moveTasks(self, info, taskIds: List[str], status: TaskStatus) -> List[Task]:
+        return await MutationResolver.move_tasks(info, taskIds, status)
+
+    @strawberry.field
+    async def addComment(self, info, taskId: str, content: str) -> Comment:
+        return await MutationResolver.add_comment(info, taskId, content)
+
+    @strawberry.field
+    async def markNotificationRead(self, info, id: str) -> bool:
+        return await MutationResolver.mark_notification_read(info, id)
+    
+    @strawberry.field
+    async def markAllNotificationsRead(self, info) -> int:
+        return await MutationResolver.mark_all_notifications_read(info)
     
     @strawberry.field
-    def refreshToken(self, info) -> AuthPayload:
-        return MutationResolver.refresh_token(info)
+    async def refreshToken(self, info) -> AuthPayload:
+        return await MutationResolver.refresh_token(info)
     
     @strawberry.field
-    def updateProfile(self, info, input: UpdateProfileInput) -> User:
-        return MutationResolver.update_profile(info, input)
+    async def updateProfile(self, info, input: UpdateProfileInput) -> User:
+        return await MutationResolver.update_profile(info, input)
 
 
 # Subscription Type
 @strawberry.type
 class Subscription:
     @strawberry.subscription
-    async def task_updated(self, info, project_id: str) -> Task:
-        return SubscriptionResolver.task_updated(info, project_id)
+    async def task_updated(self, info, project_id: str) -> AsyncGenerator[Task, None]:
+        async for item in SubscriptionResolver.task_updated(info, project_id):
+            yield item
 
     @strawberry.subscription
-    async def new_comment(self, info, task_id: str) -> Comment:
-        return SubscriptionResolver.new_comment(info, task_id)
+    async def new_comment(self, info, task_id: str) -> AsyncGenerator[Comment, None]:
+        async for item in SubscriptionResolver.new_comment(info, task_id):
+            yield item
 
     @strawberry.subscription
-    async def project_activity(self, info, project_id: str) -> Activity:
-        return SubscriptionResolver.project_activity(info, project_id)
+    async def project_activity(self, info, project_id: str) -> AsyncGenerator[Activity, None]:
+        async for item in SubscriptionResolver.project_activity(info, project_id):
+            yield item
 
 
 # Schema
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
-    subscription=Subscription
+    subscription=Subscription,
+    extensions=[
+        SQLInstrumentationExtension, ResolverProfilingExtension, DocumentCacheExtension,
+        QueryCostExtension, ResponseCacheExtension, DatabaseSessionExtension,
+    ],
 )
\ No newline at end of file
@@ -1,9 +1,13 @@
 import strawberry
-from typing import List, Optional
+from strawberry.types import Info
+from typing import Generic, List, Optional, TypeVar
 from datetime import datetime
 from enum import Enum
 
 
+T = TypeVar("T")
+
+
 @strawberry.enum
 class Role(Enum):
     ADMIN = "ADMIN"
@@ -50,11 +54,19 @@ class Project:
 @strawberry.type
 class ProjectMember:
     id: str
-    user: User
-    project: Project
+    user_id: strawberry.Private[str]
+    project_id: strawberry.Private[str]
     role: Role
     joined_at: datetime
 
+    @strawberry.field
+    async def user(self, info: Info) -> User:
+        return await info.context["loaders"]["user"].load(self.user_id)
+
+    @strawberry.field
+    async def project(self, info: Info) -> Project:
+        return await info.context["loaders"]["project"].load(self.project_id)
+
 
 @strawberry.type
 class Task:
@@ -63,23 +75,41 @@ class Task:
     description: Optional[str] = None
     status: TaskStatus
     priority: Priority
-    assignee: Optional[User] = None
-    project: Project
+    assignee_id: strawberry.Private[Optional[str]] = None
+    project_id: strawberry.Private[str]
     due_date: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
+    @strawberry.field
+    async def assignee(self, info: Info) -> Optional[User]:
+        if not self.assignee_id:
+            return None
+        return await info.context["loaders"]["user"].load(self.assignee_id)
+
+    @strawberry.field
+    async def project(self, info: Info) -> Project:
+        return await info.context["loaders"]["project"].load(self.project_id)
+
 
 @strawberry.type
 class Comment:
     id: str
     content: str
-    author: User
-    task: Task
+    author_id: strawberry.Private[str]
+    task_id: strawberry.Private[str]
     created_at: datetime
     updated_at: datetime
 
+    @strawberry.field
+    async def author(self, info: Info) -> User:
+        return await info.context["loaders"]["user"].load(self.author_id)
+
+    @strawberry.field
+    async def task(self, info: Info) -> Task:
+        return await info.context["loaders"]["task"].load(self.task_id)
+
 
 @strawberry.type
 class Attachment:
@@ -97,21 +127,41 @@ class Activity:
     id: str
     action: str
     description: str
-    user: User
-    task: Optional[Task] = None
-    project: Optional[Project] = None
+    user_id: strawberry.Private[str]
+    task_id: strawberry.Private[Optional[str]] = None
+    project_id: strawberry.Private[Optional[str]] = None
     created_at: datetime
 
+    @strawberry.field
+    async def user(self, info: Info) -> User:
+        return await info.context["loaders"]["user"].load(self.user_id)
+
+    @strawberry.field
+    async def task(self, info: Info) -> Optional[Task]:
+        if not self.task_id:
+            return None
+        return await info.context["loaders"]["task"].load(self.task_id)
+
+    @strawberry.field
+    async def project(self, info: Info) -> Optional[Project]:
+        if not self.project_id:
+            return None
+        return await info.context["loaders"]["project"].load(self.project_id)
+
 
 @strawberry.type
 class Notification:
     id: str
     title: str
     message: str
-    user: User
+    user_id: strawberry.Private[str]
     is_read: bool
     created_at: datetime
 
+    @strawberry.field
+    async def user(self, info: Info) -> User:
+        return await info.context["loaders"]["user"].load(self.user_id)
+
 
 @strawberry.type
 class ProjectStats:
@@ -122,6 +172,54 @@ class ProjectStats:
     completion_rate: float
 
 
+@strawberry.type
+class TaskSearchResult:
+    task: Task
+    rank: float
+    title_highlight: str
+    snippet: str
+
+
+# Delta Sync Types
+@strawberry.type
+class Tombstone:
+    entity_type: str
+    id: str
+    deleted_at: datetime
+
+
+@strawberry.type
+class ChangeSet:
+    project: Optional[Project]
+    tasks: List[Task]
+    comments: List[Comment]
+    activities: List[Activity]
+    tombstones: List[Tombstone]
+    cursor: str
+    has_more: bool
+
+
+# Pagination Types (Relay Connection)
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str] = None
+    end_cursor: Optional[str] = None
+
+
+@strawberry.type
+class Edge(Generic[T]):
+    cursor: str
+    node: T
+
+
+@strawberry.type
+class Connection(Generic[T]):
+    edges: List[Edge[T]]
+    page_info: PageInfo
+
+
 # Input Types
 @strawberry.input
 class CreateProjectInput:
@@ -155,6 +253,12 @@ class UpdateTaskInput:
     dueDate: Optional[datetime] = None
 
 
+@strawberry.input
+class BulkUpdateTaskInput:
+    id: str
+    input: UpdateTaskInput
+
+
 @strawberry.input
 class TaskFilter:
     status: Optional[TaskStatus] = None
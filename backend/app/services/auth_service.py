@@ -1,65 +1,68 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.models.models import User, Role
 from app.auth.auth import AuthService
+from app.auth.hashing import password_hasher
 
 
 class AuthServiceDB:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.auth_service = AuthService()
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """
         사용자 인증
         """
-        user = self.db.query(User).filter(User.email == email).first()
+        user = await self.get_user_by_email(email)
         if not user:
             return None
         
-        if not self.auth_service.verify_password(password, user.password_hash):
+        # bcrypt 검증은 해싱 워커 풀에서 실행 (이벤트 루프 차단 방지)
+        if not await password_hasher.verify(password, user.password_hash):
             return None
         
         return user
 
-    def create_user(self, input) -> User:
+    async def create_user(self, input) -> User:
         """
         새 사용자 생성
         """
         # 이메일 중복 확인
         email = input.get("email") if isinstance(input, dict) else input.email
-        existing_user = self.db.query(User).filter(User.email == email).first()
+        existing_user = await self.get_user_by_email(email)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
-        return self._create_new_user(input)
+        return await self._create_new_user(input)
     
-    def create_user_if_not_exists(self, input) -> User:
+    async def create_user_if_not_exists(self, input) -> User:
         """
         사용자가 없으면 생성, 있으면 기존 사용자 반환
         """
         # 이메일 중복 확인
         email = input.get("email") if isinstance(input, dict) else input.email
-        existing_user = self.db.query(User).filter(User.email == email).first()
+        existing_user = await self.get_user_by_email(email)
         if existing_user:
             return existing_user
         
-        return self._create_new_user(input)
+        return await self._create_new_user(input)
     
-    def _create_new_user(self, input) -> User:
+    async def _create_new_user(self, input) -> User:
         """
         실제 사용자 생성 로직
         """
         email = input.get("email") if isinstance(input, dict) else input.email
         
-        # 비밀번호 해싱
+        # 비밀번호 해싱 (해싱 워커 풀에서 실행)
         password = input.get("password") if isinstance(input, dict) else input.password
-        hashed_password = self.auth_service.hash_password(password)
+        hashed_password = await password_hasher.hash(password)
         
         # 새 사용자 생성
         name = input.get("name") if isinstance(input, dict) else input.name
@@ -71,27 +74,30 @@ class AuthServiceDB:
         )
         
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         
         return user
 
-    def get_current_user(self) -> Optional[User]:
+    async def get_current_user(self) -> Optional[User]:
         """
         현재 인증된 사용자 반환
         TODO: 실제 구현에서는 JWT 토큰을 통해 현재 사용자 확인
         """
         # 임시로 첫 번째 사용자 반환 (개발용)
-        return self.db.query(User).first()
+        result = await self.db.execute(select(User).limit(1))
+        return result.scalars().first()
 
-    def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """
         ID로 사용자 조회
         """
-        return self.db.query(User).filter(User.id == user_id).first()
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         이메일로 사용자 조회
         """
-        return self.db.query(User).filter(User.email == email).first()
\ No newline at end of file
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
\ No newline at end of file
@@ -0,0 +1,62 @@
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+
+# 페이지 크기 설정
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(row: Any) -> str:
+    """
+    (created_at, id) 키를 불투명한 커서 문자열로 인코딩
+    """
+    raw = f"{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    커서 문자열을 (created_at, id) 키로 디코딩
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(db: AsyncSession, stmt: Select, model, first: Optional[int] = None,
+                   after: Optional[str] = None, descending: bool = True, dto=None,
+                   fields: Optional[List[str]] = None) -> Tuple[List[Any], bool]:
+    """
+    (created_at, id) 키셋 조건으로 한 페이지를 조회
+
+    OFFSET 대신 마지막 커서 이후의 행만 인덱스 범위로 읽으므로
+    스크롤 깊이와 무관하게 페이지 비용이 일정하다.
+    dto를 지정하면 stmt는 dto.columns(fields)를 조회해야 하며 행을 DTO로 변환한다.
+    반환값은 (행 목록, 다음 페이지 존재 여부)
+    """
+    limit = min(max(first or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+    key = tuple_(model.created_at, model.id)
+
+    if after:
+        created_at, row_id = decode_cursor(after)
+        if descending:
+            stmt = stmt.where(key < tuple_(created_at, row_id))
+        else:
+            stmt = stmt.where(key > tuple_(created_at, row_id))
+
+    if descending:
+        stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        stmt = stmt.order_by(model.created_at.asc(), model.id.asc())
+
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    result = await db.execute(stmt.limit(limit + 1))
+    rows = dto.from_rows(result.all(), fields) if dto is not None else result.scalars().all()
+    return list(rows[:limit]), len(rows) > limit
@@ -1,75 +1,61 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+import asyncio
+from typing import Dict, List, Optional
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.models.models import Project, ProjectMember, User, Role
+from app.models.models import (
+    Project, ProjectMember, ProjectCounter, User, Role, Task, Comment, Attachment, Activity,
+)
 from app.schemas.types import CreateProjectInput, UpdateProjectInput
+from app.dto.dto import ProjectDTO
+from app.services.sync_service import SyncService
 
 
 class ProjectService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        self.sync = SyncService(db)
+        # 요청 범위 멤버십 맵 (user_id → {project_id → role} 조회 Future)
+        # 서비스는 요청마다 생성되므로 한 요청 안에서만 재사용된다.
+        # 동시에 실행되는 필드 리졸버들이 같은 조회를 기다리도록 Future를 저장한다.
+        self._memberships: Dict[str, "asyncio.Future[Dict[str, Role]]"] = {}
 
-    def get_user_projects(self, user_id: str) -> List[Project]:
+    async def get_user_projects(self, user_id: str) -> List[ProjectDTO]:
         """
         사용자가 속한 프로젝트들 반환
         """
-        try:
-            print(f"🔍 get_user_projects for user: {user_id}")
-            
-            # ProjectMember와 Project를 JOIN하여 가져오기
-            from sqlalchemy.orm import joinedload
-            
-            project_members = self.db.query(ProjectMember).options(
-                joinedload(ProjectMember.project)
-            ).filter(
+        print(f"🔍 get_user_projects for user: {user_id}")
+        
+        # ProjectMember(user_id 인덱스)에서 시작해 Project를 붙여 프로젝트 컬럼만 DTO로 가져오기
+        # (LEFT OUTER JOIN은 조인 순서가 고정되어 멤버십 인덱스를 먼저 사용한다)
+        result = await self.db.execute(
+            select(*ProjectDTO.columns()).select_from(ProjectMember).outerjoin(
+                Project, Project.id == ProjectMember.project_id
+            ).where(
                 ProjectMember.user_id == user_id
-            ).all()
-            
-            print(f"🔍 Found {len(project_members)} project members")
-            
-            projects = []
-            for member in project_members:
-                if member.project:
-                    projects.append(member.project)
-                    print(f"✅ Added project: {member.project.name}")
-            
-            print(f"✅ Returning {len(projects)} projects")
-            return projects
-            
-        except Exception as e:
-            print(f"❌ Error in get_user_projects: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            # 대안: 직접 JOIN 쿼리 사용
-            try:
-                projects = self.db.query(Project).join(
-                    ProjectMember, Project.id == ProjectMember.project_id
-                ).filter(
-                    ProjectMember.user_id == user_id
-                ).all()
-                
-                print(f"✅ Alternative query returned {len(projects)} projects")
-                return projects
-                
-            except Exception as e2:
-                print(f"❌ Alternative query also failed: {e2}")
-                return []
+            )
+        )
+        projects = [project for project in ProjectDTO.from_rows(result.all()) if project.id is not None]
+        
+        print(f"✅ Returning {len(projects)} projects")
+        return projects
     
-    def get_all_projects(self) -> List[Project]:
+    async def get_all_projects(self) -> List[Project]:
         """
         모든 프로젝트 반환 (개발용)
         """
-        return self.db.query(Project).all()
+        result = await self.db.execute(select(Project))
+        return list(result.scalars().all())
 
-    def get_project(self, project_id: str) -> Optional[Project]:
+    async def get_project(self, project_id: str) -> Optional[Project]:
         """
         프로젝트 조회
         """
-        return self.db.query(Project).filter(Project.id == project_id).first()
+        result = await self.db.execute(select(Project).where(Project.id == project_id))
+        return result.scalars().first()
 
-    def create_project(self, user_id: str, input: CreateProjectInput) -> Project:
+    async def create_project(self, user_id: str, input: CreateProjectInput) -> Project:
         """
         프로젝트 생성
         """
@@ -80,8 +66,8 @@ class ProjectService:
         )
         
         self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        await self.db.commit()
+        await self.db.refresh(project)
         
         # 생성자를 매니저로 추가
         project_member = ProjectMember(
@@ -91,15 +77,21 @@ class ProjectService:
         )
         
         self.db.add(project_member)
-        self.db.commit()
+        
+        # 빈 태스크 카운터 생성
+        self.db.add(ProjectCounter(project_id=project.id))
+        self.sync.touch(project.id, "project", [project.id], new=True)
+        await self.sync.flush()
+        await self.db.commit()
+        self._memberships.pop(user_id, None)
         
         return project
 
-    def update_project(self, project_id: str, input: UpdateProjectInput) -> Project:
+    async def update_project(self, project_id: str, input: UpdateProjectInput) -> Project:
         """
         프로젝트 수정
         """
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+        project = await self.get_project(project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
@@ -108,60 +100,102 @@ class ProjectService:
         if input.description is not None:
             project.description = input.description
         
-        self.db.commit()
-        self.db.refresh(project)
+        self.sync.touch(project.id, "project", [project.id])
+        await self.sync.flush()
+        await self.db.commit()
+        await self.db.refresh(project)
         
         return project
 
-    def delete_project(self, project_id: str) -> bool:
+    async def delete_project(self, project_id: str) -> bool:
         """
         프로젝트 삭제
         """
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+        project = await self.get_project(project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        # 관련 데이터 삭제 (멤버, 태스크 등)
-        self.db.query(ProjectMember).filter(ProjectMember.project_id == project_id).delete()
-        self.db.delete(project)
-        self.db.commit()
+        # 관련 데이터 삭제 (태스크와 댓글/첨부파일/활동 로그, 멤버, 카운터)
+        project_task_ids = select(Task.id).where(Task.project_id == project_id)
+        await self.db.execute(delete(Comment).where(Comment.task_id.in_(project_task_ids)))
+        await self.db.execute(delete(Attachment).where(Attachment.task_id.in_(project_task_ids)))
+        await self.db.execute(delete(Activity).where(Activity.project_id == project_id))
+        await self.db.execute(delete(Task).where(Task.project_id == project_id))
+        member_ids = (await self.db.execute(
+            select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+        )).scalars().all()
+        await self.db.execute(delete(ProjectMember).where(ProjectMember.project_id == project_id))
+        await self.db.execute(delete(ProjectCounter).where(ProjectCounter.project_id == project_id))
+        
+        # 변경 로그는 프로젝트 tombstone 한 행만 남김 (하위 엔티티 삭제를 함께 나타냄)
+        # 이전 멤버 기록도 남겨 tombstone은 그 사용자들에게만 보여준다
+        await self.sync.purge_project(project_id)
+        self.sync.tombstone(project_id, "project", [project_id])
+        self.sync.tombstone_members(project_id, list(member_ids))
+        await self.sync.flush()
+        
+        await self.db.delete(project)
+        await self.db.commit()
+        # 여러 사용자의 멤버십이 함께 삭제됨
+        self._memberships.clear()
         
         return True
 
-    def has_project_access(self, user_id: str, project_id: str) -> bool:
+    async def _get_membership(self, user_id: str, project_id: str) -> Optional[ProjectMember]:
+        """
+        사용자의 프로젝트 멤버십 조회
+        """
+        result = await self.db.execute(
+            select(ProjectMember).where(
+                ProjectMember.user_id == user_id,
+                ProjectMember.project_id == project_id
+            )
+        )
+        return result.scalars().first()
+
+    async def get_user_memberships(self, user_id: str) -> Dict[str, Role]:
+        """
+        사용자의 프로젝트별 역할 (project_id → role)
+
+        요청마다 한 번만 조회하고 이후 권한 확인은 이 맵에서 처리한다.
+        """
+        memberships = self._memberships.get(user_id)
+        if memberships is None:
+            memberships = self._memberships[user_id] = asyncio.ensure_future(self._load_memberships(user_id))
+        try:
+            return await asyncio.shield(memberships)
+        except Exception:
+            # 실패한 조회는 다음 호출에서 다시 시도
+            if self._memberships.get(user_id) is memberships:
+                del self._memberships[user_id]
+            raise
+
+    async def _load_memberships(self, user_id: str) -> Dict[str, Role]:
+        result = await self.db.execute(
+            select(ProjectMember.project_id, ProjectMember.role).where(ProjectMember.user_id == user_id)
+        )
+        return {project_id: role for project_id, role in result.all()}
+
+    async def has_project_access(self, user_id: str, project_id: str) -> bool:
         """
         사용자가 프로젝트에 접근 권한이 있는지 확인
         """
-        member = self.db.query(ProjectMember).filter(
-            ProjectMember.user_id == user_id,
-            ProjectMember.project_id == project_id
-        ).first()
-        
-        return member is not None
+        return project_id in await self.get_user_memberships(user_id)
 
-    def has_project_manage_access(self, user_id: str, project_id: str) -> bool:
+    async def has_project_manage_access(self, user_id: str, project_id: str) -> bool:
         """
         사용자가 프로젝트 관리 권한이 있는지 확인 (매니저 이상)
         """
-        member = self.db.query(ProjectMember).filter(
-            ProjectMember.user_id == user_id,
-            ProjectMember.project_id == project_id
-        ).first()
-        
-        if not member:
-            return False
+        role = (await self.get_user_memberships(user_id)).get(project_id)
         
-        return member.role in [Role.MANAGER, Role.ADMIN]
+        return role in [Role.MANAGER, Role.ADMIN]
 
-    def add_member(self, project_id: str, user_id: str, role: Role = Role.MEMBER) -> ProjectMember:
+    async def add_member(self, project_id: str, user_id: str, role: Role = Role.MEMBER) -> ProjectMember:
         """
         프로젝트에 멤버 추가
         """
         # 이미 멤버인지 확인
-        existing_member = self.db.query(ProjectMember).filter(
-            ProjectMember.user_id == user_id,
-            ProjectMember.project_id == project_id
-        ).first()
+        existing_member = await self._get_membership(user_id, project_id)
         
         if existing_member:
             raise HTTPException(
@@ -176,32 +210,34 @@ class ProjectService:
         )
         
         self.db.add(member)
-        self.db.commit()
-        self.db.refresh(member)
+        await self.db.commit()
+        await self.db.refresh(member)
+        self._memberships.pop(user_id, None)
         
         return member
 
-    def remove_member(self, project_id: str, user_id: str) -> bool:
+    async def remove_member(self, project_id: str, user_id: str) -> bool:
         """
         프로젝트에서 멤버 제거
         """
-        member = self.db.query(ProjectMember).filter(
-            ProjectMember.user_id == user_id,
-            ProjectMember.project_id == project_id
-        ).first()
+        member = await self._get_membership(user_id, project_id)
         
         if not member:
             raise HTTPException(status_code=404, detail="Member not found")
         
-        self.db.delete(member)
-        self.db.commit()
+        await self.db.delete(member)
+        await self.db.commit()
+        self._memberships.pop(user_id, None)
         
         return True
 
-    def get_project_members(self, project_id: str) -> List[ProjectMember]:
+    async def get_project_members(self, project_id: str) -> List[ProjectMember]:
         """
         프로젝트 멤버들 조회
         """
-        return self.db.query(ProjectMember).filter(
-            ProjectMember.project_id == project_id
-        ).all()
\ No newline at end of file
+        result = await self.db.execute(
+            select(ProjectMember).where(
+                ProjectMember.project_id == project_id
+            )
+        )
+        return list(result.scalars().all())
\ No newline at end of file
@@ -0,0 +1,355 @@
+import base64
+from typing import List, Optional, Tuple
+from sqlalchemy import select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+
+from app.models.models import Task
+from app.dto.dto import TaskDTO
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, paginate
+
+# 하이라이트 태그
+HIGHLIGHT_OPEN = "<b>"
+HIGHLIGHT_CLOSE = "</b>"
+
+# bm25 컬럼 가중치 (task_id, project_id, title, description, comments)
+BM25_WEIGHTS = "0.0, 0.0, 10.0, 4.0, 1.0"
+
+# FTS5 인덱스 및 동기화 트리거 DDL
+# - 태스크 1건과 댓글 1건이 각각 tasks_fts 의 한 행이다 (댓글 행은 title/description 이 비어 있음).
+#   댓글 쓰기는 해당 댓글 행만 넣고/고치고/지운다.
+# - tasks 는 문자열 기본 키라 암시적 rowid 를 VACUUM 이 다시 매길 수 있으므로 그 값에 의존하지 않는다.
+#   search_keys(rowid INTEGER PRIMARY KEY = tasks_fts.rowid, entity_id = 태스크/댓글 ID)가
+#   트리거의 ID → FTS 행 조회를 맡으며, INTEGER PRIMARY KEY 는 VACUUM 후에도 유지된다.
+SEARCH_INDEX_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS search_keys (
+        rowid INTEGER PRIMARY KEY,
+        entity_id TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        task_id UNINDEXED,
+        project_id UNINDEXED,
+        title,
+        description,
+        comments,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_after_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO search_keys (entity_id) VALUES (new.id);
+        INSERT INTO tasks_fts (rowid, task_id, project_id, title, description, comments)
+        SELECT rowid, new.id, new.project_id, new.title, coalesce(new.description, ''), ''
+        FROM search_keys WHERE entity_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_after_update
+    AFTER UPDATE OF title, description, project_id ON tasks BEGIN
+        UPDATE tasks_fts
+        SET project_id = new.project_id, title = new.title, description = coalesce(new.description, '')
+        WHERE rowid = (SELECT rowid FROM search_keys WHERE entity_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_after_move
+    AFTER UPDATE OF project_id ON tasks WHEN new.project_id IS NOT old.project_id BEGIN
+        UPDATE tasks_fts SET project_id = new.project_id
+        WHERE rowid IN (
+            SELECT k.rowid FROM comments c JOIN search_keys k ON k.entity_id = c.id WHERE c.task_id = new.id
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_after_delete AFTER DELETE ON tasks BEGIN
+        DELETE FROM tasks_fts WHERE rowid = (SELECT rowid FROM search_keys WHERE entity_id = old.id);
+        DELETE FROM search_keys WHERE entity_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_fts_after_insert AFTER INSERT ON comments BEGIN
+        INSERT INTO search_keys (entity_id) VALUES (new.id);
+        INSERT INTO tasks_fts (rowid, task_id, project_id, title, description, comments)
+        SELECT k.rowid, new.task_id, t.project_id, '', '', new.content
+        FROM search_keys k, tasks t
+        WHERE k.entity_id = new.id AND t.id = new.task_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_fts_after_update AFTER UPDATE OF content ON comments BEGIN
+        UPDATE tasks_fts SET comments = new.content
+        WHERE rowid = (SELECT rowid FROM search_keys WHERE entity_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_fts_after_delete AFTER DELETE ON comments BEGIN
+        DELETE FROM tasks_fts WHERE rowid = (SELECT rowid FROM search_keys WHERE entity_id = old.id);
+        DELETE FROM search_keys WHERE entity_id = old.id;
+    END
+    """,
+]
+
+# 검색 인덱스 트리거 이름 (이전 형식 인덱스 교체/삭제용)
+SEARCH_INDEX_TRIGGERS = [
+    "tasks_fts_after_insert",
+    "tasks_fts_after_update",
+    "tasks_fts_after_move",
+    "tasks_fts_after_delete",
+    "comments_fts_after_insert",
+    "comments_fts_after_update",
+    "comments_fts_after_delete",
+]
+
+
+def is_search_supported(bind) -> bool:
+    """
+    FTS5 검색 인덱스 사용 가능 여부 (SQLite 전용)
+    """
+    return bind.dialect.name == "sqlite"
+
+
+def create_search_index(engine: Engine):
+    """
+    FTS5 검색 인덱스와 동기화 트리거 생성
+
+    인덱스가 새로 만들어진 경우 기존 태스크/댓글로 채운다.
+    tasks.rowid 로 연결하던 이전 형식 인덱스(search_keys 없음)는 삭제 후 다시 만든다.
+    """
+    if not is_search_supported(engine):
+        return
+
+    with engine.begin() as conn:
+        tables = {
+            row[0] for row in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('tasks_fts', 'search_keys')"
+            )
+        }
+        if "tasks_fts" in tables and "search_keys" not in tables:
+            print("🔄 이전 형식의 검색 인덱스를 다시 만듭니다...")
+            _drop_search_index(conn)
+            tables = set()
+        for ddl in SEARCH_INDEX_DDL:
+            conn.exec_driver_sql(ddl)
+        if "tasks_fts" not in tables:
+            _populate_search_index(conn)
+
+
+def rebuild_search_index(engine: Engine):
+    """
+    검색 인덱스를 tasks/comments 테이블 기준으로 다시 생성 (인덱스 손상 복구 등)
+    """
+    if not is_search_supported(engine):
+        return
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM tasks_fts")
+        conn.exec_driver_sql("DELETE FROM search_keys")
+        _populate_search_index(conn)
+
+
+def drop_search_index(engine: Engine):
+    """
+    검색 인덱스 삭제 (개발용)
+    """
+    if not is_search_supported(engine):
+        return
+
+    with engine.begin() as conn:
+        _drop_search_index(conn)
+
+
+def _drop_search_index(conn):
+    for trigger in SEARCH_INDEX_TRIGGERS:
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.exec_driver_sql("DROP TABLE IF EXISTS tasks_fts")
+    conn.exec_driver_sql("DROP TABLE IF EXISTS search_keys")
+
+
+def _populate_search_index(conn):
+    """
+    기존 태스크와 댓글로 검색 인덱스 채우기 (태스크/댓글마다 한 행)
+    """
+    conn.exec_driver_sql("INSERT INTO search_keys (entity_id) SELECT id FROM tasks")
+    conn.exec_driver_sql("INSERT INTO search_keys (entity_id) SELECT id FROM comments")
+    conn.exec_driver_sql("""
+        INSERT INTO tasks_fts (rowid, task_id, project_id, title, description, comments)
+        SELECT k.rowid, t.id, t.project_id, t.title, coalesce(t.description, ''), ''
+        FROM tasks t JOIN search_keys k ON k.entity_id = t.id
+    """)
+    conn.exec_driver_sql("""
+        INSERT INTO tasks_fts (rowid, task_id, project_id, title, description, comments)
+        SELECT k.rowid, c.task_id, t.project_id, '', '', c.content
+        FROM comments c
+        JOIN tasks t ON t.id = c.task_id
+        JOIN search_keys k ON k.entity_id = c.id
+    """)
+
+
+def build_match_terms(search: str) -> List[str]:
+    """
+    사용자 입력을 안전한 FTS5 MATCH 식(단어별)으로 변환
+
+    각 단어를 따옴표로 감싸 연산자 해석을 막고, 접두어 검색(*)으로
+    조사가 붙은 단어("태스크를")도 찾을 수 있게 한다.
+    """
+    terms = [term.replace('"', '""') for term in search.split()]
+    return [f'"{term}"*' for term in terms]
+
+
+def _matching_task_ids_sql(term_count: int) -> str:
+    """
+    모든 검색어가 (태스크 본문이든 댓글이든) 어딘가에 나오는 태스크 ID 쿼리
+
+    태스크와 댓글이 서로 다른 FTS 행이므로, 검색어별 태스크 집합의 교집합으로 AND 를 구한다.
+    바인드 파라미터: :project_id, :term0 ... :termN
+    """
+    return " INTERSECT ".join(
+        f"SELECT task_id FROM tasks_fts WHERE tasks_fts MATCH :term{i} AND project_id = :project_id"
+        for i in range(term_count)
+    )
+
+
+def _encode_search_cursor(score: float, task_id: str) -> str:
+    raw = f"{score!r}|{task_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        score, task_id = raw.split("|", 1)
+        return float(score), task_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class SearchService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def matching_task_ids(self, project_id: str, search: str):
+        """
+        검색어와 일치하는 태스크 ID 서브쿼리 (TaskFilter.search 용)
+
+        FTS5를 사용할 수 없으면 None을 반환하여 호출 측이 LIKE 검색으로 대체한다.
+        """
+        terms = build_match_terms(search)
+        if not terms or not is_search_supported(self.db.bind):
+            return None
+
+        return text(_matching_task_ids_sql(len(terms))).bindparams(
+            project_id=project_id, **{f"term{i}": term for i, term in enumerate(terms)}
+        )
+
+    async def search_tasks(self, project_id: str, search: str, first: Optional[int] = None,
+                     after: Optional[str] = None, fields: Optional[List[str]] = None) -> Tuple[List[dict], bool]:
+        """
+        프로젝트 내 태스크 전문 검색 (bm25 순위, 하이라이트, 커서 페이지)
+
+        fields를 주면 태스크 본문은 해당 컬럼만 조회한다.
+        태스크마다 가장 순위가 높은 행(태스크 본문 또는 댓글 하나)의 점수/스니펫을 사용한다.
+        반환값은 ({task, rank, cursor, title_highlight, snippet} 목록, 다음 페이지 존재 여부)
+        """
+        terms = build_match_terms(search)
+        if not terms:
+            return [], False
+
+        if not is_search_supported(self.db.bind):
+            return await self._search_tasks_like(project_id, search, first, after, fields)
+
+        limit = min(max(first or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+        after_score, after_task_id = _decode_search_cursor(after) if after else (None, None)
+
+        # 행 순위/스니펫은 검색어 중 하나라도 나오는 행 기준, 대상 태스크는 모든 검색어가 나오는 태스크
+        task_filter = f"AND task_id IN ({_matching_task_ids_sql(len(terms))})" if len(terms) > 1 else ""
+
+        # 제목 하이라이트는 태스크 행이 일치했을 때만 있으므로, 없으면 제목 원문을 사용
+        result = await self.db.execute(
+            text(f"""
+                WITH hits AS (
+                    SELECT task_id, bm25(tasks_fts, {BM25_WEIGHTS}) AS score,
+                           nullif(highlight(tasks_fts, 2, :open, :close), '') AS title_highlight,
+                           snippet(tasks_fts, -1, :open, :close, '…', 16) AS snippet
+                    FROM tasks_fts
+                    WHERE tasks_fts MATCH :match AND project_id = :project_id
+                    {task_filter}
+                ),
+                ranked AS (
+                    SELECT task_id, score, snippet,
+                           max(title_highlight) OVER (PARTITION BY task_id) AS title_highlight,
+                           row_number() OVER (PARTITION BY task_id ORDER BY score) AS n
+                    FROM hits
+                )
+                SELECT ranked.task_id, ranked.score, ranked.snippet,
+                       coalesce(ranked.title_highlight, tasks.title) AS title_highlight
+                FROM ranked JOIN tasks ON tasks.id = ranked.task_id
+                WHERE ranked.n = 1
+                  AND (:after_score IS NULL
+                       OR ranked.score > :after_score
+                       OR (ranked.score = :after_score AND ranked.task_id > :after_task_id))
+                ORDER BY ranked.score, ranked.task_id
+                LIMIT :limit
+            """),
+            {
+                "match": " OR ".join(terms),
+                **{f"term{i}": term for i, term in enumerate(terms)},
+                "project_id": project_id,
+                "open": HIGHLIGHT_OPEN,
+                "close": HIGHLIGHT_CLOSE,
+                "after_score": after_score,
+                "after_task_id": after_task_id,
+                "limit": limit + 1,
+            },
+        )
+        rows = result.all()
+
+        has_next_page = len(rows) > limit
+        rows = rows[:limit]
+
+        # 태스크 본문은 한 번의 IN 쿼리로 조회
+        task_ids = [row.task_id for row in rows]
+        tasks_by_id = {}
+        if task_ids:
+            task_result = await self.db.execute(select(*TaskDTO.columns(fields)).where(Task.id.in_(task_ids)))
+            tasks_by_id = {task.id: task for task in TaskDTO.from_rows(task_result.all(), fields)}
+
+        results = []
+        for row in rows:
+            task = tasks_by_id.get(row.task_id)
+            if task is None:
+                continue
+            results.append({
+                "task": task,
+                "rank": row.score,
+                "cursor": _encode_search_cursor(row.score, row.task_id),
+                "title_highlight": row.title_highlight,
+                "snippet": row.snippet,
+            })
+
+        return results, has_next_page
+
+    async def _search_tasks_like(self, project_id: str, search: str, first: Optional[int] = None,
+                           after: Optional[str] = None, fields: Optional[List[str]] = None) -> Tuple[List[dict], bool]:
+        """
+        FTS5를 사용할 수 없는 DB를 위한 LIKE 검색 (순위/하이라이트 없음, 최신순)
+        """
+        stmt = select(*TaskDTO.columns(fields)).where(
+            Task.project_id == project_id,
+            Task.title.contains(search) | Task.description.contains(search)
+        )
+        tasks, has_next_page = await paginate(self.db, stmt, Task, first, after, descending=True, dto=TaskDTO, fields=fields)
+        results = [
+            {
+                "task": task,
+                "rank": 0.0,
+                "cursor": encode_cursor(task),
+                "title_highlight": task.title,
+                "snippet": task.description or "",
+            }
+            for task in tasks
+        ]
+        return results, has_next_page
@@ -0,0 +1,155 @@
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import select, insert, update, func, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Task, TaskStatus, ProjectCounter
+
+# 상태별 카운터 컬럼
+STATUS_COLUMNS = {
+    TaskStatus.TODO: "todo_tasks",
+    TaskStatus.IN_PROGRESS: "in_progress_tasks",
+    TaskStatus.REVIEW: "review_tasks",
+    TaskStatus.DONE: "done_tasks",
+}
+
+# ON CONFLICT DO NOTHING 을 지원하는 방언별 INSERT (그 외 방언은 SAVEPOINT 안에서 충돌을 무시)
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# ix_tasks_project_open_due 부분 인덱스 조건과 같은 형태여야 인덱스 범위 조회가 가능
+OPEN_TASK_CONDITION = text("status != 'DONE'")
+
+
+def rebuild_project_counters(engine: Engine, updated_at: Optional[datetime] = None):
+    """
+    프로젝트 카운터를 tasks 테이블 기준으로 다시 계산 (대량 적재 스크립트 이후 등)
+
+    updated_at 을 주면 현재 시각 대신 사용한다 (결정적 데이터 생성용).
+    """
+    columns = ", ".join(
+        f"sum(CASE WHEN status = '{status.name}' THEN 1 ELSE 0 END)"
+        for status in STATUS_COLUMNS
+    )
+    timestamp = (updated_at or datetime.utcnow()).isoformat(" ", "microseconds")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM project_counters")
+        conn.exec_driver_sql(
+            "INSERT INTO project_counters "
+            "(project_id, todo_tasks, in_progress_tasks, review_tasks, done_tasks, updated_at) "
+            f"SELECT project_id, {columns}, ? FROM tasks GROUP BY project_id",
+            (timestamp,),
+        )
+
+
+class ProjectStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_counter(self, project_id: str) -> ProjectCounter:
+        """
+        프로젝트 카운터 조회 (없으면 현재 태스크 기준으로 생성)
+        """
+        counter = await self.db.get(ProjectCounter, project_id)
+        if counter is not None:
+            return counter
+
+        # 아직 flush 되지 않은 변경은 호출한 작업의 증감으로 반영되므로 제외
+        with self.db.no_autoflush:
+            result = await self.db.execute(
+                select(Task.status, func.count()).where(Task.project_id == project_id).group_by(Task.status)
+            )
+        values = {column: 0 for column in STATUS_COLUMNS.values()}
+        for task_status, count in result.all():
+            values[STATUS_COLUMNS[task_status]] = count
+
+        # 동시에 처음 쓰는 요청이 먼저 만들었으면 그 행을 그대로 사용 (기본 키 충돌 방지)
+        dialect_insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is not None:
+            await self.db.execute(
+                dialect_insert(ProjectCounter)
+                .values(project_id=project_id, **values)
+                .on_conflict_do_nothing(index_elements=[ProjectCounter.project_id])
+            )
+        else:
+            try:
+                async with self.db.begin_nested():
+                    await self.db.execute(insert(ProjectCounter).values(project_id=project_id, **values))
+            except IntegrityError:
+                pass
+        return await self.db.get(ProjectCounter, project_id)
+
+    async def apply_status_change(self, project_id: str, old_status: Optional[TaskStatus],
+                                  new_status: Optional[TaskStatus]):
+        """
+        태스크 상태 변화를 카운터에 반영 (커밋은 호출한 작업에서 수행)
+
+        - 생성: old_status=None
+        - 삭제: new_status=None
+        """
+        deltas: Dict[TaskStatus, int] = {}
+        if old_status is not None:
+            old_status = TaskStatus(old_status.value)
+            deltas[old_status] = deltas.get(old_status, 0) - 1
+        if new_status is not None:
+            new_status = TaskStatus(new_status.value)
+            deltas[new_status] = deltas.get(new_status, 0) + 1
+        await self.apply_deltas(project_id, deltas)
+
+    async def apply_deltas(self, project_id: str, deltas: Dict[TaskStatus, int]):
+        """
+        상태별 증감을 한 번의 UPDATE로 반영
+
+        증감은 SQL 식(col = col + n)으로 갱신하여 동시 요청 간 값 유실을 막는다.
+        """
+        values = {
+            STATUS_COLUMNS[task_status]: getattr(ProjectCounter, STATUS_COLUMNS[task_status]) + delta
+            for task_status, delta in deltas.items()
+            if delta
+        }
+        if not values:
+            return
+
+        await self.get_counter(project_id)
+        values["updated_at"] = datetime.utcnow()
+        await self.db.execute(
+            update(ProjectCounter)
+            .where(ProjectCounter.project_id == project_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_project_stats(self, project_id: str) -> dict:
+        """
+        프로젝트 통계 (카운터 행 조회 + 미완료 태스크 부분 인덱스의 기한 범위 집계)
+        """
+        counter = await self.db.get(ProjectCounter, project_id)
+        if counter is None:
+            # 카운터가 없던 프로젝트는 한 번 집계한 결과를 저장
+            counter = await self.get_counter(project_id)
+            await self.db.commit()
+        else:
+            # 같은 세션에서 UPDATE로 증감된 값이 있을 수 있으므로 다시 읽음
+            await self.db.refresh(counter)
+
+        overdue_tasks = await self.db.scalar(
+            select(func.count()).select_from(Task).where(
+                Task.project_id == project_id,
+                Task.due_date < datetime.utcnow(),
+                OPEN_TASK_CONDITION,
+            )
+        )
+
+        total_tasks = sum(getattr(counter, column) for column in STATUS_COLUMNS.values())
+        return {
+            "total_tasks": total_tasks,
+            "completed_tasks": counter.done_tasks,
+            "in_progress_tasks": counter.in_progress_tasks,
+            "overdue_tasks": overdue_tasks or 0,
+            "completion_rate": (counter.done_tasks / total_tasks) if total_tasks else 0.0,
+        }
\ No newline at end of file
@@ -0,0 +1,227 @@
+import base64
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, delete, insert, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+
+from app.models.models import Change, Comment
+from app.dto.dto import ProjectDTO, TaskDTO, CommentDTO, ActivityDTO
+
+# 한 번에 돌려주는 변경 수
+DEFAULT_SYNC_BATCH = 500
+MAX_SYNC_BATCH = 1000
+
+# 변경 로그 엔티티 종류 → DTO
+ENTITY_DTOS = {
+    "project": ProjectDTO,
+    "task": TaskDTO,
+    "comment": CommentDTO,
+    "activity": ActivityDTO,
+}
+
+# 삭제된 프로젝트의 이전 멤버 기록 (클라이언트에는 보내지 않음)
+MEMBER_ENTITY = "member"
+
+
+def _member_entity_id(project_id: str, user_id: str) -> str:
+    return f"{project_id}:{user_id}"
+
+
+def encode_sync_cursor(seq: int) -> str:
+    return base64.urlsafe_b64encode(f"seq|{seq}".encode()).decode()
+
+
+def decode_sync_cursor(cursor: str) -> int:
+    try:
+        prefix, seq = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        if prefix != "seq":
+            raise ValueError(prefix)
+        return int(seq)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def rebuild_change_log(engine: Engine, changed_at: Optional[datetime] = None):
+    """
+    현재 프로젝트/태스크/댓글/활동 로그로 변경 로그를 다시 채움 (tombstone은 사라짐)
+
+    기존 DB에 변경 로그가 처음 생겼을 때나 대량 적재 스크립트 이후에 사용한다.
+    changed_at 을 주면 현재 시각 대신 사용한다 (결정적 데이터 생성용).
+    """
+    timestamp = (changed_at or datetime.utcnow()).isoformat(" ", "microseconds")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM changes")
+        for select_sql in (
+            "SELECT id, 'project', id FROM projects ORDER BY created_at",
+            "SELECT project_id, 'task', id FROM tasks ORDER BY created_at",
+            "SELECT tasks.project_id, 'comment', comments.id FROM comments "
+            "JOIN tasks ON tasks.id = comments.task_id ORDER BY comments.created_at",
+            "SELECT project_id, 'activity', id FROM activities WHERE project_id IS NOT NULL ORDER BY created_at",
+        ):
+            conn.exec_driver_sql(
+                "INSERT INTO changes (project_id, entity_type, entity_id, deleted, changed_at) "
+                f"SELECT *, 0, ? FROM ({select_sql})",
+                (timestamp,),
+            )
+
+
+def ensure_change_log(engine: Engine):
+    """
+    변경 로그가 비어 있고 기존 데이터가 있으면 채움 (create_tables에서 호출)
+    """
+    with engine.connect() as conn:
+        empty = conn.exec_driver_sql("SELECT 1 FROM changes LIMIT 1").first() is None
+        has_data = conn.exec_driver_sql("SELECT 1 FROM projects LIMIT 1").first() is not None
+    if empty and has_data:
+        rebuild_change_log(engine)
+
+
+class SyncService:
+    """
+    변경 로그 기록 및 델타 동기화 조회
+
+    쓰기 작업은 touch/tombstone으로 변경을 모아 두고, 커밋 직전에 flush로
+    (이전 행 DELETE 한 번 + 새 행 INSERT 한 번) 같은 트랜잭션에 반영한다.
+    SQLite는 쓰기 트랜잭션이 직렬화되므로 seq 순서가 곧 커밋 순서다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        # (project_id, entity_type, entity_id, deleted, 새 엔티티 여부)
+        self._pending: List[Tuple[str, str, str, bool, bool]] = []
+
+    def touch(self, project_id: str, entity_type: str, entity_ids: List[str], new: bool = False):
+        """
+        생성/수정된 엔티티 기록 (new=True면 이전 변경 행이 없으므로 DELETE 생략)
+        """
+        self._pending.extend((project_id, entity_type, entity_id, False, new) for entity_id in entity_ids)
+
+    def tombstone(self, project_id: str, entity_type: str, entity_ids: List[str]):
+        """
+        삭제된 엔티티 기록
+        """
+        self._pending.extend((project_id, entity_type, entity_id, True, False) for entity_id in entity_ids)
+
+    async def flush(self):
+        """
+        모아 둔 변경을 변경 로그에 반영 (커밋은 호출한 작업에서 수행)
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        replaced = [(entity_type, entity_id) for _, entity_type, entity_id, _, new in pending if not new]
+        if replaced:
+            await self.db.execute(
+                delete(Change)
+                .where(tuple_(Change.entity_type, Change.entity_id).in_(replaced))
+                .execution_options(synchronize_session=False)
+            )
+
+        now = datetime.utcnow()
+        await self.db.execute(insert(Change), [
+            {
+                "project_id": project_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "deleted": deleted,
+                "changed_at": now,
+            }
+            for project_id, entity_type, entity_id, deleted, _ in pending
+        ])
+
+    async def forget_task_comments(self, task_id: str):
+        """
+        태스크의 댓글 변경 행 삭제 (태스크 tombstone이 댓글 삭제를 함께 나타냄)
+        """
+        await self.db.execute(
+            delete(Change)
+            .where(
+                Change.entity_type == "comment",
+                Change.entity_id.in_(select(Comment.id).where(Comment.task_id == task_id)),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def purge_project(self, project_id: str):
+        """
+        프로젝트의 변경 로그를 모두 지움 (프로젝트 삭제 시 tombstone 한 행만 남기기 위해)
+        """
+        await self.db.execute(
+            delete(Change).where(Change.project_id == project_id).execution_options(synchronize_session=False)
+        )
+
+    def tombstone_members(self, project_id: str, user_ids: List[str]):
+        """
+        삭제되는 프로젝트의 멤버 기록 (멤버십이 사라진 뒤에도 이전 멤버에게만 tombstone을 보여주기 위해)
+        """
+        self.tombstone(project_id, MEMBER_ENTITY, [_member_entity_id(project_id, user_id) for user_id in user_ids])
+
+    async def was_project_member(self, project_id: str, user_id: str) -> bool:
+        result = await self.db.execute(
+            select(Change.seq).where(
+                Change.entity_type == MEMBER_ENTITY,
+                Change.entity_id == _member_entity_id(project_id, user_id),
+            )
+        )
+        return result.first() is not None
+
+    async def get_project_tombstone(self, project_id: str) -> Optional[Change]:
+        result = await self.db.execute(
+            select(Change).where(
+                Change.entity_type == "project",
+                Change.entity_id == project_id,
+                Change.deleted.is_(True),
+            )
+        )
+        return result.scalars().first()
+
+    async def changes_since(self, project_id: str, cursor: Optional[str] = None,
+                            first: Optional[int] = None) -> dict:
+        """
+        커서 이후 변경된 엔티티와 tombstone 조회
+
+        변경 로그를 (project_id, seq) 인덱스 범위로 읽고, 바뀐 엔티티는 종류별로 IN 쿼리 한 번씩 조회한다.
+        비용은 프로젝트 크기가 아니라 변경 수에 비례한다.
+        """
+        after_seq = decode_sync_cursor(cursor) if cursor else 0
+        limit = min(max(first or DEFAULT_SYNC_BATCH, 1), MAX_SYNC_BATCH)
+
+        result = await self.db.execute(
+            select(Change.seq, Change.entity_type, Change.entity_id, Change.deleted, Change.changed_at)
+            .where(Change.project_id == project_id, Change.seq > after_seq)
+            .order_by(Change.seq)
+            .limit(limit + 1)
+        )
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        changed: Dict[str, List[str]] = {}
+        tombstones = []
+        for row in rows:
+            if row.entity_type == MEMBER_ENTITY:
+                continue
+            if row.deleted:
+                tombstones.append({"entity_type": row.entity_type, "id": row.entity_id, "deleted_at": row.changed_at})
+            else:
+                changed.setdefault(row.entity_type, []).append(row.entity_id)
+
+        entities: Dict[str, list] = {}
+        for entity_type, entity_ids in changed.items():
+            dto = ENTITY_DTOS[entity_type]
+            entity_result = await self.db.execute(select(*dto.columns()).where(dto.MODEL.id.in_(entity_ids)))
+            entities[entity_type] = dto.from_rows(entity_result.all())
+
+        projects = entities.get("project", [])
+        return {
+            "project": projects[0] if projects else None,
+            "tasks": entities.get("task", []),
+            "comments": entities.get("comment", []),
+            "activities": entities.get("activity", []),
+            "tombstones": tombstones,
+            "cursor": encode_sync_cursor(rows[-1].seq if rows else after_seq),
+            "has_more": has_more,
+        }
\ No newline at end of file
@@ -1,193 +1,440 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from datetime import datetime
 
-from app.models.models import Task, Comment, TaskStatus, Priority, Activity
+from app.models.models import Task, Comment, TaskStatus, Priority, Activity, generate_uuid
+from app.dto.dto import TaskDTO, CommentDTO, ActivityDTO
 from app.schemas.types import CreateTaskInput, UpdateTaskInput, TaskFilter
+from app.services.pagination import paginate
+from app.services.search_service import SearchService
+from app.services.stats_service import ProjectStatsService
+from app.services.sync_service import SyncService
+from app.notifications.notifications import NotificationEvent
+
+
+def _to_model_enum(enum_cls, value):
+    """
+    GraphQL 입력 Enum을 모델 Enum으로 변환
+    """
+    return enum_cls(value.value) if hasattr(value, 'value') else enum_cls(value)
 
 
 class TaskService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        self.stats = ProjectStatsService(db)
+        self.sync = SyncService(db)
+        # 이번 요청에서 생성된 활동 로그 (구독 이벤트 발행용)
+        self.new_activities: List[Activity] = []
+        # 이번 요청에서 발생한 알림 이벤트 (커밋 후 팬아웃 단계로 전달)
+        self.notification_events: List[NotificationEvent] = []
 
-    def get_tasks(self, project_id: str, filter: Optional[TaskFilter] = None) -> List[Task]:
+    async def get_tasks(self, project_id: str, filter: Optional[TaskFilter] = None,
+                        fields: Optional[List[str]] = None) -> List[TaskDTO]:
         """
-        프로젝트의 태스크들 조회
+        프로젝트의 태스크들 조회 (세션에 ORM 객체를 올리지 않는 DTO 목록)
+
+        fields를 주면 해당 컬럼만 조회한다 (projection.selected_columns).
         """
-        query = self.db.query(Task).filter(Task.project_id == project_id)
+        stmt = self._filtered_tasks_query(project_id, filter, fields)
+        result = await self.db.execute(stmt.order_by(Task.created_at.desc()))
+        return TaskDTO.from_rows(result.all(), fields)
+
+    async def get_tasks_page(self, project_id: str, filter: Optional[TaskFilter] = None,
+                       first: Optional[int] = None, after: Optional[str] = None,
+                       fields: Optional[List[str]] = None) -> Tuple[List[TaskDTO], bool]:
+        """
+        프로젝트의 태스크들을 커서 기반으로 페이지 조회
+        """
+        stmt = self._filtered_tasks_query(project_id, filter, fields)
+        return await paginate(self.db, stmt, Task, first, after, descending=True, dto=TaskDTO, fields=fields)
+
+    def _filtered_tasks_query(self, project_id: str, filter: Optional[TaskFilter] = None,
+                              fields: Optional[List[str]] = None):
+        """
+        필터가 적용된 태스크 쿼리 생성 (TaskDTO 컬럼 조회)
+        """
+        stmt = select(*TaskDTO.columns(fields)).where(Task.project_id == project_id)
         
         if filter:
             if filter.status:
-                query = query.filter(Task.status == filter.status)
+                stmt = stmt.where(Task.status == _to_model_enum(TaskStatus, filter.status))
             if filter.priority:
-                query = query.filter(Task.priority == filter.priority)
+                stmt = stmt.where(Task.priority == _to_model_enum(Priority, filter.priority))
             if filter.assigneeId:
-                query = query.filter(Task.assignee_id == filter.assigneeId)
+                stmt = stmt.where(Task.assignee_id == filter.assigneeId)
             if filter.search:
-                query = query.filter(
-                    Task.title.contains(filter.search) | 
-                    Task.description.contains(filter.search)
-                )
+                # FTS5 인덱스 사용 (지원하지 않는 DB는 LIKE 검색으로 대체)
+                matching_ids = SearchService(self.db).matching_task_ids(project_id, filter.search)
+                if matching_ids is not None:
+                    stmt = stmt.where(Task.id.in_(matching_ids))
+                else:
+                    stmt = stmt.where(
+                        Task.title.contains(filter.search) | 
+                        Task.description.contains(filter.search)
+                    )
         
-        return query.order_by(Task.created_at.desc()).all()
+        return stmt
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """
+        태스크 조회 (같은 세션에서 이미 조회한 태스크는 쿼리 없이 반환)
+        """
+        return await self.db.get(Task, task_id)
 
-    def get_task(self, task_id: str) -> Optional[Task]:
+    async def get_task_project_id(self, task_id: str) -> Optional[str]:
         """
-        태스크 조회
+        태스크가 속한 프로젝트 ID만 조회 (권한 확인용, ORM 객체를 로드하지 않음)
         """
-        return self.db.query(Task).filter(Task.id == task_id).first()
+        return await self.db.scalar(select(Task.project_id).where(Task.id == task_id))
 
-    def create_task(self, user_id: str, input: CreateTaskInput) -> Task:
+    async def create_task(self, user_id: str, input: CreateTaskInput) -> Task:
         """
         태스크 생성
         """
+        # 활동 로그가 같은 flush에서 참조할 수 있도록 ID를 미리 생성
         task = Task(
+            id=generate_uuid(),
             title=input.title,
             description=input.description,
             project_id=input.projectId,
             assignee_id=input.assigneeId,
-            priority=input.priority,
+            priority=_to_model_enum(Priority, input.priority),
             due_date=input.dueDate,
             status=TaskStatus.TODO
         )
-        
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        await self.stats.apply_status_change(task.project_id, None, task.status)
+        self.sync.touch(task.project_id, "task", [task.id], new=True)
         
-        # 활동 로그 생성
-        self._create_activity(
+        # 활동 로그 생성 (태스크와 같은 트랜잭션)
+        self._add_activity(
             user_id=user_id,
             task_id=task.id,
             project_id=task.project_id,
             action="task_created",
             description=f"태스크 '{task.title}'을(를) 생성했습니다."
         )
+        self._notify_task_change(user_id, task, {"assignee_id": task.assignee_id}, [])
         
+        await self.sync.flush()
+        await self.db.commit()
         return task
 
-    def update_task(self, task_id: str, input: UpdateTaskInput) -> Task:
+    def _diff_task(self, task: Task, input: UpdateTaskInput,
+                   now: Optional[datetime] = None) -> Tuple[Dict[str, Any], List[str]]:
         """
-        태스크 수정
+        수정 입력과 현재 태스크를 비교하여 (변경할 컬럼 값, 변경 내역 설명) 반환
         """
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        # 변경사항 추적
+        values: Dict[str, Any] = {}
         changes = []
         
         if input.title is not None and input.title != task.title:
             changes.append(f"제목을 '{task.title}'에서 '{input.title}'로 변경")
-            task.title = input.title
+            values["title"] = input.title
         
         if input.description is not None and input.description != task.description:
             changes.append("설명을 수정")
-            task.description = input.description
+            values["description"] = input.description
         
-        if input.status is not None and input.status != task.status:
+        if input.status is not None and input.status.value != task.status.value:
             changes.append(f"상태를 '{task.status.value}'에서 '{input.status.value}'로 변경")
-            task.status = input.status
+            values["status"] = _to_model_enum(TaskStatus, input.status)
             
             # 완료 상태로 변경 시 완료 시간 설정
-            if input.status == TaskStatus.DONE:
-                task.completed_at = datetime.utcnow()
+            if values["status"] == TaskStatus.DONE:
+                values["completed_at"] = now or datetime.utcnow()
             else:
-                task.completed_at = None
+                values["completed_at"] = None
         
-        if input.priority is not None and input.priority != task.priority:
+        if input.priority is not None and input.priority.value != task.priority.value:
             changes.append(f"우선순위를 '{task.priority.value}'에서 '{input.priority.value}'로 변경")
-            task.priority = input.priority
+            values["priority"] = _to_model_enum(Priority, input.priority)
         
         if input.assigneeId is not None and input.assigneeId != task.assignee_id:
             changes.append("담당자를 변경")
-            task.assignee_id = input.assigneeId
+            values["assignee_id"] = input.assigneeId
         
         if input.dueDate is not None and input.dueDate != task.due_date:
             changes.append("마감일을 변경")
-            task.due_date = input.dueDate
+            values["due_date"] = input.dueDate
+        
+        return values, changes
+
+    async def update_task(self, user_id: str, task_id: str, input: UpdateTaskInput) -> Task:
+        """
+        태스크 수정
+        """
+        task = await self.get_task(task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        
+        # 변경사항 추적
+        values, changes = self._diff_task(task, input)
+        old_status = task.status
+        for column, value in values.items():
+            setattr(task, column, value)
         
-        self.db.commit()
-        self.db.refresh(task)
+        # 프로젝트 카운터 갱신 (변경사항과 같은 트랜잭션)
+        await self.stats.apply_status_change(task.project_id, old_status, task.status)
         
-        # 활동 로그 생성
+        # 활동 로그 생성 (변경사항과 같은 트랜잭션)
         if changes:
-            self._create_activity(
-                user_id=task.assignee_id or "system",  # 실제로는 현재 사용자 ID
+            self.sync.touch(task.project_id, "task", [task.id])
+            self._add_activity(
+                user_id=user_id,
                 task_id=task.id,
                 project_id=task.project_id,
                 action="task_updated",
                 description=f"태스크 '{task.title}'을(를) 수정했습니다: {', '.join(changes)}"
             )
+            self._notify_task_change(user_id, task, values, changes)
         
+        await self.sync.flush()
+        await self.db.commit()
         return task
 
-    def delete_task(self, task_id: str) -> bool:
+    async def get_tasks_by_ids(self, task_ids: List[str]) -> List[Task]:
+        """
+        여러 태스크를 한 번에 조회 (요청한 순서대로, 없는 ID는 제외)
+        """
+        result = await self.db.execute(select(Task).where(Task.id.in_(set(task_ids))))
+        by_id = {task.id: task for task in result.scalars().all()}
+        return [by_id[task_id] for task_id in task_ids if task_id in by_id]
+
+    async def bulk_create_tasks(self, user_id: str, inputs: List[CreateTaskInput]) -> List[Task]:
+        """
+        태스크 일괄 생성 (한 트랜잭션, INSERT 일괄 실행)
+        """
+        tasks = []
+        counter_deltas: Dict[str, Dict[TaskStatus, int]] = {}
+        
+        for input in inputs:
+            task = Task(
+                id=generate_uuid(),
+                title=input.title,
+                description=input.description,
+                project_id=input.projectId,
+                assignee_id=input.assigneeId,
+                priority=_to_model_enum(Priority, input.priority),
+                due_date=input.dueDate,
+                status=TaskStatus.TODO
+            )
+            tasks.append(task)
+            self.sync.touch(task.project_id, "task", [task.id], new=True)
+            deltas = counter_deltas.setdefault(task.project_id, {})
+            deltas[TaskStatus.TODO] = deltas.get(TaskStatus.TODO, 0) + 1
+            
+            self._add_activity(
+                user_id=user_id,
+                task_id=task.id,
+                project_id=task.project_id,
+                action="task_created",
+                description=f"태스크 '{task.title}'을(를) 생성했습니다."
+            )
+            self._notify_task_change(user_id, task, {"assignee_id": task.assignee_id}, [])
+        
+        self.db.add_all(tasks)
+        
+        # 프로젝트 카운터는 프로젝트당 한 번만 갱신
+        for project_id, deltas in counter_deltas.items():
+            await self.stats.apply_deltas(project_id, deltas)
+        
+        await self.sync.flush()
+        await self.db.commit()
+        return tasks
+
+    async def bulk_update_tasks(self, user_id: str, updates: List[Tuple[Task, UpdateTaskInput]]) -> List[Task]:
+        """
+        태스크 일괄 수정 (한 트랜잭션)
+
+        같은 값으로 바뀌는 태스크끼리 묶어 묶음마다 UPDATE ... WHERE id IN (...) 한 번으로 반영하고,
+        활동 로그는 한 번에 INSERT 한다.
+        """
+        groups: Dict[Tuple, List[str]] = {}
+        counter_deltas: Dict[str, Dict[TaskStatus, int]] = {}
+        # 같은 변경끼리 묶일 수 있도록 완료 시간은 한 번만 계산
+        now = datetime.utcnow()
+        
+        for task, input in updates:
+            values, changes = self._diff_task(task, input, now)
+            if not values:
+                continue
+            
+            groups.setdefault(tuple(sorted(values.items())), []).append(task.id)
+            self.sync.touch(task.project_id, "task", [task.id])
+            
+            if "status" in values:
+                deltas = counter_deltas.setdefault(task.project_id, {})
+                old_status = _to_model_enum(TaskStatus, task.status)
+                deltas[old_status] = deltas.get(old_status, 0) - 1
+                deltas[values["status"]] = deltas.get(values["status"], 0) + 1
+            
+            self._add_activity(
+                user_id=user_id,
+                task_id=task.id,
+                project_id=task.project_id,
+                action="task_updated",
+                description=f"태스크 '{values.get('title', task.title)}'을(를) 수정했습니다: {', '.join(changes)}"
+            )
+            self._notify_task_change(user_id, task, values, changes)
+        
+        for group_values, task_ids in groups.items():
+            await self.db.execute(
+                update(Task)
+                .where(Task.id.in_(task_ids))
+                .values(**dict(group_values), updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        
+        for project_id, deltas in counter_deltas.items():
+            await self.stats.apply_deltas(project_id, deltas)
+        
+        await self.sync.flush()
+        await self.db.commit()
+        
+        # 갱신된 값으로 다시 읽어 반환 (요청한 순서 유지)
+        task_ids = [task.id for task, _ in updates]
+        result = await self.db.execute(
+            select(Task).where(Task.id.in_(set(task_ids))).execution_options(populate_existing=True)
+        )
+        by_id = {task.id: task for task in result.scalars().all()}
+        return [by_id[task_id] for task_id in task_ids if task_id in by_id]
+
+    async def move_tasks(self, user_id: str, tasks: List[Task], status: TaskStatus) -> List[Task]:
+        """
+        여러 태스크를 같은 상태로 이동 (보드의 레인 이동)
+        """
+        return await self.bulk_update_tasks(user_id, [(task, UpdateTaskInput(status=status)) for task in tasks])
+
+    async def delete_task(self, user_id: str, task_id: str) -> bool:
         """
         태스크 삭제
         """
-        task = self.db.query(Task).filter(Task.id == task_id).first()
+        task = await self.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
         # 관련 데이터 삭제 (댓글, 첨부파일 등)
-        self.db.query(Comment).filter(Comment.task_id == task_id).delete()
+        # 댓글은 태스크 tombstone으로 함께 삭제된 것으로 보므로 변경 로그에서도 지움
+        await self.sync.forget_task_comments(task_id)
+        await self.db.execute(delete(Comment).where(Comment.task_id == task_id))
         
         # 활동 로그 생성
-        self._create_activity(
-            user_id=task.assignee_id or "system",
+        self._add_activity(
+            user_id=user_id,
             task_id=None,
             project_id=task.project_id,
             action="task_deleted",
             description=f"태스크 '{task.title}'을(를) 삭제했습니다."
         )
+        self._notify(user_id, task.project_id, "담당 태스크가 삭제되었습니다",
+                     f"'{task.title}' 태스크가 삭제되었습니다.", user_ids=[task.assignee_id])
         
-        self.db.delete(task)
-        self.db.commit()
+        await self.stats.apply_status_change(task.project_id, task.status, None)
+        self.sync.tombstone(task.project_id, "task", [task.id])
+        await self.sync.flush()
+        await self.db.delete(task)
+        await self.db.commit()
         
         return True
 
-    def add_comment(self, user_id: str, task_id: str, content: str) -> Comment:
+    async def add_comment(self, user_id: str, task_id: str, content: str) -> Comment:
         """
         댓글 추가
         """
+        # 권한 확인에서 이미 조회한 태스크는 세션에서 바로 가져옴
+        task = await self.get_task(task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        
         comment = Comment(
+            id=generate_uuid(),
             content=content,
             author_id=user_id,
             task_id=task_id
         )
-        
         self.db.add(comment)
-        self.db.commit()
-        self.db.refresh(comment)
+        self.sync.touch(task.project_id, "comment", [comment.id], new=True)
         
-        # 활동 로그 생성
-        task = self.get_task(task_id)
-        if task:
-            self._create_activity(
-                user_id=user_id,
-                task_id=task_id,
-                project_id=task.project_id,
-                action="comment_added",
-                description=f"태스크 '{task.title}'에 댓글을 추가했습니다."
-            )
+        # 활동 로그 생성 (댓글과 같은 트랜잭션)
+        self._add_activity(
+            user_id=user_id,
+            task_id=task_id,
+            project_id=task.project_id,
+            action="comment_added",
+            description=f"태스크 '{task.title}'에 댓글을 추가했습니다."
+        )
+        self._notify(user_id, task.project_id, "새 댓글",
+                     f"'{task.title}' 태스크에 새 댓글이 달렸습니다: {content[:100]}",
+                     user_ids=[task.assignee_id], notify_members=True)
         
+        await self.sync.flush()
+        await self.db.commit()
         return comment
 
-    def get_task_comments(self, task_id: str) -> List[Comment]:
+    async def get_task_comments(self, task_id: str) -> List[CommentDTO]:
         """
         태스크의 댓글들 조회
         """
-        return self.db.query(Comment).filter(
-            Comment.task_id == task_id
-        ).order_by(Comment.created_at.asc()).all()
+        result = await self.db.execute(
+            select(*CommentDTO.columns()).where(
+                Comment.task_id == task_id
+            ).order_by(Comment.created_at.asc())
+        )
+        return CommentDTO.from_rows(result.all())
+
+    async def get_task_comments_page(self, task_id: str, first: Optional[int] = None,
+                               after: Optional[str] = None,
+                               fields: Optional[List[str]] = None) -> Tuple[List[CommentDTO], bool]:
+        """
+        태스크의 댓글들을 커서 기반으로 페이지 조회 (오래된 순)
+        """
+        stmt = select(*CommentDTO.columns(fields)).where(Comment.task_id == task_id)
+        return await paginate(self.db, stmt, Comment, first, after, descending=False, dto=CommentDTO, fields=fields)
+
+    def _notify(self, user_id: str, project_id: str, title: str, message: str,
+                user_ids: List[Optional[str]] = (), notify_members: bool = False):
+        """
+        알림 이벤트 기록 (수신자 계산과 저장은 커밋 후 팬아웃 단계에서 수행)
+        """
+        if not notify_members and not any(user_ids):
+            return
+        self.notification_events.append(NotificationEvent(
+            actor_id=user_id,
+            project_id=project_id,
+            title=title,
+            message=message,
+            user_ids=user_ids,
+            notify_members=notify_members,
+        ))
+
+    def _notify_task_change(self, user_id: str, task: Task, values: Dict[str, Any], changes: List[str]):
+        """
+        태스크 생성/수정 알림 (담당자 지정은 새 담당자, 수정은 담당자, 완료는 프로젝트 멤버에게)
+        """
+        title = values.get("title", task.title)
+        assignee_id = values.get("assignee_id", task.assignee_id)
+        
+        if "assignee_id" in values:
+            self._notify(user_id, task.project_id, "태스크가 할당되었습니다",
+                         f"'{title}' 태스크의 담당자로 지정되었습니다.", user_ids=[assignee_id])
+        elif changes:
+            self._notify(user_id, task.project_id, "담당 태스크가 수정되었습니다",
+                         f"'{title}': {', '.join(changes)}", user_ids=[assignee_id])
+        
+        if values.get("status") == TaskStatus.DONE:
+            self._notify(user_id, task.project_id, "태스크가 완료되었습니다",
+                         f"'{title}' 태스크가 완료되었습니다.", notify_members=True)
 
-    def _create_activity(self, user_id: str, task_id: Optional[str], project_id: str, action: str, description: str):
+    def _add_activity(self, user_id: str, task_id: Optional[str], project_id: str, action: str, description: str):
         """
-        활동 로그 생성
+        활동 로그를 현재 트랜잭션에 추가 (커밋은 호출한 작업에서 한 번만 수행)
         """
         activity = Activity(
+            id=generate_uuid(),
             user_id=user_id,
             task_id=task_id,
             project_id=project_id,
@@ -196,20 +443,36 @@ class TaskService:
         )
         
         self.db.add(activity)
-        self.db.commit()
+        self.new_activities.append(activity)
+        self.sync.touch(project_id, "activity", [activity.id], new=True)
 
-    def get_project_activities(self, project_id: str, limit: int = 50) -> List[Activity]:
+    async def get_project_activities(self, project_id: str, limit: int = 50) -> List[ActivityDTO]:
         """
         프로젝트의 활동 로그 조회
         """
-        return self.db.query(Activity).filter(
-            Activity.project_id == project_id
-        ).order_by(Activity.created_at.desc()).limit(limit).all()
+        result = await self.db.execute(
+            select(*ActivityDTO.columns()).where(
+                Activity.project_id == project_id
+            ).order_by(Activity.created_at.desc()).limit(limit)
+        )
+        return ActivityDTO.from_rows(result.all())
 
-    def get_task_activities(self, task_id: str) -> List[Activity]:
+    async def get_task_activities(self, task_id: str) -> List[ActivityDTO]:
         """
         태스크의 활동 로그 조회
         """
-        return self.db.query(Activity).filter(
-            Activity.task_id == task_id
-        ).order_by(Activity.created_at.desc()).all()
\ No newline at end of file
+        result = await self.db.execute(
+            select(*ActivityDTO.columns()).where(
+                Activity.task_id == task_id
+            ).order_by(Activity.created_at.desc())
+        )
+        return ActivityDTO.from_rows(result.all())
+
+    async def get_task_activities_page(self, task_id: str, first: Optional[int] = None,
+                                 after: Optional[str] = None,
+                                 fields: Optional[List[str]] = None) -> Tuple[List[ActivityDTO], bool]:
+        """
+        태스크의 활동 로그를 커서 기반으로 페이지 조회 (최신순)
+        """
+        stmt = select(*ActivityDTO.columns(fields)).where(Activity.task_id == task_id)
+        return await paginate(self.db, stmt, Activity, first, after, descending=True, dto=ActivityDTO, fields=fields)
\ No newline at end of file
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+서비스 쿼리 실행 계획 검증 스크립트
+
+임시 SQLite DB에 데이터를 채운 뒤 각 서비스 메서드가 실행하는 SQL을 수집하고,
+EXPLAIN QUERY PLAN 결과에 테이블/인덱스 전체 스캔(SCAN)이 있으면 실패(exit 1)한다.
+(ALLOWED_SCANS 에 사유와 함께 등록된 쿼리는 제외)
+
+사용법: python3 check_query_plans.py
+테스트: python3 -m pytest tests/test_query_plans.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.models.models import (
+    Base, User, Project, ProjectMember, Task, Comment, Activity, Notification,
+    Role, TaskStatus, Priority,
+)
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+from app.services.auth_service import AuthServiceDB
+from app.services.pagination import encode_cursor, paginate
+from app.dto.dto import NotificationDTO
+from app.services.search_service import SearchService, create_search_index
+from app.services.stats_service import ProjectStatsService
+from app.notifications.unread import UnreadCounter
+from app.services.sync_service import SyncService, encode_sync_cursor, rebuild_change_log
+from app.schemas.types import TaskFilter
+
+
+def seed(db):
+    """검증용 데이터 생성 (인덱스 선택이 의미 있도록 여러 프로젝트/사용자에 분산)"""
+    now = datetime.utcnow()
+    users = [
+        User(id=f"user-{i}", email=f"user{i}@taskflow.com", name=f"사용자{i}",
+             password_hash="x", role=Role.MEMBER)
+        for i in range(20)
+    ]
+    projects = [Project(id=f"project-{i}", name=f"프로젝트{i}") for i in range(10)]
+    db.add_all(users + projects)
+    db.flush()
+
+    db.add_all([
+        ProjectMember(user_id=user.id, project_id=project.id, role=Role.MANAGER)
+        for user in users[:5] for project in projects
+    ])
+    for i in range(500):
+        db.add(Task(
+            id=f"task-{i}", title=f"태스크 {i}", description="설명",
+            status=TaskStatus.TODO, priority=Priority.MEDIUM,
+            assignee_id=users[i % len(users)].id, project_id=projects[i % len(projects)].id,
+            created_at=now - timedelta(minutes=i),
+        ))
+    db.flush()
+    for i in range(1000):
+        task_id = f"task-{i % 500}"
+        db.add(Comment(content="댓글", author_id=users[i % 5].id, task_id=task_id,
+                       created_at=now - timedelta(seconds=i)))
+        db.add(Activity(action="task_updated", description="수정", user_id=users[i % 5].id,
+                        task_id=task_id, project_id=projects[i % len(projects)].id,
+                        created_at=now - timedelta(seconds=i)))
+        db.add(Notification(title="알림", message="메시지", user_id=users[i % len(users)].id,
+                            created_at=now - timedelta(seconds=i)))
+    db.commit()
+    rebuild_change_log(db.get_bind())
+
+    # 통계 수집 (플래너가 실제 분포로 인덱스를 선택하도록)
+    db.connection().exec_driver_sql("ANALYZE")
+    db.commit()
+
+
+def service_queries(db, async_db):
+    """(이름, 실행 함수) 목록 - 각 함수는 서비스 쿼리를 한 번 실행하는 코루틴을 반환한다
+
+    요청 범위 캐시(멤버십 등)를 쓰는 메서드는 항목마다 새 서비스로 실행해야 SQL 이 실행된다.
+    """
+    project_service = ProjectService(async_db)
+    task_service = TaskService(async_db)
+    auth_service = AuthServiceDB(async_db)
+    stats_service = ProjectStatsService(async_db)
+    sync_service = SyncService(async_db)
+    task = db.query(Task).filter(Task.id == "task-10").first()
+    comment = db.query(Comment).filter(Comment.task_id == "task-10").first()
+    activity = db.query(Activity).filter(Activity.task_id == "task-10").first()
+    notification = db.query(Notification).filter(Notification.user_id == "user-1").first()
+    db.expunge_all()
+
+    return [
+        ("ProjectService.get_user_projects", lambda: project_service.get_user_projects("user-1")),
+        ("ProjectService.get_project", lambda: project_service.get_project("project-1")),
+        ("ProjectService.has_project_access", lambda: ProjectService(async_db).has_project_access("user-1", "project-1")),
+        ("ProjectService.has_project_manage_access", lambda: ProjectService(async_db).has_project_manage_access("user-1", "project-1")),
+        ("ProjectService.get_project_members", lambda: project_service.get_project_members("project-1")),
+        ("TaskService.get_tasks", lambda: task_service.get_tasks("project-1")),
+        ("TaskService.get_tasks (filter)", lambda: task_service.get_tasks("project-1", TaskFilter(assigneeId="user-1"))),
+        ("TaskService.get_tasks (search)", lambda: task_service.get_tasks("project-1", TaskFilter(search="태스크"))),
+        ("SearchService.search_tasks", lambda: SearchService(async_db).search_tasks("project-1", "태스크", 20)),
+        ("SearchService.search_tasks (multi-term)", lambda: SearchService(async_db).search_tasks("project-1", "태스크 댓글", 20)),
+        ("TaskService.get_tasks_page", lambda: task_service.get_tasks_page("project-1", None, 20, encode_cursor(task))),
+        ("TaskService.get_task", lambda: task_service.get_task("task-1")),
+        ("TaskService.get_task_project_id", lambda: task_service.get_task_project_id("task-1")),
+        ("TaskService.get_task_comments", lambda: task_service.get_task_comments("task-1")),
+        ("TaskService.get_task_comments_page", lambda: task_service.get_task_comments_page("task-1", 20, encode_cursor(comment))),
+        ("TaskService.get_project_activities", lambda: task_service.get_project_activities("project-1")),
+        ("TaskService.get_task_activities", lambda: task_service.get_task_activities("task-1")),
+        ("TaskService.get_task_activities_page", lambda: task_service.get_task_activities_page("task-1", 20, encode_cursor(activity))),
+        ("ProjectStatsService.get_project_stats", lambda: stats_service.get_project_stats("project-1")),
+        ("SyncService.changes_since", lambda: sync_service.changes_since("project-1", encode_sync_cursor(1000), 100)),
+        ("SyncService.get_project_tombstone", lambda: sync_service.get_project_tombstone("project-1")),
+        ("SyncService.was_project_member", lambda: sync_service.was_project_member("project-1", "user-1")),
+        ("UnreadCounter.get", lambda: UnreadCounter().get(async_db, "user-1")),
+        ("AuthServiceDB.get_user_by_email", lambda: auth_service.get_user_by_email("user1@taskflow.com")),
+        ("notifications", lambda: paginate(
+            async_db, select(*NotificationDTO.columns()).where(Notification.user_id == "user-1"),
+            Notification, 20, encode_cursor(notification), dto=NotificationDTO)),
+    ]
+
+
+# 테이블 스캔을 허용하는 쿼리 (service_queries 이름 → 사유)
+# 스캔이 불가피한 쿼리만 사유와 함께 추가한다. 그 외 쿼리는 모든 테이블 접근이 SEARCH 여야 한다.
+ALLOWED_SCANS: Dict[str, str] = {}
+
+
+def plan_scans(details: List[str]) -> List[str]:
+    """
+    EXPLAIN QUERY PLAN 단계 중 테이블/인덱스 전체를 훑는 SCAN 단계 반환
+
+    "SCAN … USING INDEX" / "USING COVERING INDEX" 도 인덱스 전체를 훑으므로 스캔으로 본다.
+    FTS5 MATCH 조회와 CTE/서브쿼리 결과(이미 인덱스로 걸러진 행)를 훑는 단계는 제외한다.
+    """
+    subqueries = {
+        detail.split(" ", 1)[1] for detail in details
+        if detail.startswith(("CO-ROUTINE ", "MATERIALIZE "))
+    }
+    return [
+        detail for detail in details
+        if detail.startswith("SCAN ")
+        and detail[len("SCAN "):] not in subqueries
+        # FTS5 MATCH 조회는 "VIRTUAL TABLE INDEX 0:M..." 로 표시됨 (전문 인덱스 사용)
+        and not ("VIRTUAL TABLE INDEX" in detail and ":M" in detail)
+    ]
+
+
+def table_scans(connection, statement, parameters) -> List[str]:
+    """SQL 문의 실행 계획 중 테이블/인덱스 스캔 단계 반환"""
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return plan_scans([row[-1] for row in rows])
+
+
+async def collect_plan_scans() -> List[Tuple[str, str, List[str]]]:
+    """
+    검증용 DB에서 서비스 쿼리를 실행하고, 실행된 SQL 마다 (이름, SQL, 허용되지 않은 스캔 단계) 반환
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'plans.db')
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        create_search_index(engine)
+        db = sessionmaker(bind=engine)()
+
+        seed(db)
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async_db = async_sessionmaker(bind=async_engine, expire_on_commit=False)()
+
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        try:
+            for name, run in service_queries(db, async_db):
+                captured.clear()
+                event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+                try:
+                    await run()
+                finally:
+                    event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+
+                # SQL 을 실행하지 않았으면 검증한 것이 없으므로 실패로 기록
+                if not captured:
+                    results.append((name, "", ["실행된 SQL 없음"]))
+                for statement, parameters in captured:
+                    scans = table_scans(db.connection(), statement, parameters)
+                    results.append((name, statement, [] if name in ALLOWED_SCANS else scans))
+        finally:
+            await async_db.close()
+            await async_engine.dispose()
+            db.close()
+            engine.dispose()
+
+    return results
+
+
+async def main() -> int:
+    failures = 0
+    for name, statement, scans in await collect_plan_scans():
+        if scans:
+            failures += 1
+            print(f"❌ {name}: {', '.join(scans)}")
+            print(f"   {' '.join(statement.split())}")
+        else:
+            print(f"✅ {name}")
+
+    if failures:
+        print(f"\n❌ {failures}개 쿼리가 테이블/인덱스 전체 스캔을 사용합니다.")
+        return 1
+    print("\n✅ 모든 서비스 쿼리가 인덱스 검색(SEARCH)만 사용합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
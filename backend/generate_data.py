@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+성능 테스트용 대량 데이터 생성 스크립트
+
+같은 --seed 와 옵션이면 항상 같은 데이터를 만든다 (ID, 시간, 분포 모두 결정적).
+프로젝트 크기와 담당자 부하는 Zipf 분포로 치우치게 만들어 소수의 큰 프로젝트와
+일이 몰린 담당자를 재현한다.
+
+- 모든 사용자는 미리 한 번만 계산한 비밀번호 해시를 공유한다 (bcrypt 호출 1회).
+- 행은 ORM 없이 드라이버 executemany 로 배치 INSERT 하고,
+  보조 인덱스/검색 인덱스는 적재가 끝난 뒤 만든다.
+- 적재 후 프로젝트 카운터, 검색 인덱스, 변경 로그를 다시 계산하고 ANALYZE 한다.
+
+사용법:
+    python3 generate_data.py                                  # ./bench.db, 태스크 25만 개 (약 200만 행)
+    python3 generate_data.py --tasks 1250000 --force          # 약 1,000만 행
+    python3 generate_data.py --database sqlite:///./big.db --users 5000 --projects 2000 --seed 7
+"""
+
+import argparse
+import bisect
+import itertools
+import os
+import random
+import sys
+import time
+import uuid
+from array import array
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, List, Sequence
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from app.models.models import Base, TaskStatus, Priority, Role
+from app.auth.auth import pwd_context
+from app.services.stats_service import rebuild_project_counters
+from app.services.search_service import create_search_index
+from app.services.sync_service import rebuild_change_log
+
+# 한 번에 INSERT 하는 행 수
+BATCH_SIZE = 50_000
+# 생성 데이터의 마지막 시각 (2025-01-01 00:00:00 UTC, 실행 시각과 무관하게 결정적)
+END_TIMESTAMP = 1_735_689_600
+
+# 엔티티 종류별 ID 네임스페이스 (인덱스 → 결정적 UUID)
+USER, PROJECT, MEMBER, TASK, COMMENT, ACTIVITY, NOTIFICATION = range(1, 8)
+
+STATUS_WEIGHTS = [(TaskStatus.TODO, 35), (TaskStatus.IN_PROGRESS, 20), (TaskStatus.REVIEW, 10), (TaskStatus.DONE, 35)]
+PRIORITY_WEIGHTS = [(Priority.LOW, 25), (Priority.MEDIUM, 45), (Priority.HIGH, 22), (Priority.URGENT, 8)]
+
+TASK_VERBS = ["구현", "수정", "리뷰", "테스트", "설계", "배포", "문서화", "리팩터링", "조사", "최적화"]
+TASK_SUBJECTS = ["로그인 화면", "결제 모듈", "알림 설정", "검색 API", "대시보드", "프로필 편집", "오프라인 동기화",
+                 "푸시 알림", "권한 관리", "파일 업로드", "댓글 목록", "보드 화면", "온보딩", "다크 모드", "설정 화면"]
+COMMENTS = ["확인했습니다.", "리뷰 부탁드립니다.", "내일까지 마무리하겠습니다.", "이슈 재현이 안 됩니다. 로그 공유 부탁드려요.",
+            "PR 올렸습니다.", "디자인 시안 반영했습니다.", "테스트 케이스 추가가 필요해 보입니다.", "좋습니다 👍"]
+NOTIFICATIONS = [("태스크가 할당되었습니다", "담당자로 지정되었습니다."), ("새 댓글", "담당 태스크에 새 댓글이 달렸습니다."),
+                 ("담당 태스크가 수정되었습니다", "태스크 상태가 변경되었습니다."), ("태스크가 완료되었습니다", "태스크가 완료되었습니다.")]
+
+
+def make_id(kind: int, index: int) -> str:
+    """엔티티 종류와 순번으로 만든 결정적 UUID"""
+    return str(uuid.UUID(int=(kind << 96) | index))
+
+
+def zipf_cum_weights(n: int, s: float) -> List[float]:
+    """순위 i(0부터)의 가중치가 1/(i+1)^s 인 누적 가중치 (random.choices 의 cum_weights)"""
+    return list(itertools.accumulate(1 / (rank + 1) ** s for rank in range(n)))
+
+
+def weighted_index(rng: random.Random, cum_weights: Sequence[float]) -> int:
+    return bisect.bisect(cum_weights, rng.random() * cum_weights[-1])
+
+
+def db_time(ts: float) -> str:
+    """SQLAlchemy SQLite DateTime 저장 형식"""
+    return datetime.utcfromtimestamp(ts).isoformat(" ", "microseconds")
+
+
+def bench_password_hash(password: str, seed: int) -> str:
+    """모든 사용자가 공유하는 bcrypt 해시 (솔트도 시드에서 만들어 실행마다 같은 값)"""
+    handler = pwd_context.handler()
+    rng = random.Random(f"password-salt-{seed}")
+    # bcrypt 솔트의 마지막 문자는 패딩 비트가 0인 문자만 유효
+    salt = "".join(rng.choice(handler.salt_chars) for _ in range(handler.max_salt_size - 1)) + rng.choice(".Oeu")
+    return handler.using(salt=salt).hash(password)
+
+
+def batched(rows: Iterable[tuple], size: int = BATCH_SIZE) -> Iterator[List[tuple]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class DataGenerator:
+    """
+    결정적 대량 데이터 생성기
+
+    태스크별로 프로젝트/생성 시각/담당자만 배열에 보관하고(ID는 순번에서 계산)
+    나머지 행은 배치 단위로 만들어 바로 INSERT 하므로 메모리 사용량이 행 수에 비례하지 않는다.
+    """
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.end = float(END_TIMESTAMP)
+        self.start = self.end - args.days * 86400
+
+        # 프로젝트 크기, 사용자 활동량 분포
+        self.project_weights = zipf_cum_weights(args.projects, args.skew)
+        self.user_weights = zipf_cum_weights(args.users, args.skew)
+
+        # 프로젝트별 멤버 (사용자 순번), 첫 멤버가 매니저이며 앞쪽 멤버일수록 태스크를 많이 맡음
+        self.members: List[List[int]] = []
+        self.member_weights: List[List[float]] = []
+
+        # 태스크 순번 → 프로젝트 순번 / 생성 시각 / 담당자 순번(-1: 없음)
+        self.task_project = array("I")
+        self.task_created = array("d")
+        self.task_assignee = array("i")
+
+    def _time_between(self, start: float, end: float) -> float:
+        return start + self.rng.random() * max(end - start, 0)
+
+    def users(self, password_hash: str) -> Iterator[tuple]:
+        for i in range(self.args.users):
+            role = Role.ADMIN if i == 0 else Role.MANAGER if i % 10 == 1 else Role.MEMBER
+            created = db_time(self.start - 86400 + i)
+            yield (make_id(USER, i), f"user{i}@bench.taskflow.com", f"사용자 {i}", None,
+                   role.name, password_hash, created, created)
+
+    def projects(self) -> Iterator[tuple]:
+        for i in range(self.args.projects):
+            created = db_time(self.start + i)
+            yield (make_id(PROJECT, i), f"프로젝트 {i}", f"벤치마크 프로젝트 {i}", created, created)
+
+    def project_members(self) -> Iterator[tuple]:
+        rng, args = self.rng, self.args
+        member_index = 0
+        for p in range(args.projects):
+            # 큰 프로젝트일수록 멤버가 많음 (가장 큰 프로젝트가 max_members)
+            count = min(args.users, max(3, int(args.max_members / (p + 1) ** args.skew)))
+            # 활동량이 많은 사용자가 여러 프로젝트에 속하도록 가중 샘플링 (시도 횟수 제한)
+            chosen = set()
+            for _ in range(count * 10):
+                chosen.add(weighted_index(rng, self.user_weights))
+                if len(chosen) == count:
+                    break
+            members = sorted(chosen)
+            rng.shuffle(members)
+            self.members.append(members)
+            self.member_weights.append(zipf_cum_weights(len(members), args.skew))
+
+            joined = db_time(self.start + p)
+            for position, user in enumerate(members):
+                role = Role.MANAGER if position == 0 else Role.MEMBER
+                yield (make_id(MEMBER, member_index), make_id(USER, user), make_id(PROJECT, p), role.name, joined)
+                member_index += 1
+
+    def tasks(self) -> Iterator[tuple]:
+        rng, args = self.rng, self.args
+        statuses, status_weights = zip(*STATUS_WEIGHTS)
+        status_cum = list(itertools.accumulate(status_weights))
+        priorities, priority_weights = zip(*PRIORITY_WEIGHTS)
+        priority_cum = list(itertools.accumulate(priority_weights))
+
+        for i in range(args.tasks):
+            p = weighted_index(rng, self.project_weights)
+            members = self.members[p]
+            assignee = -1
+            if rng.random() >= args.unassigned:
+                assignee = members[weighted_index(rng, self.member_weights[p])]
+
+            created = self._time_between(self.start, self.end)
+            status = statuses[weighted_index(rng, status_cum)]
+            priority = priorities[weighted_index(rng, priority_cum)]
+            updated = self._time_between(created, min(created + 30 * 86400, self.end))
+            completed = db_time(updated) if status is TaskStatus.DONE else None
+            due = db_time(created + rng.randrange(1, 60) * 86400) if rng.random() < 0.7 else None
+
+            self.task_project.append(p)
+            self.task_created.append(created)
+            self.task_assignee.append(assignee)
+            yield (
+                make_id(TASK, i),
+                f"{rng.choice(TASK_SUBJECTS)} {rng.choice(TASK_VERBS)} #{i}",
+                f"벤치마크 태스크 {i} 설명",
+                status.name,
+                priority.name,
+                make_id(USER, assignee) if assignee >= 0 else None,
+                make_id(PROJECT, p),
+                due,
+                completed,
+                db_time(created),
+                db_time(updated),
+            )
+
+    def _hot_task(self) -> int:
+        """댓글/활동이 몰리는 태스크 순번 (앞쪽 순번일수록 자주 선택)"""
+        return int(self.args.tasks * self.rng.random() ** 2)
+
+    def _member(self, task: int) -> int:
+        members = self.members[self.task_project[task]]
+        return members[self.rng.randrange(len(members))]
+
+    def comments(self) -> Iterator[tuple]:
+        rng = self.rng
+        for i in range(int(self.args.tasks * self.args.comments)):
+            task = self._hot_task()
+            created = db_time(self._time_between(self.task_created[task], self.end))
+            yield (make_id(COMMENT, i), rng.choice(COMMENTS), make_id(USER, self._member(task)),
+                   make_id(TASK, task), created, created)
+
+    def activities(self) -> Iterator[tuple]:
+        rng, args = self.rng, self.args
+        total = int(args.tasks * args.activities)
+        for i in range(total):
+            if i < args.tasks:
+                # 모든 태스크의 생성 기록
+                task, action, created = i, "task_created", self.task_created[i]
+                description = f"태스크 #{task}을(를) 생성했습니다."
+            else:
+                task = self._hot_task()
+                action = "task_updated" if rng.random() < 0.7 else "comment_added"
+                created = self._time_between(self.task_created[task], self.end)
+                description = (f"태스크 #{task}을(를) 수정했습니다." if action == "task_updated"
+                               else f"태스크 #{task}에 댓글을 추가했습니다.")
+            yield (make_id(ACTIVITY, i), action, description, make_id(USER, self._member(task)),
+                   make_id(TASK, task), make_id(PROJECT, self.task_project[task]), db_time(created))
+
+    def notifications(self) -> Iterator[tuple]:
+        rng = self.rng
+        for i in range(int(self.args.tasks * self.args.notifications)):
+            task = self._hot_task()
+            user = self.task_assignee[task]
+            if user < 0:
+                user = self._member(task)
+            created = self._time_between(self.task_created[task], self.end)
+            title, message = rng.choice(NOTIFICATIONS)
+            # 오래된 알림일수록 읽음 처리된 비율이 높음
+            is_read = rng.random() < (self.end - created) / (self.end - self.start)
+            yield (make_id(NOTIFICATION, i), title, message, make_id(USER, user), int(is_read), db_time(created))
+
+
+def insert_rows(engine: Engine, table: str, columns: Sequence[str], rows: Iterable[tuple]) -> int:
+    """드라이버 executemany 로 배치 INSERT (배치마다 커밋)"""
+    placeholder = "?" if engine.dialect.paramstyle == "qmark" else "%s"
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})"
+    started = time.perf_counter()
+    count = 0
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            # 적재 중에는 저널/동기화를 끔 (실패 시 DB를 다시 생성)
+            conn.exec_driver_sql("PRAGMA journal_mode = OFF")
+            conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        for batch in batched(rows):
+            conn.exec_driver_sql(sql, batch)
+            conn.commit()
+            count += len(batch)
+    elapsed = time.perf_counter() - started
+    print(f"  📥 {table}: {count:,}행 ({elapsed:.1f}초, {count / elapsed if elapsed else 0:,.0f}행/초)")
+    return count
+
+
+def timed(label: str, step: Callable[[], None]):
+    started = time.perf_counter()
+    step()
+    print(f"  🔧 {label} ({time.perf_counter() - started:.1f}초)")
+
+
+def generate(args) -> int:
+    if args.database.startswith("sqlite:///"):
+        path = args.database[len("sqlite:///"):]
+        if os.path.exists(path):
+            if not args.force:
+                print(f"❌ {path} 이(가) 이미 있습니다. 덮어쓰려면 --force 를 지정하세요.")
+                return 1
+            os.remove(path)
+
+    engine = create_engine(args.database)
+    started = time.perf_counter()
+
+    # 테이블만 먼저 만들고 보조 인덱스는 적재 후 생성 (행마다 인덱스 갱신 비용 제거)
+    Base.metadata.create_all(bind=engine)
+    indexes = [index for table in Base.metadata.sorted_tables for index in table.indexes]
+    for index in indexes:
+        index.drop(bind=engine)
+
+    generator = DataGenerator(args)
+    password_hash = bench_password_hash(args.password, args.seed)
+    print(f"🌱 시드 {args.seed}: 사용자 {args.users:,}, 프로젝트 {args.projects:,}, 태스크 {args.tasks:,}")
+
+    total = 0
+    total += insert_rows(engine, "users", ["id", "email", "name", "avatar", "role", "password_hash",
+                                           "created_at", "updated_at"], generator.users(password_hash))
+    total += insert_rows(engine, "projects", ["id", "name", "description", "created_at", "updated_at"],
+                         generator.projects())
+    total += insert_rows(engine, "project_members", ["id", "user_id", "project_id", "role", "joined_at"],
+                         generator.project_members())
+    total += insert_rows(engine, "tasks", ["id", "title", "description", "status", "priority", "assignee_id",
+                                           "project_id", "due_date", "completed_at", "created_at", "updated_at"],
+                         generator.tasks())
+    total += insert_rows(engine, "comments", ["id", "content", "author_id", "task_id", "created_at", "updated_at"],
+                         generator.comments())
+    total += insert_rows(engine, "activities", ["id", "action", "description", "user_id", "task_id", "project_id",
+                                                "created_at"], generator.activities())
+    total += insert_rows(engine, "notifications", ["id", "title", "message", "user_id", "is_read", "created_at"],
+                         generator.notifications())
+
+    def create_indexes():
+        for index in indexes:
+            index.create(bind=engine)
+
+    timed("인덱스 생성", create_indexes)
+    # 카운터/변경 로그 시각도 실행 시각 대신 생성 데이터의 마지막 시각으로 고정
+    generated_at = datetime.utcfromtimestamp(END_TIMESTAMP)
+    timed("프로젝트 카운터 계산", lambda: rebuild_project_counters(engine, generated_at))
+    # 검색 인덱스는 새로 만들면서 전체 태스크/댓글로 채움
+    timed("검색 인덱스 생성", lambda: create_search_index(engine))
+    timed("변경 로그 생성", lambda: rebuild_change_log(engine, generated_at))
+    if engine.dialect.name == "sqlite":
+        def analyze():
+            with engine.connect() as conn:
+                conn.exec_driver_sql("ANALYZE")
+        timed("ANALYZE", analyze)
+    engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ {total:,}행 생성 완료 ({elapsed:.1f}초)")
+    print(f"   계정: user0@bench.taskflow.com ~ user{args.users - 1}@bench.taskflow.com / {args.password}")
+    print(f"   부하 테스트: python3 load_test.py --database {args.database} "
+          f"--account user1@bench.taskflow.com:{args.password}")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="TaskFlow 성능 테스트용 대량 데이터 생성")
+    parser.add_argument("--database", default="sqlite:///./bench.db", help="생성할 DB URL (기본 sqlite:///./bench.db)")
+    parser.add_argument("--force", action="store_true", help="기존 SQLite 파일을 지우고 다시 생성")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본 42)")
+    parser.add_argument("--users", type=int, default=1000, help="사용자 수 (기본 1000)")
+    parser.add_argument("--projects", type=int, default=500, help="프로젝트 수 (기본 500)")
+    parser.add_argument("--tasks", type=int, default=250_000, help="태스크 수 (기본 250000)")
+    parser.add_argument("--comments", type=float, default=2.0, help="태스크당 평균 댓글 수 (기본 2)")
+    parser.add_argument("--activities", type=float, default=3.0, help="태스크당 평균 활동 로그 수 (기본 3, 최소 1)")
+    parser.add_argument("--notifications", type=float, default=2.0, help="태스크당 평균 알림 수 (기본 2)")
+    parser.add_argument("--max-members", type=int, default=50, help="가장 큰 프로젝트의 멤버 수 (기본 50)")
+    parser.add_argument("--skew", type=float, default=1.1, help="프로젝트/담당자 쏠림 정도, Zipf 지수 (기본 1.1)")
+    parser.add_argument("--unassigned", type=float, default=0.2, help="담당자 없는 태스크 비율 (기본 0.2)")
+    parser.add_argument("--days", type=int, default=365, help="데이터가 퍼져 있는 기간(일) (기본 365)")
+    parser.add_argument("--password", default="bench123", help="모든 사용자의 비밀번호 (기본 bench123)")
+    args = parser.parse_args(argv)
+    args.activities = max(args.activities, 1.0)
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(generate(parse_args()))
\ No newline at end of file
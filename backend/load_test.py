@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+GraphQL API 부하 테스트 스크립트
+
+main.py의 FastAPI 앱을 네트워크 없이 ASGI로 직접 호출하면서 가중치가 있는
+작업 혼합(로그인, 프로젝트/태스크 조회, 태스크 수정, 댓글, 알림)을 동시에 실행하고
+작업별 p50/p95/p99 지연 시간, 초당 요청 수, 작업당 SQL 실행 수를 JSON으로 저장한다.
+
+사용법:
+    python3 load_test.py                               # 임시 DB + 시드 데이터로 실행
+    python3 load_test.py -n 2000 -c 20 -o before.json  # 요청 수/동시성/결과 파일 지정
+    python3 load_test.py --database sqlite:///./bench.db --mix tasks=50,update_task=10
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 기본 시드 계정 (seed_data.py)
+DEFAULT_ACCOUNTS = [
+    ("admin@taskflow.com", "admin123"),
+    ("manager@taskflow.com", "manager123"),
+    ("developer1@taskflow.com", "dev123"),
+    ("developer2@taskflow.com", "dev123"),
+]
+
+# 기본 작업 혼합 가중치
+DEFAULT_MIX = {
+    "login": 5,
+    "projects": 15,
+    "tasks": 20,
+    "tasks_filtered": 15,
+    "update_task": 15,
+    "add_comment": 10,
+    "notifications": 20,
+}
+
+# 실제 클라이언트(Apollo InMemoryCache)처럼 선택 집합마다 __typename 을 포함한다
+LOGIN = 'mutation($e:String!,$p:String!){login(input:{email:$e,password:$p}){token user{id}}}'
+PROJECTS = '{projects{__typename id name description}}'
+TASKS = ('query($p:String!,$f:TaskFilter){tasks(projectId:$p,filter:$f)'
+         '{__typename id title status priority dueDate assignee{__typename id name avatar}}}')
+UPDATE_TASK = ('mutation($t:String!,$i:UpdateTaskInput!){updateTask(id:$t,input:$i)'
+               '{__typename id title status priority updatedAt}}')
+ADD_COMMENT = ('mutation($t:String!,$c:String!){addComment(taskId:$t,content:$c)'
+               '{__typename id content createdAt author{__typename id name}}}')
+NOTIFICATIONS = ('{notifications{__typename id title message isRead createdAt user{__typename id name}}'
+                 ' unreadNotificationCount}')
+
+STATUSES = ["TODO", "IN_PROGRESS", "REVIEW", "DONE"]
+PRIORITIES = ["LOW", "MEDIUM", "HIGH", "URGENT"]
+
+# 현재 요청의 SQL 실행 수 (엔진 이벤트에서 증가)
+_sql_counter: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar("sql_counter", default=None)
+
+
+class VirtualUser:
+    """로그인한 계정과 접근 가능한 프로젝트/태스크 ID"""
+
+    def __init__(self, email: str, password: str, token: str):
+        self.email = email
+        self.password = password
+        self.token = token
+        self.project_ids: List[str] = []
+        self.task_ids: List[str] = []
+
+
+def build_operation(name: str, user: VirtualUser, rng: random.Random) -> Optional[Dict[str, Any]]:
+    """작업 이름 → GraphQL 요청 본문 (사용자에게 필요한 데이터가 없으면 None)"""
+    if name == "login":
+        return {"query": LOGIN, "variables": {"e": user.email, "p": user.password}}
+    if name == "projects":
+        return {"query": PROJECTS}
+    if name == "notifications":
+        return {"query": NOTIFICATIONS}
+    if name in ("tasks", "tasks_filtered"):
+        if not user.project_ids:
+            return None
+        task_filter = None
+        if name == "tasks_filtered":
+            task_filter = rng.choice([
+                {"status": rng.choice(STATUSES)},
+                {"priority": rng.choice(PRIORITIES)},
+                {"status": rng.choice(STATUSES), "priority": rng.choice(PRIORITIES)},
+            ])
+        return {"query": TASKS, "variables": {"p": rng.choice(user.project_ids), "f": task_filter}}
+    if not user.task_ids:
+        return None
+    if name == "update_task":
+        update = rng.choice([
+            {"status": rng.choice(STATUSES)},
+            {"priority": rng.choice(PRIORITIES)},
+            {"title": f"부하 테스트 {rng.randrange(10 ** 6)}"},
+        ])
+        return {"query": UPDATE_TASK, "variables": {"t": rng.choice(user.task_ids), "i": update}}
+    if name == "add_comment":
+        return {"query": ADD_COMMENT,
+                "variables": {"t": rng.choice(user.task_ids), "c": f"부하 테스트 댓글 {rng.randrange(10 ** 6)}"}}
+    raise ValueError(f"알 수 없는 작업: {name}")
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(p / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(samples: List[Dict[str, Any]], duration: Optional[float] = None) -> Dict[str, Any]:
+    """지연 시간(ms)/오류/SQL 수 집계"""
+    latencies = sorted(sample["ms"] for sample in samples)
+    sql_counts = [sample["sql"] for sample in samples]
+    summary = {
+        "requests": len(samples),
+        "errors": sum(1 for sample in samples if sample["error"]),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "sql_per_request": round(sum(sql_counts) / len(sql_counts), 2) if sql_counts else 0.0,
+        "sql_max": max(sql_counts) if sql_counts else 0,
+    }
+    if duration is not None:
+        summary["duration_seconds"] = round(duration, 3)
+        summary["requests_per_second"] = round(len(samples) / duration, 2) if duration else 0.0
+    return summary
+
+
+def parse_mix(value: Optional[str]) -> Dict[str, int]:
+    """"tasks=50,update_task=10" 형식의 가중치 (지정하지 않은 작업은 기본값 유지)"""
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, (value or "").split(",")):
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"❌ 알 수 없는 작업: {name} (가능: {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> Dict[str, Any]:
+    # DATABASE_URL 설정 후에 앱을 불러와야 엔진이 해당 DB를 사용함
+    import httpx
+    from sqlalchemy import event
+    import main
+    from app.database.database import async_engine, create_tables
+
+    def count_sql(conn, cursor, statement, parameters, context, executemany):
+        counter = _sql_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_sql)
+
+    if args.seed_data:
+        create_tables()
+        from seed_data import create_seed_data
+        create_seed_data()
+
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    names, weights = list(mix), list(mix.values())
+    samples: List[Dict[str, Any]] = []
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.lifespan(main.app), httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+
+        async def post(body: Dict[str, Any], token: Optional[str] = None) -> Dict[str, Any]:
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            response = await client.post("/graphql", json=body, headers=headers)
+            return response.json()
+
+        # 가상 사용자 준비 (로그인 후 접근 가능한 프로젝트/태스크 수집)
+        users: List[VirtualUser] = []
+        for email, password in args.accounts:
+            result = await post({"query": LOGIN, "variables": {"e": email, "p": password}})
+            if result.get("errors"):
+                print(f"⚠️  로그인 실패, 제외: {email}")
+                continue
+            user = VirtualUser(email, password, result["data"]["login"]["token"])
+            projects = (await post({"query": PROJECTS}, user.token))["data"]["projects"]
+            user.project_ids = [project["id"] for project in projects]
+            for project_id in user.project_ids:
+                tasks = await post({"query": TASKS, "variables": {"p": project_id}}, user.token)
+                user.task_ids.extend(task["id"] for task in tasks["data"]["tasks"])
+            users.append(user)
+        if not users:
+            raise SystemExit("❌ 로그인 가능한 계정이 없습니다.")
+        print(f"👥 가상 사용자 {len(users)}명, 작업 혼합: {mix}")
+
+        async def execute(name: str, user: VirtualUser, body: Dict[str, Any], record: bool):
+            counter = [0]
+            token = _sql_counter.set(counter)
+            started = time.perf_counter()
+            try:
+                result = await post(body, None if name == "login" else user.token)
+                error = bool(result.get("errors"))
+            except Exception as e:
+                print(f"❌ {name}: {e}")
+                error = True
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                _sql_counter.reset(token)
+            if record:
+                samples.append({"op": name, "ms": elapsed, "sql": counter[0], "error": error})
+
+        # 워밍업 (문서 캐시, 커넥션 풀, 토큰 캐시 채우기)
+        for _ in range(args.warmup):
+            user = rng.choice(users)
+            name = rng.choices(names, weights)[0]
+            body = build_operation(name, user, rng)
+            if body is not None:
+                await execute(name, user, body, record=False)
+
+        remaining = args.requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                user = rng.choice(users)
+                name = rng.choices(names, weights)[0]
+                body = build_operation(name, user, rng)
+                if body is None:
+                    remaining += 1
+                    continue
+                await execute(name, user, body, record=True)
+
+        print(f"🚀 요청 {args.requests}개, 동시성 {args.concurrency}")
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        duration = time.perf_counter() - started
+
+    event.remove(async_engine.sync_engine, "before_cursor_execute", count_sql)
+
+    operations: Dict[str, List[Dict[str, Any]]] = {}
+    for sample in samples:
+        operations.setdefault(sample["op"], []).append(sample)
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "mix": mix,
+            "database": os.environ["DATABASE_URL"],
+            "users": len(users),
+        },
+        "total": summarize(samples, duration),
+        "operations": {name: summarize(operations[name]) for name in sorted(operations)},
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    header = f"{'operation':<16}{'count':>7}{'errors':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'sql/op':>8}"
+    print("\n" + header)
+    print("-" * len(header))
+    rows = list(report["operations"].items()) + [("TOTAL", report["total"])]
+    for name, summary in rows:
+        print(f"{name:<16}{summary['requests']:>7}{summary['errors']:>8}"
+              f"{summary['p50_ms']:>9.1f}{summary['p95_ms']:>9.1f}{summary['p99_ms']:>9.1f}"
+              f"{summary['sql_per_request']:>8.1f}")
+    total = report["total"]
+    print(f"\n⏱️  {total['duration_seconds']}초, {total['requests_per_second']} req/s (지연 시간 단위: ms)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="TaskFlow GraphQL 부하 테스트 (in-process ASGI)")
+    parser.add_argument("-n", "--requests", type=int, default=500, help="측정할 요청 수 (기본 500)")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="동시 실행 수 (기본 10)")
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전 워밍업 요청 수 (기본 50)")
+    parser.add_argument("--seed", type=int, default=42, help="작업 선택 난수 시드 (기본 42)")
+    parser.add_argument("--mix", help="작업 가중치 재정의, 예: tasks=50,login=0")
+    parser.add_argument("--database", help="사용할 DB URL (지정하지 않으면 임시 SQLite DB에 시드 데이터 생성)")
+    parser.add_argument("--account", action="append", metavar="EMAIL:PASSWORD", dest="accounts",
+                        help="가상 사용자 계정 (여러 번 지정 가능, 기본은 시드 계정)")
+    parser.add_argument("-o", "--output", default="load_test_result.json", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+    args.accounts = [tuple(account.split(":", 1)) for account in args.accounts] if args.accounts else DEFAULT_ACCOUNTS
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        args.seed_data = args.database is None
+        os.environ["DATABASE_URL"] = args.database or f"sqlite:///{os.path.join(tmpdir, 'load_test.db')}"
+
+        report = asyncio.run(run(args))
+
+    print_report(report)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {args.output}")
+    return 1 if report["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
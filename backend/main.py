@@ -1,10 +1,19 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Depends
+from starlette.requests import HTTPConnection
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.schema import schema
-from app.database.database import create_tables, SessionLocal
+from app.extensions.persisted_queries import PersistedQueryRouter, cache_metrics
+from app.database.database import create_tables, get_async_db, get_pool_status, async_engine
+from app.auth.hashing import password_hasher
+from app.pubsub.pubsub import broker
+from app.cache.response_cache import response_cache
+from app.extensions.query_cost import cost_metrics
+from app.notifications.notifications import notification_fanout
+from app.metrics.metrics import metrics_registry
 
 
 @asynccontextmanager
@@ -12,7 +21,12 @@ async def lifespan(app: FastAPI):
     # 시작 시 데이터베이스 테이블 생성
     create_tables()
     yield
-    # 종료 시 정리 작업 (필요시)
+    # 종료 시 정리 작업 (남은 알림 저장 후 커넥션 풀, 해싱 워커, pub/sub 브로커, 응답 캐시 해제)
+    await notification_fanout.close()
+    await async_engine.dispose()
+    password_hasher.shutdown()
+    await broker.close()
+    await response_cache.close()
 
 
 # FastAPI 앱 생성
@@ -33,35 +47,18 @@ app.add_middleware(
 )
 
 # GraphQL 컨텍스트 생성 함수
-async def get_context(request: Request):
-    """GraphQL 컨텍스트 생성"""
-    db = SessionLocal()
+async def get_context(request: HTTPConnection, db: AsyncSession = Depends(get_async_db)):
+    """GraphQL 컨텍스트 생성 (세션은 요청이 끝나면 의존성에서 닫힘)"""
     
-    # 토큰에서 현재 사용자 추출
-    current_user = None
-    authorization = request.headers.get("authorization")
-    if authorization:
-        try:
-            from app.auth.auth import AuthService
-            from app.models.models import User
-            
-            # Bearer 토큰 추출
-            scheme, token = authorization.split()
-            if scheme.lower() == "bearer":
-                # 토큰 검증
-                auth_service = AuthService()
-                payload = auth_service.verify_token(token)
-                if payload:
-                    user_id = payload.get("sub")
-                    if user_id:
-                        current_user = db.query(User).filter(User.id == user_id).first()
-        except Exception as e:
-            print(f"토큰 검증 실패: {e}")
+    # 토큰에서 현재 사용자 추출 (캐시 적중 시 JWT 검증과 사용자 조회 생략)
+    from app.auth.token_cache import resolve_current_user
+    current_user = await resolve_current_user(db, request.headers.get("authorization"))
     
     # 서비스 인스턴스 생성
     from app.services.project_service import ProjectService
     from app.services.task_service import TaskService
     from app.services.auth_service import AuthServiceDB
+    from app.loaders.loaders import create_loaders
     
     return {
         "db": db,
@@ -70,10 +67,11 @@ async def get_context(request: Request):
         "project_service": ProjectService(db),
         "task_service": TaskService(db),
         "auth_service": AuthServiceDB(db),
+        "loaders": create_loaders(db),
     }
 
-# GraphQL 라우터 생성
-graphql_app = GraphQLRouter(schema, context_getter=get_context)
+# GraphQL 라우터 생성 (자동 persisted query 지원)
+graphql_app = PersistedQueryRouter(schema, context_getter=get_context)
 
 # GraphQL 엔드포인트 등록
 app.include_router(graphql_app, prefix="/graphql")
@@ -89,6 +87,73 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 지표 (작업별 요청 수/처리 시간/SQL 수/DB 시간, 느린 쿼리 수)"""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/admin/db-pool")
+async def db_pool_status():
+    """DB 커넥션 풀 상태 (체크아웃/오버플로/획득 대기 시간)"""
+    return get_pool_status()
+
+
+@app.get("/admin/pubsub")
+async def pubsub_metrics():
+    """구독 브로커 상태 (토픽/구독자 수, 느린 구독자 제거 횟수)"""
+    return broker.metrics()
+
+
+@app.get("/admin/graphql-cache")
+async def graphql_cache_metrics():
+    """persisted query 및 파싱/검증 문서 캐시 상태"""
+    return cache_metrics()
+
+
+@app.get("/admin/response-cache")
+async def response_cache_metrics():
+    """읽기 쿼리 응답 캐시 적중률 및 크기"""
+    return response_cache.metrics()
+
+
+@app.get("/admin/query-cost")
+async def query_cost_metrics():
+    """쿼리 비용 분석 거부/스로틀 건수 및 행 수 추정치"""
+    return cost_metrics()
+
+
+@app.get("/admin/notifications")
+async def notification_fanout_metrics():
+    """알림 팬아웃 큐 길이, 배치/저장 건수, 실패 건수 및 읽지 않은 알림 카운터 적중률"""
+    return notification_fanout.metrics()
+
+
+@app.get("/admin/sql")
+async def sql_metrics():
+    """작업별 평균 SQL 수/DB 시간 및 가장 느린 문장"""
+    return metrics_registry.operations_summary()
+
+
+@app.get("/admin/resolvers")
+async def resolver_metrics():
+    """필드별 resolve 횟수와 시간 분포 (총 시간이 큰 순, FIELD_TIMING_SAMPLE_RATE 로 샘플링한 작업만 집계)"""
+    return metrics_registry.fields_summary()
+
+
+@app.get("/admin/password-hasher")
+async def password_hasher_metrics():
+    """비밀번호 해싱 워커 풀 상태 및 큐 대기 시간"""
+    return password_hasher.metrics()
+
+
+@app.get("/admin/token-cache")
+async def token_cache_metrics():
+    """토큰 → 사용자 캐시 상태"""
+    from app.auth.token_cache import token_user_cache
+    return token_user_cache.metrics()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+서비스 쿼리 실행 계획 테스트
+
+check_query_plans 의 검증을 pytest 로 실행한다: 각 서비스 쿼리의 모든 테이블 접근이
+인덱스 검색(SEARCH)이어야 하며, 인덱스 전체를 훑는 SCAN … USING INDEX 도 실패로 본다.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from check_query_plans import ALLOWED_SCANS, collect_plan_scans, plan_scans
+
+
+@pytest.fixture(scope="module")
+def query_plans():
+    return asyncio.run(collect_plan_scans())
+
+
+def test_service_queries_only_search(query_plans):
+    failures = [
+        f"{name}: {', '.join(scans)}\n   {' '.join(statement.split())}"
+        for name, statement, scans in query_plans
+        if scans
+    ]
+    assert not failures, "테이블/인덱스 전체 스캔:\n" + "\n".join(failures)
+
+
+def test_allowed_scans_are_service_queries(query_plans):
+    names = {name for name, _, _ in query_plans}
+    assert set(ALLOWED_SCANS) <= names
+
+
+@pytest.mark.parametrize("detail", [
+    "SCAN tasks",
+    "SCAN t",
+    "SCAN tasks USING INDEX ix_tasks_project_created",
+    "SCAN comments USING COVERING INDEX ix_comments_task_created",
+    "SCAN tasks_fts VIRTUAL TABLE INDEX 0:",
+])
+def test_scan_steps_fail(detail):
+    assert plan_scans([detail]) == [detail]
+
+
+@pytest.mark.parametrize("details", [
+    ["SEARCH tasks USING INDEX ix_tasks_project_created (project_id=?)"],
+    ["SEARCH changes USING COVERING INDEX uq_changes_entity (entity_type=? AND entity_id=?)"],
+    ["SCAN tasks_fts VIRTUAL TABLE INDEX 0:M5"],
+    ["CO-ROUTINE ranked", "SCAN tasks_fts VIRTUAL TABLE INDEX 0:M5", "SCAN ranked"],
+    ["MATERIALIZE (subquery-3)", "SEARCH tasks USING INDEX ix_tasks_project_created (project_id=?)",
+     "SCAN (subquery-3)"],
+])
+def test_search_steps_pass(details):
+    assert plan_scans(details) == []